@@ -1,16 +1,293 @@
+import logging
 import os
-from sqlalchemy import create_engine
+import threading
+import time
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 from dotenv import load_dotenv
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 load_dotenv(os.path.join(BASE_DIR, "config.env"))
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
+logger = logging.getLogger(__name__)
+
+# Bağlantı havuzu ayarları (config.env üzerinden)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+class PoolStats:
+    """Bağlantı havuzu istatistikleri (checkout bekleme süresi histogramı, overflow olayları)"""
+
+    # Bekleme süresi histogram sınırları (milisaniye)
+    WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.overflow_events = 0
+            self.peak_checked_out = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.wait_buckets = [0] * (len(self.WAIT_BUCKETS_MS) + 1)
+
+    def record_checkout(self, wait_seconds: float, overflowed: bool, checked_out: int):
+        wait_ms = wait_seconds * 1000
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            if overflowed:
+                self.overflow_events += 1
+            for i, bound in enumerate(self.WAIT_BUCKETS_MS):
+                if wait_ms <= bound:
+                    self.wait_buckets[i] += 1
+                    break
+            else:
+                self.wait_buckets[-1] += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            buckets = {f"le_{bound}ms": count for bound, count in zip(self.WAIT_BUCKETS_MS, self.wait_buckets)}
+            buckets["gt_5000ms"] = self.wait_buckets[-1]
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "overflow_events": self.overflow_events,
+                "peak_checked_out": self.peak_checked_out,
+                "wait_avg_ms": round(self.wait_total_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "wait_histogram": buckets,
+            }
+
+class _InstrumentedPoolMixin:
+    """Checkout bekleme süresini ve overflow bağlantılarını ölçen havuz eklentisi"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        overflow_before = self._overflow
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.record_timeout()
+            raise
+        self.stats.record_checkout(
+            time.perf_counter() - start,
+            # _overflow -pool_size'dan başlar; sıfırın üstü havuz dışı bağlantıdır
+            overflowed=self._overflow > max(overflow_before, 0),
+            checked_out=self.checkedout(),
+        )
+        return conn
+
+    def recreate(self):
+        # engine.dispose() sonrası istatistikler kaybolmasın
+        new_pool = super().recreate()
+        new_pool.stats = self.stats
+        return new_pool
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+def pool_options(poolclass=InstrumentedQueuePool) -> dict:
+    """create_engine için havuz ayarları"""
+    return {
+        "poolclass": poolclass,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+# SQLite performans profili (yerel yük testleri ve benchmark'lar için; PostgreSQL'de etkisizdir)
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "mmap_size": os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)),
+    "cache_size": os.getenv("SQLITE_CACHE_SIZE", "-65536"),  # negatif değer KiB cinsinden (64 MB)
+    "busy_timeout": os.getenv("SQLITE_BUSY_TIMEOUT", "5000"),
+    "temp_store": "MEMORY",
+    "foreign_keys": "ON",
+}
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+def apply_dialect_profile(eng):
+    """Engine'e veritabanına özel bağlantı ayarlarını uygula"""
+    if eng.dialect.name == "sqlite":
+        event.listen(eng, "connect", _set_sqlite_pragmas)
+    return eng
+
+IS_SQLITE = make_url(DATABASE_URL).get_backend_name() == "sqlite"
+
+engine = apply_dialect_profile(create_engine(DATABASE_URL, **pool_options()))
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine
 )
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+# Async sürücüye çevrilmiş URL (postgresql -> asyncpg, sqlite -> aiosqlite)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    """Sync veritabanı URL'ini async sürücü URL'ine çevir"""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if not driver:
+        raise ValueError(f"Async sürücü desteklenmiyor: {parsed.get_backend_name()}")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **pool_options(InstrumentedAsyncQueuePool))
+apply_dialect_profile(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# İzlenen engine'ler (isim -> engine)
+ENGINES = {"primary": engine, "primary_async": async_engine.sync_engine}
+
+# Okuma replikaları (virgülle ayrılmış URL listesi, boşsa tüm okumalar primary'ye gider)
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+# Hata veren replika bu süre boyunca rotasyondan çıkarılır
+DB_REPLICA_RETRY_SECONDS = float(os.getenv("DB_REPLICA_RETRY_SECONDS", "30"))
+
+class Replica:
+    """Tek bir okuma replikası (sync + async engine ve sağlık durumu)"""
+
+    def __init__(self, name: str, url: str):
+        self.name = name
+        self.engine = apply_dialect_profile(create_engine(url, **pool_options()))
+        self.async_engine = create_async_engine(to_async_url(url), **pool_options(InstrumentedAsyncQueuePool))
+        apply_dialect_profile(self.async_engine.sync_engine)
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.AsyncSessionLocal = async_sessionmaker(bind=self.async_engine, autoflush=False, expire_on_commit=False)
+        self.down_until = 0.0
+        self.failures = 0
+        self.last_error = None
+        # Sorgu sırasında bağlantı koparsa replikayı rotasyondan çıkar
+        for eng in (self.engine, self.async_engine.sync_engine):
+            event.listen(eng, "handle_error", self._on_error)
+
+    def _on_error(self, context):
+        if context.is_disconnect:
+            self.mark_down(context.original_exception)
+
+    def mark_down(self, error):
+        self.failures += 1
+        self.last_error = str(error)
+        self.down_until = time.monotonic() + DB_REPLICA_RETRY_SECONDS
+        logger.warning("⚠️ Replika devre dışı bırakıldı: %s (%s)", self.name, error)
+
+    def is_available(self) -> bool:
+        return time.monotonic() >= self.down_until
+
+    def status(self) -> dict:
+        return {
+            "name": self.name,
+            "available": self.is_available(),
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "retry_in_seconds": max(round(self.down_until - time.monotonic(), 1), 0),
+        }
+
+class ReplicaRouter:
+    """Okuma oturumlarını sağlıklı replikalar arasında round-robin dağıtır"""
+
+    def __init__(self, urls: list):
+        self.replicas = [Replica(f"replica_{i + 1}", url) for i, url in enumerate(urls)]
+        self._lock = threading.Lock()
+        self._cursor = 0
+
+    def _candidates(self) -> list:
+        if not self.replicas:
+            return []
+        with self._lock:
+            start = self._cursor
+            self._cursor = (self._cursor + 1) % len(self.replicas)
+        ordered = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in ordered if replica.is_available()]
+
+    def session(self):
+        """Sağlıklı bir replikaya bağlı oturum aç (hiçbiri yoksa None -> primary)"""
+        # Bağlantı hemen alınır; pool_pre_ping ile birlikte bu aynı zamanda sağlık kontrolüdür
+        for replica in self._candidates():
+            db = replica.SessionLocal()
+            try:
+                db.connection()
+                return db
+            except Exception as e:
+                db.close()
+                replica.mark_down(e)
+        return None
+
+    async def async_session(self):
+        for replica in self._candidates():
+            db = replica.AsyncSessionLocal()
+            try:
+                await db.connection()
+                return db
+            except Exception as e:
+                await db.close()
+                replica.mark_down(e)
+        return None
+
+    def status(self) -> list:
+        return [replica.status() for replica in self.replicas]
+
+replica_router = ReplicaRouter(DATABASE_REPLICA_URLS)
+for _replica in replica_router.replicas:
+    ENGINES[_replica.name] = _replica.engine
+    ENGINES[f"{_replica.name}_async"] = _replica.async_engine.sync_engine
+
+def get_pool_stats() -> dict:
+    """Tüm engine havuzlarının anlık durumunu döndür"""
+    result = {}
+    for name, eng in ENGINES.items():
+        pool = eng.pool
+        stats = pool.stats.snapshot() if hasattr(pool, "stats") else {}
+        result[name] = {
+            "pool_size": pool.size(),
+            "max_overflow": DB_MAX_OVERFLOW,
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            **stats,
+        }
+    return result
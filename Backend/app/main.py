@@ -1,8 +1,15 @@
-from fastapi import FastAPI, File, UploadFile, Depends, HTTPException, Form, Body
+import time
+# Soğuk başlangıç ölçümü: modül import'unun başladığı an
+IMPORT_STARTED_AT = time.perf_counter()
+
+from fastapi import FastAPI, File, UploadFile, Depends, HTTPException, Form, Body, Request, Query, BackgroundTasks, Header
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import text
-from app.db import SessionLocal, engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text, select, inspect, tuple_, func, case, insert, update, delete, or_, and_
+from sqlalchemy.exc import SQLAlchemyError
+from app.db import SessionLocal, AsyncSessionLocal, get_pool_stats, replica_router, ENGINES, engine
 import app.models as models
 import app.schemas as schemas
 import os
@@ -10,25 +17,116 @@ import shutil
 import uuid
 import random
 import string
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timedelta, date
+from contextlib import asynccontextmanager, nullcontext
 import base64
+import json
+import csv
+import io
+from types import SimpleNamespace
+from collections import Counter
+from pydantic import ValidationError
 import hashlib
 import hmac
+import anyio
 from app.services.twilio_sms_service import twilio_sms_service
 from app.services.sms_language_manager import sms_language_manager
 from app.services.email_service import email_service
+from app.services.query_counter import query_counter
+from app.services.slow_query_log import slow_query_log
+from app.services.metrics import metrics
+from app.services.product_search import product_search
+from app.services.fuzzy_search import fuzzy_search, FUZZY_THRESHOLD
+from app.services.autocomplete import autocomplete, AUTOCOMPLETE_MAX_LIMIT
+from app.services.result_cache import ResultCache
+from app.services.ratings import rating_aggregates, rating_average, rating_summary
+from app.services.seller_stats import seller_stats_table
+from app.migrations import check_schema_version
 from dotenv import load_dotenv
 
 # Environment variables'ları yükle
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 load_dotenv(os.path.join(BASE_DIR, "config.env"))
 
-models.Base.metadata.create_all(bind=engine)
-app = FastAPI()
+# Başlangıç süresi ölçümleri (autoscale edilen worker'ların cold-start takibi için)
+STARTUP_METRICS = {}
+# Arama index'i başlangıçta yüklenemezse arka planda tekrar deneme aralığı
+SEARCH_INDEX_RETRY_SECONDS = float(os.getenv("SEARCH_INDEX_RETRY_SECONDS", "30"))
+
+def build_search_index(metric: str, build):
+    """Bellek içi arama index'ini yükle; hata olursa boş index ile açılır ve arka planda tekrar denenir"""
+    try:
+        STARTUP_METRICS[metric] = build(engine)
+    except Exception as e:
+        print(f"⚠️ {metric} yüklenemedi, boş index ile devam ediliyor: {e}")
+        STARTUP_METRICS[metric] = None
+        threading.Thread(target=retry_search_index, args=(metric, build), daemon=True).start()
+
+def retry_search_index(metric: str, build):
+    while True:
+        time.sleep(SEARCH_INDEX_RETRY_SECONDS)
+        try:
+            STARTUP_METRICS[metric] = build(engine)
+            print(f"✅ {metric} arka planda yüklendi")
+            return
+        except Exception as e:
+            print(f"⚠️ {metric} yüklenemedi, tekrar denenecek: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup_started_at = time.perf_counter()
+    # Şema oluşturma artık scripts/migrate.py ile yapılır; burada sadece tek sorguluk sürüm kontrolü var
+    STARTUP_METRICS["schema"] = await anyio.to_thread.run_sync(check_schema_version)
+    # SQLite'ta bulanık arama için bellek içi trigram index'i (PostgreSQL'de pg_trgm kullanılır)
+    await anyio.to_thread.run_sync(build_search_index, "fuzzy_index", fuzzy_search.build)
+    await anyio.to_thread.run_sync(build_search_index, "autocomplete_suggestions", autocomplete.build)
+    ready_at = time.perf_counter()
+    STARTUP_METRICS["import_ms"] = round((startup_started_at - IMPORT_STARTED_AT) * 1000, 2)
+    STARTUP_METRICS["startup_ms"] = round((ready_at - startup_started_at) * 1000, 2)
+    STARTUP_METRICS["total_ms"] = round((ready_at - IMPORT_STARTED_AT) * 1000, 2)
+    print(f"🚀 Uygulama hazır: {STARTUP_METRICS['total_ms']} ms (import {STARTUP_METRICS['import_ms']} ms, başlangıç {STARTUP_METRICS['startup_ms']} ms)")
+    yield
+
+app = FastAPI(lifespan=lifespan)
 
 # Statik dosya servisi ekle
 app.mount("/uploads", StaticFiles(directory=os.path.join(BASE_DIR, "uploads")), name="uploads")
 
+# İstek başına SQL sorgu sayısı ve veritabanı süresi (N+1 tespiti)
+query_counter.install(ENGINES.values())
+slow_query_log.install(ENGINES.values())
+
+@app.middleware("http")
+async def count_queries(request: Request, call_next):
+    stats, token = query_counter.start(request.scope)
+    try:
+        response = await call_next(request)
+    finally:
+        query_counter.stop(token)
+    query_counter.check_budget(stats)
+    response.headers["X-DB-Queries"] = str(stats.count)
+    response.headers["X-DB-Time"] = f"{stats.db_time * 1000:.2f}ms"
+    return response
+
+@app.middleware("http")
+async def collect_metrics(request: Request, call_next):
+    method = request.method
+    metrics.http_in_progress.inc(method=method)
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        metrics.http_in_progress.dec(method=method)
+        # Ham path yerine route şablonu: /products/{product_id} tek seri olarak tutulur
+        route = request.scope.get("route")
+        route_path = route.path if route is not None else "unmatched"
+        metrics.http_duration.observe(time.perf_counter() - started, method=method, route=route_path)
+        metrics.http_requests.inc(method=method, route=route_path, status=status)
+
 def get_db():
     db = SessionLocal()
     try:
@@ -36,6 +134,27 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    # Okuma ağırlıklı endpoint'ler için threadpool'u meşgul etmeyen async oturum
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# Replikadan okunabilen GET endpoint'leri (katalog, yorumlar, takipçiler, satıcı sayfası) için.
+# Yazma ve yazma sonrası okuma akışları (login, doğrulama, checkout) get_db ile primary'de kalır.
+def get_read_db():
+    db = replica_router.session() or SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db():
+    db = await replica_router.async_session() or AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
+
 # --- PASSWORD HASHING HELPERS ---
 PBKDF2_ITERATIONS = 100_000
 SALT_BYTES = 16
@@ -183,11 +302,11 @@ def tokenize_card(req: schemas.TokenizeCardRequest, db: Session = Depends(get_db
             }
         }
         
-        card_instance = iyzipay.Card()
-        res = card_instance.create(request, options)
-        
         import json
-        data = json.loads(res.read().decode('utf-8')) if hasattr(res, 'read') else res
+        with metrics.time_outbound("iyzipay", "card.create"):
+            card_instance = iyzipay.Card()
+            res = card_instance.create(request, options)
+            data = json.loads(res.read().decode('utf-8')) if hasattr(res, 'read') else res
         
         if data.get('status') != 'success':
             raise HTTPException(status_code=400, detail=data.get('errorMessage', 'Kart doğrulanamadı'))
@@ -286,8 +405,9 @@ def charge_payment(req: schemas.ChargeRequest, db: Session = Depends(get_db)):
             ]
         }
 
-        payment = iyzipay.Payment.create(request, options)
-        data = json.loads(payment.read().decode('utf-8')) if hasattr(payment, 'read') else payment
+        with metrics.time_outbound("iyzipay", "payment.create"):
+            payment = iyzipay.Payment.create(request, options)
+            data = json.loads(payment.read().decode('utf-8')) if hasattr(payment, 'read') else payment
         if data.get('status') == 'success':
             return schemas.ChargeResponse(status='success', payment_id=data.get('paymentId'))
         return schemas.ChargeResponse(status='failure', error_message=data.get('errorMessage'))
@@ -381,12 +501,27 @@ def validate_phone_number(phone_number: str):
     return False
 
 # --- PRODUCT CRUD ---
+def refresh_product_indexes(products=(), deleted_ids=()):
+    """Commit sonrası bellek içi arama yapılarını (bulanık arama, otomatik tamamlama) güncelle"""
+    for product in products:
+        fuzzy_search.upsert("products", product.id, product.product_name)
+        autocomplete.upsert_product(product.id, product.product_name, product.product_category)
+    for product_id in deleted_ids:
+        fuzzy_search.remove("products", product_id)
+        autocomplete.remove_product(product_id)
+    facets_cache.invalidate()
+
 @app.post("/products", response_model=schemas.ProductBase)
 def create_product(product: schemas.ProductCreate, db: Session = Depends(get_db)):
     db_product = models.Product(**product.dict())
     db.add(db_product)
+    db.flush()
+    # Arama index'i ve satıcı istatistikleri ürünle aynı transaction'da güncellenir
+    product_search.index_products(db, [db_product])
+    seller_stats_table.products_added(db, db_product.seller_id)
     db.commit()
     db.refresh(db_product)
+    refresh_product_indexes(products=[db_product])
     return schemas.ProductBase(
         id=db_product.id,
         product_name=db_product.product_name,
@@ -397,9 +532,86 @@ def create_product(product: schemas.ProductCreate, db: Session = Depends(get_db)
         seller_id=db_product.seller_id
     )
 
+# --- KEYSET PAGINATION HELPERS ---
+def encode_cursor(sort: str, values: list) -> str:
+    """Son satırın sıralama değerlerinden opak cursor üret"""
+    payload = json.dumps({"sort": sort, "after": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("utf-8").rstrip("=")
+
+def decode_cursor(cursor: str, sort: str, size: int) -> list:
+    """Cursor'ı çöz; farklı sıralamaya ait veya bozuk cursor 400 döner"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("utf-8")))
+        values = payload["after"]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Geçersiz cursor")
+    if payload.get("sort") != sort or not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Cursor bu sıralamaya ait değil")
+    return values
+
+# Ürün listesi sıralamaları: (sıralama kolonu, azalan mı); id her zaman son anahtardır
+PRODUCT_SORTS = {
+    "id": (None, False),
+    "newest": (None, True),
+    "price_asc": (models.Product.product_price, False),
+    "price_desc": (models.Product.product_price, True),
+}
+PRODUCTS_PAGE_SIZE = int(os.getenv("PRODUCTS_PAGE_SIZE", "50"))
+PRODUCTS_PAGE_MAX = int(os.getenv("PRODUCTS_PAGE_MAX", "200"))
+
+def filter_products(query, product_category: str = None, seller_id: int = None, min_price: float = None, max_price: float = None):
+    """Ürün listesi ve facet sorgularında ortak filtreler"""
+    if product_category:
+        query = query.where(models.Product.product_category == product_category)
+    if seller_id is not None:
+        query = query.where(models.Product.seller_id == seller_id)
+    if min_price is not None:
+        query = query.where(models.Product.product_price >= min_price)
+    if max_price is not None:
+        query = query.where(models.Product.product_price <= max_price)
+    return query
+
 @app.get("/products", response_model=list[schemas.ProductBase])
-def get_products(db: Session = Depends(get_db)):
-    products = db.query(models.Product).all()
+async def get_products(
+    response: Response,
+    limit: int = Query(PRODUCTS_PAGE_SIZE, ge=1, le=PRODUCTS_PAGE_MAX),
+    cursor: str = None,
+    product_category: str = None,
+    seller_id: int = None,
+    min_price: float = None,
+    max_price: float = None,
+    sort: str = "id",
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Ürünleri filtreleyerek keyset sayfalama ile getir (sonraki sayfa X-Next-Cursor header'ında)"""
+    if sort not in PRODUCT_SORTS:
+        raise HTTPException(status_code=400, detail=f"Geçersiz sıralama. Seçenekler: {', '.join(PRODUCT_SORTS)}")
+    sort_column, descending = PRODUCT_SORTS[sort]
+    keys = [models.Product.id] if sort_column is None else [sort_column, models.Product.id]
+
+    query = filter_products(select(models.Product), product_category, seller_id, min_price, max_price)
+    if sort_column is not None:
+        # Fiyatı olmayan ürünler keyset karşılaştırmasına giremez
+        query = query.where(sort_column.isnot(None))
+
+    if cursor:
+        after = decode_cursor(cursor, sort, len(keys))
+        # (fiyat, id) > (son_fiyat, son_id): composite index üzerinde aralık taraması
+        position = tuple_(*keys) if len(keys) > 1 else keys[0]
+        bound = tuple_(*after) if len(keys) > 1 else after[0]
+        query = query.where(position < bound if descending else position > bound)
+
+    query = query.order_by(*[key.desc() if descending else key.asc() for key in keys]).limit(limit + 1)
+    result = await db.execute(query)
+    products = result.scalars().all()
+
+    # Fazladan alınan satır varsa bir sonraki sayfa vardır
+    if len(products) > limit:
+        products = products[:limit]
+        last = products[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(sort, [getattr(last, key.key) for key in keys])
+
     return [
         schemas.ProductBase(
             id=product.id,
@@ -408,32 +620,554 @@ def get_products(db: Session = Depends(get_db)):
             product_description=product.product_description,
             product_category=product.product_category,
             product_image_url=product.product_image_url,
-            seller_id=product.seller_id
+            seller_id=product.seller_id,
+            rating_average=rating_average(product.rating_sum, product.rating_count),
+            rating_count=product.rating_count or 0
         )
         for product in products
     ]
 
+SEARCH_PAGE_SIZE = int(os.getenv("SEARCH_PAGE_SIZE", "20"))
+
+@app.get("/products/search", response_model=list[schemas.ProductBase])
+async def search_products(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=PRODUCTS_PAGE_MAX),
+    cursor: str = None,
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Ürün adı, kategori ve açıklamada alaka sıralı tam metin arama (Türkçe ek ve aksan duyarsız)"""
+    offset = decode_cursor(cursor, "search", 1)[0] if cursor else 0
+    statement = product_search.search_statement(db.bind.dialect.name, q, limit + 1, offset)
+    if statement is None:
+        return []
+    product_ids = (await db.execute(statement)).scalars().all()
+    if len(product_ids) > limit:
+        product_ids = product_ids[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor("search", [offset + limit])
+    if not product_ids:
+        return []
+
+    # Ürünleri tek sorguda al, alaka sırasını koru
+    result = await db.execute(select(models.Product).where(models.Product.id.in_(product_ids)))
+    products_by_id = {product.id: product for product in result.scalars().all()}
+    return [
+        schemas.ProductBase(
+            id=product.id,
+            product_name=product.product_name,
+            product_price=product.product_price,
+            product_description=product.product_description,
+            product_category=product.product_category,
+            product_image_url=product.product_image_url,
+            seller_id=product.seller_id,
+            rating_average=rating_average(product.rating_sum, product.rating_count),
+            rating_count=product.rating_count or 0
+        )
+        for product in (products_by_id.get(product_id) for product_id in product_ids)
+        if product is not None
+    ]
+
+# Fiyat aralığı sınırları (TL); son kova "2500+" şeklinde açık uçludur
+PRICE_FACET_BUCKETS = [float(value) for value in os.getenv("PRICE_FACET_BUCKETS", "0,100,250,500,1000,2500").split(",")]
+FACET_SELLER_LIMIT = int(os.getenv("FACET_SELLER_LIMIT", "20"))
+facets_cache = ResultCache(ttl_seconds=float(os.getenv("FACETS_CACHE_TTL", "60")))
+
+def price_bucket_labels() -> list:
+    labels = []
+    for i, lower in enumerate(PRICE_FACET_BUCKETS):
+        upper = PRICE_FACET_BUCKETS[i + 1] if i + 1 < len(PRICE_FACET_BUCKETS) else None
+        labels.append(f"{lower:g}-{upper:g}" if upper is not None else f"{lower:g}+")
+    return labels
+
+@app.get("/products/facets")
+async def get_product_facets(
+    product_category: str = None,
+    seller_id: int = None,
+    min_price: float = None,
+    max_price: float = None,
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Filtreye uyan ürünler için kategori, fiyat aralığı ve satıcı sayıları"""
+    cache_key = (product_category, seller_id, min_price, max_price)
+    cached = facets_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = facets_cache.generation()
+
+    # Fiyat kovası: sınırlardan küçük olanların sayısı (0 = ilk kova); fiyatsız ürünler NULL kovada
+    labels = price_bucket_labels()
+    bucket = case(
+        (models.Product.product_price.is_(None), None),
+        *[(models.Product.product_price < bound, i - 1) for i, bound in enumerate(PRICE_FACET_BUCKETS) if i > 0],
+        else_=len(PRICE_FACET_BUCKETS) - 1
+    ).label("bucket")
+    # Üç facet tek GROUP BY ile hesaplanır, Python'da ayrıştırılır
+    query = filter_products(
+        select(models.Product.product_category, models.Product.seller_id, bucket, func.count().label("count")),
+        product_category, seller_id, min_price, max_price
+    ).group_by(models.Product.product_category, models.Product.seller_id, bucket)
+    rows = (await db.execute(query)).all()
+
+    categories, sellers, prices = {}, {}, [0] * len(labels)
+    total = 0
+    for category, row_seller_id, row_bucket, count in rows:
+        total += count
+        categories[category] = categories.get(category, 0) + count
+        sellers[row_seller_id] = sellers.get(row_seller_id, 0) + count
+        if row_bucket is not None:
+            prices[max(int(row_bucket), 0)] += count
+
+    top_sellers = sorted(
+        ((sid, count) for sid, count in sellers.items() if sid is not None),
+        key=lambda item: (-item[1], item[0])
+    )[:FACET_SELLER_LIMIT]
+    store_names = {}
+    if top_sellers:
+        result = await db.execute(
+            select(models.Seller.id, models.Seller.store_name).where(models.Seller.id.in_([sid for sid, _ in top_sellers]))
+        )
+        store_names = dict(result.all())
+
+    facets = {
+        "total": total,
+        "categories": [
+            {"product_category": category, "count": count}
+            for category, count in sorted(categories.items(), key=lambda item: (-item[1], item[0] or ""))
+        ],
+        "price_buckets": [{"range": label, "count": count} for label, count in zip(labels, prices)],
+        "sellers": [
+            {"seller_id": sid, "store_name": store_names.get(sid), "count": count}
+            for sid, count in top_sellers
+        ],
+    }
+    facets_cache.set(cache_key, facets, generation)
+    return facets
+
+@app.get("/products/autocomplete")
+def autocomplete_products(
+    prefix: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=AUTOCOMPLETE_MAX_LIMIT)
+):
+    """Ürün adı ve kategori önerileri (popülerliğe göre, bellek içi index'ten)"""
+    return autocomplete.suggest(prefix, limit)
+
+@app.get("/search/fuzzy")
+async def fuzzy_search_catalog(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    threshold: float = Query(FUZZY_THRESHOLD, ge=0.05, le=1.0),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Ürün ve mağaza adlarında yazım hatasına toleranslı (trigram) arama"""
+    results = {}
+    if fuzzy_search.in_memory:
+        for name in ("products", "sellers"):
+            results[name] = fuzzy_search.search_memory(name, q, threshold, limit)
+    else:
+        # % operatörü eşiği bu ayardan okur; true = sadece bu transaction için
+        await db.execute(
+            text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+            {"threshold": str(threshold)}
+        )
+        for name in ("products", "sellers"):
+            rows = await db.execute(fuzzy_search.search_statement(name, q, threshold, limit))
+            results[name] = [(row.id, row.name, round(float(row.similarity), 4)) for row in rows]
+
+    return {
+        "products": [
+            {"id": item_id, "product_name": value, "similarity": similarity}
+            for item_id, value, similarity in results["products"]
+        ],
+        "sellers": [
+            {"id": item_id, "store_name": value, "similarity": similarity}
+            for item_id, value, similarity in results["sellers"]
+        ],
+    }
+
+# --- CATALOG EXPORT ---
+PRODUCT_EXPORT_BATCH_SIZE = int(os.getenv("PRODUCT_EXPORT_BATCH_SIZE", "1000"))
+PRODUCT_EXPORT_COLUMNS = [
+    models.Product.id,
+    models.Product.product_name,
+    models.Product.product_price,
+    models.Product.product_description,
+    models.Product.product_category,
+    models.Product.product_image_url,
+    models.Product.seller_id,
+]
+
+def stream_product_export(file_format: str, product_category: str, seller_id: int):
+    """Ürünleri sunucu taraflı cursor ile parça parça oku ve satır satır yaz"""
+    # İstek oturumu yanıt akarken kapanabilir; akış kendi oturumunu açar
+    db = replica_router.session() or SessionLocal()
+    try:
+        query = filter_products(select(*PRODUCT_EXPORT_COLUMNS), product_category, seller_id, None, None)
+        # yield_per: PostgreSQL'de stream_results (server-side cursor), bellekte en fazla bir parça tutulur
+        result = db.execute(
+            query.order_by(models.Product.id).execution_options(yield_per=PRODUCT_EXPORT_BATCH_SIZE)
+        )
+        fields = [column.key for column in PRODUCT_EXPORT_COLUMNS]
+        if file_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(fields)
+            for rows in result.partitions():
+                writer.writerows(rows)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            yield buffer.getvalue()
+        else:
+            for rows in result.partitions():
+                yield "".join(json.dumps(dict(zip(fields, row)), ensure_ascii=False) + "\n" for row in rows)
+    finally:
+        db.close()
+
+@app.get("/products/export")
+def export_products(
+    file_format: str = Query("ndjson", alias="format", pattern="^(csv|ndjson)$"),
+    product_category: str = None,
+    seller_id: int = None
+):
+    """Tüm kataloğu NDJSON veya CSV olarak akıt (bellek kullanımı katalog boyutundan bağımsız)"""
+    media_type = "text/csv; charset=utf-8" if file_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        # Gövdedeki sorgular bütçe kontrolüne dahil edilir (X-DB-Queries header'ı gövdeden önce gider)
+        query_counter.count_stream(stream_product_export(file_format, product_category, seller_id)),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="products.{file_format}"'},
+    )
+
+# --- BATCH PRODUCT LOOKUP ---
+PRODUCT_BATCH_MAX_IDS = int(os.getenv("PRODUCT_BATCH_MAX_IDS", "500"))
+
+def parse_id_list(ids: str) -> list:
+    try:
+        return [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids virgülle ayrılmış tam sayılar olmalı (örn. 1,2,3)")
+
+async def lookup_products(db: AsyncSession, product_ids: list) -> schemas.ProductBatchResult:
+    """Id listesini tek primary key IN sorgusuyla çöz, istek sırasını koru"""
+    product_ids = list(dict.fromkeys(product_ids))
+    if len(product_ids) > PRODUCT_BATCH_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"En fazla {PRODUCT_BATCH_MAX_IDS} ürün istenebilir")
+    products_by_id = {}
+    if product_ids:
+        result = await db.execute(select(models.Product).where(models.Product.id.in_(product_ids)))
+        products_by_id = {product.id: product for product in result.scalars().all()}
+    return schemas.ProductBatchResult(
+        products=[
+            schemas.ProductBase(
+                id=product.id,
+                product_name=product.product_name,
+                product_price=product.product_price,
+                product_description=product.product_description,
+                product_category=product.product_category,
+                product_image_url=product.product_image_url,
+                seller_id=product.seller_id,
+                rating_average=rating_average(product.rating_sum, product.rating_count),
+                rating_count=product.rating_count or 0
+            )
+            for product in (products_by_id.get(product_id) for product_id in product_ids)
+            if product is not None
+        ],
+        missing_ids=[product_id for product_id in product_ids if product_id not in products_by_id],
+    )
+
+@app.get("/products/batch", response_model=schemas.ProductBatchResult)
+async def get_products_batch(ids: str = Query(..., min_length=1), db: AsyncSession = Depends(get_async_read_db)):
+    """Sepet/favoriler için id listesiyle ürünler (?ids=1,2,3)"""
+    return await lookup_products(db, parse_id_list(ids))
+
+@app.post("/products/batch", response_model=schemas.ProductBatchResult)
+async def post_products_batch(payload: schemas.ProductBatchRequest, db: AsyncSession = Depends(get_async_read_db)):
+    """URL'ye sığmayan uzun id listeleri için aynı sorgu"""
+    return await lookup_products(db, payload.ids)
+
+def etag_for(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match başlığı (virgüllü liste, W/ önekli veya *) ETag ile eşleşiyor mu"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip().removeprefix("W/") for value in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+@app.get("/products/{product_id}", response_model=schemas.ProductDetail)
+async def get_product(product_id: int, request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    """Ürün detayı: satıcı bilgisi ve puan özeti (sayaç kolonlarından) tek sorguda, ETag ile"""
+    query = (
+        select(
+            models.Product,
+            models.Seller.store_name,
+            models.Seller.store_logo_url,
+            models.Seller.cargo_company,
+        )
+        .outerjoin(models.Seller, models.Seller.id == models.Product.seller_id)
+        .where(models.Product.id == product_id)
+    )
+    row = (await db.execute(query)).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    product = row.Product
+    body = schemas.ProductDetail(
+        id=product.id,
+        product_name=product.product_name,
+        product_price=product.product_price,
+        product_description=product.product_description,
+        product_category=product.product_category,
+        product_image_url=product.product_image_url,
+        seller_id=product.seller_id,
+        store_name=row.store_name,
+        store_logo_url=row.store_logo_url,
+        cargo_company=row.cargo_company,
+        rating_average=rating_average(product.rating_sum, product.rating_count),
+        rating_count=product.rating_count or 0,
+        rating=rating_summary(product),
+    ).json().encode()
+
+    # İçerik değişmediyse gövde gönderilmez; no-cache ile istemci her seferinde doğrular
+    etag = etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# --- BULK PRODUCT IMPORT ---
+PRODUCT_IMPORT_BATCH_SIZE = int(os.getenv("PRODUCT_IMPORT_BATCH_SIZE", "1000"))
+# Yanıtta listelenecek en fazla satır hatası (toplam hata sayısı her zaman döner)
+PRODUCT_IMPORT_MAX_ERRORS = int(os.getenv("PRODUCT_IMPORT_MAX_ERRORS", "100"))
+PRODUCT_IMPORT_FIELDS = list(schemas.ProductCreate.model_fields)
+
+def read_import_rows(file: UploadFile, file_format: str):
+    """Yüklenen dosyayı satır satır oku: (satır no, ham kayıt veya okuma hatası)"""
+    # UploadFile diskte bekler; TextIOWrapper ile tamamı belleğe alınmadan okunur
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    if file_format == "csv":
+        for line_no, record in enumerate(csv.DictReader(stream), start=2):
+            # Boş hücreler None olsun (ör. seller_id boş bırakılabilir)
+            yield line_no, {key: (value if value != "" else None) for key, value in record.items() if key}
+    else:
+        for line_no, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, ValueError(f"Geçersiz JSON: {e.msg}")
+                continue
+            yield line_no, record if isinstance(record, dict) else ValueError("Her satır bir JSON nesnesi olmalı")
+
+def record_imported_products(db: Session, products: list):
+    """Eklenen ürünleri satıcı istatistiklerine işle (satıcı başına tek UPSERT)"""
+    for seller_id, count in Counter(product.seller_id for product in products).items():
+        seller_stats_table.products_added(db, seller_id, count)
+
+def insert_returning_ids(db: Session, rows: list) -> list:
+    """Çok satırlı insert; dönen id'ler giriş satırlarıyla aynı sırada"""
+    if db.bind.dialect.name == "sqlite":
+        # SQLite RETURNING sırasını garanti etmez ve SQLAlchemy sort_by_parameter_order için satır satır
+        # insert'e düşer; rowid'ler VALUES sırasıyla artarak atandığı için id'leri sıralamak yeterli
+        return sorted(db.execute(insert(models.Product).returning(models.Product.id), rows).scalars().all())
+    return db.execute(
+        insert(models.Product).returning(models.Product.id, sort_by_parameter_order=True), rows
+    ).scalars().all()
+
+def insert_product_batch(db: Session, batch: list, errors: list) -> list:
+    """Geçerli satırları tek executemany ile ekle; hata olursa satır satır savepoint ile dene"""
+    rows = [row for _, row in batch]
+    try:
+        with db.begin():
+            product_ids = insert_returning_ids(db, rows)
+            products = [SimpleNamespace(id=product_id, **row) for product_id, row in zip(product_ids, rows)]
+            product_search.index_products(db, products)
+            record_imported_products(db, products)
+        return products
+    except SQLAlchemyError:
+        db.rollback()
+
+    # Parti içinde veritabanı hatası (ör. olmayan seller_id): hatalı satırları ayıkla
+    products = []
+    with db.begin():
+        for line_no, row in batch:
+            try:
+                with db.begin_nested():
+                    product_id = db.execute(insert(models.Product).returning(models.Product.id), row).scalar_one()
+                    product = SimpleNamespace(id=product_id, **row)
+                    product_search.index_products(db, [product])
+                products.append(product)
+            except SQLAlchemyError as e:
+                errors.append({"row": line_no, "errors": [str(getattr(e, "orig", e)).splitlines()[0]]})
+        record_imported_products(db, products)
+    return products
+
+@app.post("/products/import")
+def import_products(
+    file: UploadFile = File(...),
+    file_format: str = Query(None, alias="format", pattern="^(csv|ndjson)$"),
+    db: Session = Depends(get_db)
+):
+    """CSV veya NDJSON dosyasından toplu ürün ekle (satır hataları raporlanır, geçerli satırlar eklenir)"""
+    started = time.perf_counter()
+    if file_format is None:
+        file_format = "ndjson" if (file.filename or "").lower().endswith((".ndjson", ".jsonl")) else "csv"
+
+    total_rows = 0
+    imported = 0
+    errors = []
+    batch = []
+
+    def flush():
+        nonlocal imported, batch
+        if batch:
+            products = insert_product_batch(db, batch, errors)
+            imported += len(products)
+            refresh_product_indexes(products=products)
+            batch = []
+
+    for line_no, record in read_import_rows(file, file_format):
+        total_rows += 1
+        if isinstance(record, Exception):
+            errors.append({"row": line_no, "errors": [str(record)]})
+            continue
+        try:
+            product = schemas.ProductCreate(**record)
+        except ValidationError as e:
+            errors.append({
+                "row": line_no,
+                "errors": [f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors()],
+            })
+            continue
+        batch.append((line_no, product.dict()))
+        if len(batch) >= PRODUCT_IMPORT_BATCH_SIZE:
+            flush()
+    flush()
+
+    return {
+        "format": file_format,
+        "total_rows": total_rows,
+        "imported": imported,
+        "failed": len(errors),
+        "errors": sorted(errors, key=lambda error: error["row"])[:PRODUCT_IMPORT_MAX_ERRORS],
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+# --- BULK PRODUCT UPDATE / DELETE ---
+PRODUCT_BULK_MAX_IDS = int(os.getenv("PRODUCT_BULK_MAX_IDS", "1000"))
+
+def validate_bulk_ids(product_ids: list) -> list:
+    # Tekrarlayan id'ler tek sefer işlenir, sıra korunur
+    product_ids = list(dict.fromkeys(product_ids))
+    if not product_ids:
+        raise HTTPException(status_code=400, detail="product_ids boş olamaz")
+    if len(product_ids) > PRODUCT_BULK_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"En fazla {PRODUCT_BULK_MAX_IDS} ürün işlenebilir")
+    return product_ids
+
+def delete_product_images(image_urls: list):
+    """Silinen ürünlerin fotoğraflarını yanıt gönderildikten sonra temizle"""
+    for image_url in image_urls:
+        file_name = image_url.split('/')[-1]
+        delete_file_safely(f"uploads/Product_Image/{file_name}", "Ürün fotoğrafı")
+
+@app.post("/products/bulk-update", response_model=schemas.ProductBulkResult)
+def bulk_update_products(payload: schemas.ProductBulkUpdate, db: Session = Depends(get_db)):
+    """Satıcının ürünlerinde fiyat/kategori/açıklama değişikliğini tek UPDATE ile uygula"""
+    product_ids = validate_bulk_ids(payload.product_ids)
+    changes = payload.dict(include={"product_price", "product_category", "product_description"}, exclude_none=True)
+    if not changes:
+        raise HTTPException(status_code=400, detail="Güncellenecek alan yok")
+
+    # Fiyat değişikliği ciroyu etkiler; satıcı istatistikleri aynı transaction'da düzeltilir
+    stats_change = seller_stats_table.changing(db, product_ids=product_ids) if "product_price" in changes else nullcontext()
+    with stats_change:
+        rows = db.execute(
+            update(models.Product)
+            .where(models.Product.seller_id == payload.seller_id, models.Product.id.in_(product_ids))
+            .values(**changes)
+            .returning(
+                models.Product.id, models.Product.product_name,
+                models.Product.product_category, models.Product.product_description,
+            )
+            .execution_options(synchronize_session=False)
+        ).all()
+    # Arama dokümanları aynı transaction'da yeniden yazılır
+    product_search.index_products(db, rows)
+    db.commit()
+    refresh_product_indexes(products=rows)
+
+    affected = {row.id for row in rows}
+    return schemas.ProductBulkResult(
+        affected_ids=[product_id for product_id in product_ids if product_id in affected],
+        missing_ids=[product_id for product_id in product_ids if product_id not in affected],
+    )
+
+@app.post("/products/bulk-delete", response_model=schemas.ProductBulkResult)
+def bulk_delete_products(
+    payload: schemas.ProductBulkDelete,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """Satıcının ürünlerini tek DELETE ile sil; fotoğraflar arka planda temizlenir"""
+    product_ids = validate_bulk_ids(payload.product_ids)
+
+    # Silinecek ürünlerin değerlendirmeleri satıcı puanından düşülür (CASCADE ile silinirler)
+    rating_aggregates.withdraw_products(db, product_ids, owner_id=payload.seller_id)
+    # Sipariş kalemleri CASCADE ile gider; satıcı istatistikleri aynı transaction'da düzeltilir
+    with seller_stats_table.changing(db, product_ids=product_ids):
+        rows = db.execute(
+            delete(models.Product)
+            .where(models.Product.seller_id == payload.seller_id, models.Product.id.in_(product_ids))
+            .returning(models.Product.id, models.Product.product_image_url)
+            .execution_options(synchronize_session=False)
+        ).all()
+    affected = {row.id for row in rows}
+    if affected:
+        seller_stats_table.products_removed(db, payload.seller_id, len(affected))
+    product_search.remove_products(db, list(affected))
+    db.commit()
+    refresh_product_indexes(deleted_ids=affected)
+
+    image_urls = [row.product_image_url for row in rows if row.product_image_url]
+    if image_urls:
+        background_tasks.add_task(delete_product_images, image_urls)
+    return schemas.ProductBulkResult(
+        affected_ids=[product_id for product_id in product_ids if product_id in affected],
+        missing_ids=[product_id for product_id in product_ids if product_id not in affected],
+    )
+
 @app.put("/products/{product_id}", response_model=schemas.ProductBase)
-def update_product(product_id: int, product: schemas.ProductUpdate, db: Session = Depends(get_db)):
+def update_product(product_id: int, product: schemas.ProductUpdate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     db_product = db.query(models.Product).filter(models.Product.id == product_id).first()
     if not db_product:
         raise HTTPException(status_code=404, detail="Product not found")
     
     # Eski fotoğraf URL'ini sakla
     old_image_url = db_product.product_image_url
-    
-    # Ürün bilgilerini güncelle
-    for key, value in product.dict().items():
-        setattr(db_product, key, value)
-    
-    # Eğer fotoğraf değiştiyse eski fotoğrafı sil
-    if old_image_url and old_image_url != db_product.product_image_url:
-        file_name = old_image_url.split('/')[-1]
-        file_path = f"uploads/Product_Image/{file_name}"
-        delete_file_safely(file_path, "Eski ürün fotoğrafı")
-    
+    old_seller_id = db_product.seller_id
+    
+    # Ürün bilgilerini güncelle (fiyat/ad/satıcı değişikliği satıcı istatistiklerine aynı transaction'da yansır)
+    with seller_stats_table.changing(db, product_ids=[product_id]):
+        for key, value in product.dict().items():
+            setattr(db_product, key, value)
+    if db_product.seller_id != old_seller_id:
+        seller_stats_table.products_removed(db, old_seller_id)
+        seller_stats_table.products_added(db, db_product.seller_id)
+    
+    db.flush()
+    product_search.index_products(db, [db_product])
     db.commit()
     db.refresh(db_product)
+    refresh_product_indexes(products=[db_product])
+
+    # Eğer fotoğraf değiştiyse eski fotoğraf commit sonrası silinir
+    if old_image_url and old_image_url != db_product.product_image_url:
+        background_tasks.add_task(delete_product_images, [old_image_url])
     return schemas.ProductBase(
         id=db_product.id,
         product_name=db_product.product_name,
@@ -445,20 +1179,26 @@ def update_product(product_id: int, product: schemas.ProductUpdate, db: Session
     )
 
 @app.delete("/products/{product_id}")
-def delete_product(product_id: int, db: Session = Depends(get_db)):
+def delete_product(product_id: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     db_product = db.query(models.Product).filter(models.Product.id == product_id).first()
     if not db_product:
         raise HTTPException(status_code=404, detail="Product not found")
-    
-    # Ürün fotoğrafını sil
-    if db_product.product_image_url:
-        file_name = db_product.product_image_url.split('/')[-1]
-        file_path = f"uploads/Product_Image/{file_name}"
-        delete_file_safely(file_path, "Ürün fotoğrafı")
-    
-    # Ürünü veritabanından sil
-    db.delete(db_product)
+    image_url = db_product.product_image_url
+    
+    # Ürünü veritabanından sil (değerlendirmeleri CASCADE ile silinir, satıcı puanından düşülür)
+    rating_aggregates.withdraw_products(db, [db_product.id])
+    product_search.remove_products(db, [db_product.id])
+    # Sipariş kalemleri CASCADE ile gider; satıcı istatistikleri aynı transaction'da düzeltilir
+    seller_id = db_product.seller_id
+    with seller_stats_table.changing(db, product_ids=[db_product.id]):
+        db.delete(db_product)
+    seller_stats_table.products_removed(db, seller_id)
     db.commit()
+    refresh_product_indexes(deleted_ids=[product_id])
+
+    # Ürün fotoğrafı commit başarılı olduktan sonra silinir
+    if image_url:
+        background_tasks.add_task(delete_product_images, [image_url])
     return {"ok": True}
 
 # --- PHONE VERIFICATION ---
@@ -1062,13 +1802,15 @@ def update_user(user_id: int, user: schemas.UserUpdate, db: Session = Depends(ge
                 detail=f"Telefon numarası güncellendi ancak doğrulama kodu gönderilemedi: {str(e)}"
             )
     
-    # Diğer alanları güncelle
-    for key, value in user.dict().items():
-        if value is not None:
-            if key == "password":
-                setattr(db_user, key, hash_password(value))
-            else:
-                setattr(db_user, key, value)
+    # Diğer alanları güncelle (ad değişikliği satıcı istatistiklerindeki müşteri adına yansır)
+    name_changed = user.name_surname is not None and user.name_surname != db_user.name_surname
+    with seller_stats_table.changing(db, user_ids=[user_id]) if name_changed else nullcontext():
+        for key, value in user.dict().items():
+            if value is not None:
+                if key == "password":
+                    setattr(db_user, key, hash_password(value))
+                else:
+                    setattr(db_user, key, value)
     
     db_user.updated_at = datetime.now()
     db.commit()
@@ -1091,7 +1833,11 @@ def delete_user(user_id: int, db: Session = Depends(get_db)):
     db_user = db.query(models.User).filter(models.User.id == user_id).first()
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
-    db.delete(db_user)
+    # Kullanıcının sipariş kalemleri ve değerlendirmeleri CASCADE ile gider;
+    # satıcı istatistikleri ve puan sayaçları aynı transaction'da düzeltilir
+    rating_aggregates.withdraw_reviewer(db, user_id)
+    with seller_stats_table.changing(db, user_ids=[user_id]):
+        db.delete(db_user)
     db.commit()
     return {"ok": True}
 
@@ -1124,7 +1870,10 @@ def delete_address(address_id: int, db: Session = Depends(get_db)):
     db_address = db.query(models.Address).filter(models.Address.id == address_id).first()
     if not db_address:
         raise HTTPException(status_code=404, detail="Address not found")
-    db.delete(db_address)
+    # Adresin siparişleri CASCADE ile gider; satıcı istatistikleri aynı transaction'da düzeltilir
+    order_ids = db.execute(select(models.Order.id).where(models.Order.order_address == address_id)).scalars().all()
+    with seller_stats_table.changing(db, order_ids=order_ids):
+        db.delete(db_address)
     db.commit()
     return {"ok": True}
 
@@ -1402,12 +2151,31 @@ def get_orders(db: Session = Depends(get_db)):
     
     return result
 
+ORDER_DATE_FIELDS = ("order_created_date", "order_estimated_delivery")
+
+def parse_order_date(value: str) -> datetime:
+    """ISO (YYYY-MM-DD[THH:MM:SS]) veya DD/MM/YYYY tarihini datetime'a çevir"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, '%d/%m/%Y')
+
 @app.put("/order/{order_id}", response_model=schemas.OrderBase)
 def update_order(order_id: int, order: schemas.OrderUpdate, db: Session = Depends(get_db)):
     db_order = db.query(models.Order).filter(models.Order.id == order_id).first()
     if not db_order:
         raise HTTPException(status_code=404, detail="Order not found")
-    for key, value in order.dict().items():
+    values = order.dict()
+    # DateTime kolonları string kabul etmez (SQLite sürücüsü hata verir)
+    for field in ORDER_DATE_FIELDS:
+        try:
+            values[field] = parse_order_date(values[field])
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Geçersiz tarih: {field}")
+    if values["order_address"] is not None and db.get(models.Address, values["order_address"]) is None:
+        raise HTTPException(status_code=400, detail="Address not found")
+    seller_stats_table.status_changed(db, order_id, db_order.order_status, order.order_status)
+    for key, value in values.items():
         setattr(db_order, key, value)
     db.commit()
     db.refresh(db_order)
@@ -1427,7 +2195,9 @@ def delete_order(order_id: int, db: Session = Depends(get_db)):
     db_order = db.query(models.Order).filter(models.Order.id == order_id).first()
     if not db_order:
         raise HTTPException(status_code=404, detail="Order not found")
-    db.delete(db_order)
+    # Siparişin kalemleri CASCADE ile gider; satıcı istatistikleri aynı transaction'da düzeltilir
+    with seller_stats_table.changing(db, order_ids=[order_id]):
+        db.delete(db_order)
     db.commit()
     return {"ok": True}
 
@@ -1523,8 +2293,13 @@ def create_users_order(uo: schemas.UsersOrderCreate, db: Session = Depends(get_d
         print(f"Created model: {db_uo}")
         
         db.add(db_uo)
+        db.flush()
+        # Satıcı istatistikleri sipariş kalemiyle aynı transaction'da güncellenir
+        seller_stats_table.item_added(db, db_uo.id)
         db.commit()
         db.refresh(db_uo)
+        # Otomatik tamamlama önerileri sipariş sayısına göre sıralanır
+        autocomplete.bump(db_uo.product_id)
         
         print(f"=== CREATE USERS_ORDER SUCCESS ===")
         print(f"Created users_order with ID: {db_uo.id}")
@@ -1544,8 +2319,10 @@ def update_users_order(uo_id: int, uo: schemas.UsersOrderUpdate, db: Session = D
     db_uo = db.query(models.UsersOrder).filter(models.UsersOrder.id == uo_id).first()
     if not db_uo:
         raise HTTPException(status_code=404, detail="UsersOrder not found")
-    for key, value in uo.dict().items():
-        setattr(db_uo, key, value)
+    # Kalem başka siparişe/ürüne taşınabilir; her iki siparişin satıcı katkısı yeniden hesaplanır
+    with seller_stats_table.changing(db, item_ids=[uo_id], order_ids=[uo.order_id]):
+        for key, value in uo.dict().items():
+            setattr(db_uo, key, value)
     db.commit()
     db.refresh(db_uo)
     return db_uo
@@ -1555,7 +2332,8 @@ def delete_users_order(uo_id: int, db: Session = Depends(get_db)):
     db_uo = db.query(models.UsersOrder).filter(models.UsersOrder.id == uo_id).first()
     if not db_uo:
         raise HTTPException(status_code=404, detail="UsersOrder not found")
-    db.delete(db_uo)
+    with seller_stats_table.changing(db, item_ids=[uo_id]):
+        db.delete(db_uo)
     db.commit()
     return {"ok": True}
 
@@ -1573,10 +2351,8 @@ async def upload_image(file: UploadFile = File(...)):
 @app.get("/check-db")
 def check_database(db: Session = Depends(get_db)):
     try:
-        # Check if sellers table exists
-        from sqlalchemy import text
-        result = db.execute(text("SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'sellers')"))
-        sellers_exists = result.scalar()
+        # Check if sellers table exists (PostgreSQL ve SQLite için ortak)
+        sellers_exists = inspect(db.get_bind()).has_table("sellers")
         
         return {
             "sellers_table_exists": sellers_exists,
@@ -1602,6 +2378,51 @@ def list_endpoints():
             })
     return {"endpoints": routes}
 
+@app.get("/debug/startup")
+def get_startup_metrics():
+    """Worker başlangıç süresi ve şema sürümü kontrol sonucunu getir"""
+    return STARTUP_METRICS
+
+# Havuz, yavaş sorgu ve metrik endpoint'leri sadece ADMIN_TOKEN tanımlıysa açılır
+# (varsayılan: kapalı) ve X-Admin-Token header'ı ile çağrılmalıdır
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+def require_admin(x_admin_token: str = Header(None)):
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Geçersiz admin token")
+
+@app.get("/debug/pool", dependencies=[Depends(require_admin)])
+async def get_pool_status():
+    """Veritabanı bağlantı havuzu ve threadpool durumunu getir"""
+    # Sync endpoint'ler anyio threadpool'unda çalışır; havuz boyutu bununla karşılaştırılmalı
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    return {
+        "pools": get_pool_stats(),
+        "threadpool": {
+            "total_tokens": limiter.total_tokens,
+            "borrowed_tokens": limiter.borrowed_tokens,
+        },
+        "replicas": replica_router.status()
+    }
+
+@app.get("/metrics", dependencies=[Depends(require_admin)])
+def get_metrics():
+    """Prometheus metrikleri (text exposition formatı)"""
+    return Response(content=metrics.expose(), media_type=metrics.CONTENT_TYPE)
+
+@app.get("/debug/slow-queries", dependencies=[Depends(require_admin)])
+def get_slow_queries(limit: int = 50):
+    """Eşik süresini aşan son SQL sorgularını getir"""
+    return slow_query_log.snapshot(limit)
+
+@app.delete("/debug/slow-queries", dependencies=[Depends(require_admin)])
+def clear_slow_queries():
+    """Yavaş sorgu kayıtlarını temizle"""
+    slow_query_log.clear()
+    return {"message": "Yavaş sorgu kayıtları temizlendi"}
+
 # --- SELLER CRUD ---
 @app.post("/sellers/signup", response_model=schemas.SellerBase)
 async def create_seller(
@@ -1671,6 +2492,7 @@ async def create_seller(
         db.add(db_seller)
         db.commit()
         db.refresh(db_seller)
+        fuzzy_search.upsert("sellers", db_seller.id, db_seller.store_name)
         
         # Doğrulama kaydını temizleme - kayıt kalmalı (güvenlik ve denetim için)
         # db.delete(phone_verification)
@@ -1753,7 +2575,7 @@ def get_seller_profile(seller_id: int, db: Session = Depends(get_db)):
     )
 
 @app.get("/sellers/{seller_id}", response_model=schemas.SellerBase)
-def get_seller_by_id(seller_id: int, db: Session = Depends(get_db)):
+def get_seller_by_id(seller_id: int, db: Session = Depends(get_read_db)):
     seller = db.query(models.Seller).filter(models.Seller.id == seller_id).first()
     if not seller:
         raise HTTPException(status_code=404, detail="Seller not found")
@@ -1775,14 +2597,15 @@ def get_seller_by_id(seller_id: int, db: Session = Depends(get_db)):
     )
 
 @app.get("/sellers/{seller_id}/products", response_model=list[schemas.ProductBase])
-def get_seller_products(seller_id: int, db: Session = Depends(get_db)):
+async def get_seller_products(seller_id: int, db: AsyncSession = Depends(get_async_read_db)):
     # Check if seller exists
-    seller = db.query(models.Seller).filter(models.Seller.id == seller_id).first()
+    seller = await db.get(models.Seller, seller_id)
     if not seller:
         raise HTTPException(status_code=404, detail="Seller not found")
     
     # Get all products for this seller
-    products = db.query(models.Product).filter(models.Product.seller_id == seller_id).all()
+    result = await db.execute(select(models.Product).where(models.Product.seller_id == seller_id))
+    products = result.scalars().all()
     
     return [
         schemas.ProductBase(
@@ -1792,7 +2615,9 @@ def get_seller_products(seller_id: int, db: Session = Depends(get_db)):
             product_description=product.product_description,
             product_category=product.product_category,
             product_image_url=product.product_image_url,
-            seller_id=product.seller_id
+            seller_id=product.seller_id,
+            rating_average=rating_average(product.rating_sum, product.rating_count),
+            rating_count=product.rating_count or 0
         )
         for product in products
     ]
@@ -1936,6 +2761,8 @@ async def update_seller_profile(
     
     db.commit()
     db.refresh(seller)
+    if store_name is not None:
+        fuzzy_search.upsert("sellers", seller.id, seller.store_name)
     
     return schemas.SellerBase(
         id=seller.id,
@@ -1954,81 +2781,103 @@ async def update_seller_profile(
     )
 
 # --- SELLER ORDERS (NEW - using users_order table) ---
+SELLER_ORDERS_PAGE_SIZE = int(os.getenv("SELLER_ORDERS_PAGE_SIZE", "50"))
+SELLER_ORDERS_PAGE_MAX = 200
+
+def format_order_date(value):
+    return value.strftime('%Y-%m-%d') if hasattr(value, 'strftime') else str(value)
+
+def seller_order_page(db: Session, seller_id: int, limit: int, cursor: str = None, statuses: list = None,
+                      date_from: date = None, date_to: date = None, excluded_statuses: list = None):
+    """Satıcının ürününü içeren siparişlerden bir sayfa id (en yeni önce), sonraki sayfa cursor'ı"""
+    # Filtre yoksa sipariş tablosuna inilmez; id'ler (product_id, order_id) index'inden okunur
+    order_id = models.UsersOrder.order_id
+    query = (
+        select(order_id)
+        .join(models.Product, models.Product.id == models.UsersOrder.product_id)
+        .where(models.Product.seller_id == seller_id)
+    )
+    if statuses or excluded_statuses or date_from or date_to:
+        query = query.join(models.Order, models.Order.id == order_id)
+    # Durumu boş siparişler "pending" sayılır (yanıttaki "status" ile aynı kural)
+    order_status = func.coalesce(models.Order.order_status, "pending")
+    if statuses:
+        query = query.where(order_status.in_(statuses))
+    if excluded_statuses:
+        # "Aktif" gibi sekmeler hariç tutmayla tanımlanır; listede olmayan durumlar da görünür
+        query = query.where(order_status.not_in(excluded_statuses))
+    if date_from:
+        query = query.where(models.Order.order_created_date >= datetime.combine(date_from, datetime.min.time()))
+    if date_to:
+        query = query.where(models.Order.order_created_date < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+    if cursor:
+        query = query.where(order_id < decode_cursor(cursor, "seller_orders", 1)[0])
+    # Sipariş birden fazla ürün satırı içerebilir; GROUP BY ile tekilleştirilir
+    query = query.group_by(order_id).order_by(order_id.desc()).limit(limit + 1)
+    order_ids = db.execute(query).scalars().all()
+
+    next_cursor = None
+    if len(order_ids) > limit:
+        order_ids = order_ids[:limit]
+        next_cursor = encode_cursor("seller_orders", [order_ids[-1]])
+    return order_ids, next_cursor
+
+def load_seller_orders(db: Session, seller_id: int, order_ids: list) -> list:
+    """Sayfadaki siparişleri, müşterisini, adresini ve satıcının ürün satırlarını tek join ile yükle"""
+    if not order_ids:
+        return []
+    rows = db.execute(
+        select(models.Order, models.Address, models.User, models.UsersOrder, models.Product)
+        .join(models.UsersOrder, models.UsersOrder.order_id == models.Order.id)
+        .join(models.Product, models.Product.id == models.UsersOrder.product_id)
+        .outerjoin(models.Address, models.Address.id == models.Order.order_address)
+        .outerjoin(models.User, models.User.id == models.UsersOrder.user_id)
+        .where(models.Order.id.in_(order_ids), models.Product.seller_id == seller_id)
+        .order_by(models.UsersOrder.id)
+    ).all()
+
+    orders = {}
+    for order, address, user, user_order, product in rows:
+        entry = orders.get(order.id)
+        if entry is None:
+            # Müşteri: siparişin satıcıya ait ilk ürün satırındaki kullanıcı
+            entry = orders[order.id] = {"order": order, "address": address, "user": user, "items": []}
+        entry["items"].append((user_order, product))
+    return [orders[order_id] for order_id in order_ids if order_id in orders]
+
 @app.get("/seller_orders/{seller_id}", response_model=list[dict])
-def get_seller_orders(seller_id: int, db: Session = Depends(get_db)):
-    """Satıcıya ait siparişleri getir - users_order tablosunu kullanarak"""
+def get_seller_orders(
+    seller_id: int,
+    response: Response,
+    limit: int = Query(SELLER_ORDERS_PAGE_SIZE, ge=1, le=SELLER_ORDERS_PAGE_MAX),
+    cursor: str = None,
+    status: list[str] = Query(None),
+    exclude_status: list[str] = Query(None),
+    date_from: date = None,
+    date_to: date = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Satıcıya ait siparişleri getir (en yeni önce, sonraki sayfa X-Next-Cursor header'ında).
+    status ve exclude_status birden fazla verilebilir (örn. aktif: exclude_status=delivered&exclude_status=cancelled)
+    """
     try:
-        # Bu satıcıya ait ürünlerin ID'lerini al
-        seller_products = db.query(models.Product).filter(
-            models.Product.seller_id == seller_id
-        ).all()
-        
-        seller_product_ids = [product.id for product in seller_products]
-        
-        if not seller_product_ids:
-            return []
-        
-        # Bu satıcının ürünlerini içeren siparişleri al
-        user_orders = db.query(models.UsersOrder).filter(
-            models.UsersOrder.product_id.in_(seller_product_ids)
-        ).all()
-        
+        order_ids, next_cursor = seller_order_page(
+            db, seller_id, limit, cursor, status or None, date_from, date_to, exclude_status or None
+        )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+
         result = []
-        processed_orders = set()  # Aynı siparişi tekrar eklememek için
-        
-        for user_order in user_orders:
-            if user_order.order_id in processed_orders:
-                continue
-                
-            processed_orders.add(user_order.order_id)
-            
-            # Sipariş bilgilerini al
-            order = db.query(models.Order).filter(
-                models.Order.id == user_order.order_id
-            ).first()
-            
-            if not order:
-                continue
-            
-            # Kullanıcı bilgilerini al
-            user = db.query(models.User).filter(
-                models.User.id == user_order.user_id
-            ).first()
-            
+        for entry in load_seller_orders(db, seller_id, order_ids):
+            order, address, user = entry["order"], entry["address"], entry["user"]
             if not user:
                 continue
-            
-            # Adres bilgilerini al
-            address = None
-            if order.order_address:
-                address = db.query(models.Address).filter(
-                    models.Address.id == order.order_address
-                ).first()
-            
-            # Bu siparişteki bu satıcıya ait ürünleri al
-            order_products = []
-            for uo in db.query(models.UsersOrder).filter(
-                models.UsersOrder.order_id == user_order.order_id,
-                models.UsersOrder.product_id.in_(seller_product_ids)
-            ).all():
-                product = db.query(models.Product).filter(
-                    models.Product.id == uo.product_id
-                ).first()
-                
-                if product:
-                    order_products.append({
-                        "product_id": product.id,
-                        "product_name": product.product_name,
-                        "product_price": product.product_price,
-                        "quantity": getattr(uo, 'quantity', 1),  # quantity alanı yoksa 1 varsay
-                        "total_price": getattr(uo, 'price', product.product_price)  # price alanı yoksa product_price varsay
-                    })
-            
             result.append({
                 "order_id": order.id,
                 "order_code": order.order_code,
-                "order_created_date": order.order_created_date.strftime('%Y-%m-%d') if hasattr(order.order_created_date, 'strftime') else str(order.order_created_date),
-                "order_estimated_delivery": order.order_estimated_delivery.strftime('%Y-%m-%d') if hasattr(order.order_estimated_delivery, 'strftime') else str(order.order_estimated_delivery),
+                "order_created_date": format_order_date(order.order_created_date),
+                "order_estimated_delivery": format_order_date(order.order_estimated_delivery),
                 "order_cargo_company": order.order_cargo_company,
                 "status": order.order_status or "pending",  # Gerçek durum
                 "user": {
@@ -2038,20 +2887,31 @@ def get_seller_orders(seller_id: int, db: Session = Depends(get_db)):
                     "phone_number": user.phone_number
                 },
                 "address": {
-                    "id": address.id if address else None,
-                    "city": address.city if address else "",
-                    "district": address.district if address else "",
-                    "neighbourhood": address.neighbourhood if address else "",
-                    "street_name": address.street_name if address else "",
-                    "building_number": address.building_number if address else "",
-                    "apartment_number": address.apartment_number if address else "",
-                    "address_name": address.address_name if address else ""
+                    "id": address.id,
+                    "city": address.city,
+                    "district": address.district,
+                    "neighbourhood": address.neighbourhood,
+                    "street_name": address.street_name,
+                    "building_number": address.building_number,
+                    "apartment_number": address.apartment_number,
+                    "address_name": address.address_name
                 } if address else None,
-                "products": order_products
+                "products": [
+                    {
+                        "product_id": product.id,
+                        "product_name": product.product_name,
+                        "product_price": product.product_price,
+                        "quantity": getattr(user_order, 'quantity', 1),  # quantity alanı yoksa 1 varsay
+                        "total_price": getattr(user_order, 'price', product.product_price)  # price alanı yoksa product_price varsay
+                    }
+                    for user_order, product in entry["items"]
+                ]
             })
         
         return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error getting seller orders: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting seller orders: {str(e)}")
@@ -2077,6 +2937,7 @@ def update_seller_order_status(order_id: int, status: str, db: Session = Depends
         
         # Status'u güncelle
         print(f"Updating order {order_id} status from '{order.order_status}' to '{status}'")
+        seller_stats_table.status_changed(db, order_id, order.order_status, status)
         order.order_status = status
         
         # Eğer status "delivered" ise teslim tarihini de güncelle
@@ -2099,157 +2960,111 @@ def update_seller_order_status(order_id: int, status: str, db: Session = Depends
 
 @app.get("/seller_statistics/{seller_id}")
 def get_seller_statistics(seller_id: int, db: Session = Depends(get_db)):
-    """Satıcı istatistiklerini getir"""
+    """Satıcı istatistiklerini getir (seller_stats tablosundan tek primary key okuması)"""
     try:
-        # Satıcının ürünlerini al
-        seller_products = db.query(models.Product).filter(models.Product.seller_id == seller_id).all()
-        product_ids = [product.id for product in seller_products]
-        
-        # Toplam ürün sayısı
-        total_products = len(seller_products)
-        
-        # Satıcının siparişlerini al
-        seller_orders = []
-        if product_ids:
-            # Bu satıcının ürünlerini içeren siparişleri bul
-            for uo in db.query(models.UsersOrder).filter(
-                models.UsersOrder.product_id.in_(product_ids)
-            ).all():
-                order = db.query(models.Order).filter(models.Order.id == uo.order_id).first()
-                if order and order not in seller_orders:
-                    seller_orders.append(order)
-        
-        # Toplam sipariş sayısı
-        total_orders = len(seller_orders)
-        
-        # Durum bazında sipariş sayıları
-        pending_orders = len([o for o in seller_orders if o.order_status == 'pending'])
-        processing_orders = len([o for o in seller_orders if o.order_status == 'processing'])
-        shipped_orders = len([o for o in seller_orders if o.order_status == 'shipped'])
-        delivered_orders = len([o for o in seller_orders if o.order_status == 'delivered'])
-        
-        # En çok satın alan müşteri
-        customer_orders = {}
-        for uo in db.query(models.UsersOrder).filter(
-            models.UsersOrder.product_id.in_(product_ids)
-        ).all():
-            order = db.query(models.Order).filter(models.Order.id == uo.order_id).first()
-            if order:
-                # Order'ın user_id'sini bul
-                user_order = db.query(models.UsersOrder).filter(
-                    models.UsersOrder.order_id == order.id
-                ).first()
-                if user_order:
-                    user = db.query(models.User).filter(models.User.id == user_order.user_id).first()
-                    if user:
-                        customer_name = user.name_surname
-                        customer_orders[customer_name] = customer_orders.get(customer_name, 0) + 1
-        
-        favorite_customer = max(customer_orders.items(), key=lambda x: x[1]) if customer_orders else ("Henüz müşteri yok", 0)
-        
-        # En çok satılan ürün
-        product_sales = {}
-        for uo in db.query(models.UsersOrder).filter(
-            models.UsersOrder.product_id.in_(product_ids)
-        ).all():
-            product = db.query(models.Product).filter(models.Product.id == uo.product_id).first()
-            if product:
-                product_sales[product.product_name] = product_sales.get(product.product_name, 0) + 1
-        
-        best_selling_product = max(product_sales.items(), key=lambda x: x[1]) if product_sales else ("Henüz satış yok", 0)
-        
-        return {
-            "total_products": total_products,
-            "total_orders": total_orders,
-            "pending_orders": pending_orders,
-            "processing_orders": processing_orders,
-            "shipped_orders": shipped_orders,
-            "delivered_orders": delivered_orders,
-            "favorite_customer": {
-                "name": favorite_customer[0],
-                "order_count": favorite_customer[1]
-            },
-            "best_selling_product": {
-                "name": best_selling_product[0],
-                "sales_count": best_selling_product[1]
-            }
-        }
+        return seller_stats_table.read(db, seller_id)
         
     except Exception as e:
         print(f"Error getting seller statistics: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting seller statistics: {str(e)}")
 
+# Bu kadar veya daha fazla siparişi olan satıcılarda aktif siparişler partial index'ten taranır
+SELLER_ACTIVE_ORDERS_SCAN_MIN = int(os.getenv("SELLER_ACTIVE_ORDERS_SCAN_MIN", "5000"))
+
+def seller_active_order_page(db: Session, seller_id: int, limit: int, cursor: str = None):
+    """Satıcının aktif siparişlerinden bir sayfa id (en yeni tarih önce, tarihsiz olanlar sonda), sonraki sayfa cursor'ı"""
+    created = models.Order.order_created_date
+    seller_items = (
+        select(models.UsersOrder.order_id)
+        .join(models.Product, models.Product.id == models.UsersOrder.product_id)
+        .where(models.Product.seller_id == seller_id)
+    )
+    stats = db.get(models.SellerStats, seller_id)
+    if stats is None or (stats.total_orders or 0) >= SELLER_ACTIVE_ORDERS_SCAN_MIN:
+        # Yoğun (veya istatistiği henüz olmayan, hacmi bilinmeyen) satıcı: aktif siparişler partial index'ten
+        # tarih sırasıyla okunur, satıcı koşulu sipariş başına EXISTS ile denetlenir; geçmiş siparişlerin
+        # tamamı taranmaz
+        seller_filter = seller_items.where(models.UsersOrder.order_id == models.Order.id).exists()
+    else:
+        # Az siparişli satıcı: satıcının kalemlerinden gidilir, aktif olmayanlar partial index koşuluyla elenir
+        seller_filter = models.Order.id.in_(seller_items)
+    # Durum koşulu literal yazılır: parametreli IN ile planlayıcı partial index'i eşleştiremez
+    query = select(models.Order.id, created).where(models.ACTIVE_ORDER_CONDITION, seller_filter)
+    if cursor:
+        after_date, after_id = decode_cursor(cursor, "seller_active_orders", 2)
+        if after_date is None:
+            query = query.where(created.is_(None), models.Order.id < after_id)
+        else:
+            try:
+                after_date = datetime.fromisoformat(after_date)
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Geçersiz cursor")
+            query = query.where(or_(
+                created < after_date,
+                and_(created == after_date, models.Order.id < after_id),
+                created.is_(None),
+            ))
+    query = query.order_by(created.desc().nulls_last(), models.Order.id.desc()).limit(limit + 1)
+    rows = db.execute(query).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_id, last_date = rows[-1]
+        next_cursor = encode_cursor("seller_active_orders", [last_date.isoformat() if last_date else None, last_id])
+    return [order_id for order_id, _ in rows], next_cursor
+
 @app.get("/seller_active_orders/{seller_id}", response_model=list[dict])
-def get_seller_active_orders(seller_id: int, db: Session = Depends(get_db)):
-    """Satıcının aktif siparişlerini getir (pending, processing, shipped)"""
+def get_seller_active_orders(
+    seller_id: int,
+    response: Response,
+    limit: int = Query(SELLER_ORDERS_PAGE_SIZE, ge=1, le=SELLER_ORDERS_PAGE_MAX),
+    cursor: str = None,
+    db: Session = Depends(get_db)
+):
+    """Satıcının aktif siparişlerini getir (pending, processing, shipped; sonraki sayfa X-Next-Cursor header'ında)"""
     try:
-        # Satıcının ürünlerini al
-        seller_products = db.query(models.Product).filter(models.Product.seller_id == seller_id).all()
-        product_ids = [product.id for product in seller_products]
-        
+        order_ids, next_cursor = seller_active_order_page(db, seller_id, limit, cursor)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+
         active_orders = []
-        if product_ids:
-            # Bu satıcının ürünlerini içeren aktif siparişleri bul
-            for uo in db.query(models.UsersOrder).filter(
-                models.UsersOrder.product_id.in_(product_ids)
-            ).all():
-                order = db.query(models.Order).filter(models.Order.id == uo.order_id).first()
-                if order and order.order_status in ['pending', 'processing', 'shipped']:
-                    # Sipariş zaten eklenmiş mi kontrol et
-                    if not any(active_order['order_id'] == order.id for active_order in active_orders):
-                        # Kullanıcı bilgilerini al
-                        user_order = db.query(models.UsersOrder).filter(
-                            models.UsersOrder.order_id == order.id
-                        ).first()
-                        user = None
-                        if user_order:
-                            user = db.query(models.User).filter(models.User.id == user_order.user_id).first()
-                        
-                        # Adres bilgilerini al
-                        address = None
-                        if order.order_address:
-                            address = db.query(models.Address).filter(models.Address.id == order.order_address).first()
-                        
-                        # Ürün bilgilerini al
-                        products = []
-                        for uo_product in db.query(models.UsersOrder).filter(models.UsersOrder.order_id == order.id).all():
-                            product = db.query(models.Product).filter(models.Product.id == uo_product.product_id).first()
-                            if product and product.seller_id == seller_id:  # Sadece bu satıcının ürünlerini ekle
-                                products.append({
-                                    'product_name': product.product_name,
-                                    'quantity': getattr(uo_product, 'quantity', 1),
-                                    'total_price': getattr(uo_product, 'total_price', product.product_price)
-                                })
-                        
-                        if products:  # Sadece bu satıcının ürünleri varsa ekle
-                            active_orders.append({
-                                'order_id': order.id,
-                                'order_code': order.order_code,
-                                'order_created_date': order.order_created_date.strftime('%Y-%m-%d') if order.order_created_date else None,
-                                'order_estimated_delivery': order.order_estimated_delivery.strftime('%Y-%m-%d') if order.order_estimated_delivery else None,
-                                'order_cargo_company': order.order_cargo_company,
-                                'status': order.order_status,
-                                'user': {
-                                    'name_surname': user.name_surname if user else 'Bilinmeyen',
-                                    'email': user.email if user else 'Bilinmeyen',
-                                    'phone_number': user.phone_number if user else 'Bilinmeyen'
-                                } if user else None,
-                                'address': {
-                                    'city': address.city if address else 'Bilinmeyen',
-                                    'district': address.district if address else 'Bilinmeyen',
-                                    'neighbourhood': address.neighbourhood if address else 'Bilinmeyen',
-                                    'street_name': address.street_name if address else 'Bilinmeyen',
-                                    'building_number': address.building_number if address else 'Bilinmeyen',
-                                    'apartment_number': address.apartment_number if address else 'Bilinmeyen'
-                                } if address else None,
-                                'products': products
-                            })
-        
-        # Siparişleri tarihe göre sırala (en yeni önce)
-        active_orders.sort(key=lambda x: x['order_created_date'] or '', reverse=True)
-        
+        for entry in load_seller_orders(db, seller_id, order_ids):
+            order, address, user = entry["order"], entry["address"], entry["user"]
+            active_orders.append({
+                'order_id': order.id,
+                'order_code': order.order_code,
+                'order_created_date': order.order_created_date.strftime('%Y-%m-%d') if order.order_created_date else None,
+                'order_estimated_delivery': order.order_estimated_delivery.strftime('%Y-%m-%d') if order.order_estimated_delivery else None,
+                'order_cargo_company': order.order_cargo_company,
+                'status': order.order_status,
+                'user': {
+                    'name_surname': user.name_surname,
+                    'email': user.email,
+                    'phone_number': user.phone_number
+                } if user else None,
+                'address': {
+                    'city': address.city,
+                    'district': address.district,
+                    'neighbourhood': address.neighbourhood,
+                    'street_name': address.street_name,
+                    'building_number': address.building_number,
+                    'apartment_number': address.apartment_number
+                } if address else None,
+                'products': [
+                    {
+                        'product_name': product.product_name,
+                        'quantity': getattr(user_order, 'quantity', 1),
+                        'total_price': getattr(user_order, 'total_price', product.product_price)
+                    }
+                    for user_order, product in entry["items"]
+                ]
+            })
+
         return active_orders
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error getting seller active orders: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting seller active orders: {str(e)}")
@@ -2294,6 +3109,8 @@ def create_seller_review(review: schemas.SellerReviewCreate, db: Session = Depen
         
         print(f"Creating review: {db_review}")
         db.add(db_review)
+        # Puan sayaçları değerlendirmeyle aynı transaction'da güncellenir
+        rating_aggregates.record_change(db, review.product_id, review.seller_id, new_rating=review.rating)
         db.commit()
         db.refresh(db_review)
         
@@ -2316,22 +3133,23 @@ def create_seller_review(review: schemas.SellerReviewCreate, db: Session = Depen
         raise HTTPException(status_code=500, detail=f"Error creating seller review: {str(e)}")
 
 @app.get("/seller_reviews", response_model=list[schemas.SellerReviewBase])
-def get_seller_reviews(
+async def get_seller_reviews(
     seller_id: int = None,
     product_id: int = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Değerlendirmeleri getir (filtreleme ile)"""
     try:
-        query = db.query(models.SellerReview)
+        query = select(models.SellerReview)
         
         if seller_id:
-            query = query.filter(models.SellerReview.seller_id == seller_id)
+            query = query.where(models.SellerReview.seller_id == seller_id)
         
         if product_id:
-            query = query.filter(models.SellerReview.product_id == product_id)
+            query = query.where(models.SellerReview.product_id == product_id)
         
-        reviews = query.all()
+        result = await db.execute(query)
+        reviews = result.scalars().all()
         
         return [
             schemas.SellerReviewBase(
@@ -2361,6 +3179,10 @@ def update_seller_review(review_id: int, review: schemas.SellerReviewUpdate, db:
         if review.rating is not None:
             if review.rating < 1 or review.rating > 5:
                 raise HTTPException(status_code=400, detail="Rating must be between 1 and 5")
+            rating_aggregates.record_change(
+                db, db_review.product_id, db_review.seller_id,
+                old_rating=db_review.rating, new_rating=review.rating
+            )
             db_review.rating = review.rating
         
         if review.comment is not None:
@@ -2393,6 +3215,7 @@ def delete_seller_review(review_id: int, db: Session = Depends(get_db)):
         if not db_review:
             raise HTTPException(status_code=404, detail="Review not found")
         
+        rating_aggregates.record_change(db, db_review.product_id, db_review.seller_id, old_rating=db_review.rating)
         db.delete(db_review)
         db.commit()
         
@@ -2936,7 +3759,7 @@ def unfollow_seller(user_id: int, seller_id: int, db: Session = Depends(get_db))
         
         # Satıcının takipçi sayısını SQL ile güncelle
         db.execute(
-            text("UPDATE sellers SET followers_count = GREATEST(COALESCE(followers_count, 0) - 1, 0) WHERE id = :seller_id"),
+            text("UPDATE sellers SET followers_count = CASE WHEN COALESCE(followers_count, 0) > 0 THEN followers_count - 1 ELSE 0 END WHERE id = :seller_id"),
             {"seller_id": seller_id}
         )
         
@@ -2952,21 +3775,24 @@ def unfollow_seller(user_id: int, seller_id: int, db: Session = Depends(get_db))
         raise HTTPException(status_code=500, detail="Takipten çıkarma işlemi başarısız")
 
 @app.get("/users/{user_id}/followed-sellers")
-def get_followed_sellers(user_id: int, db: Session = Depends(get_db)):
+async def get_followed_sellers(user_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """Kullanıcının takip ettiği satıcıları getir"""
     try:
         # Kullanıcı var mı kontrol et
-        user = db.query(models.User).filter(models.User.id == user_id).first()
+        user = await db.get(models.User, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
         
         # Takip edilen satıcıları getir
-        followed_sellers = db.query(models.Seller).join(
-            models.UsersSellers,
-            models.Seller.id == models.UsersSellers.seller_id
-        ).filter(
-            models.UsersSellers.user_id == user_id
-        ).all()
+        result = await db.execute(
+            select(models.Seller).join(
+                models.UsersSellers,
+                models.Seller.id == models.UsersSellers.seller_id
+            ).where(
+                models.UsersSellers.user_id == user_id
+            )
+        )
+        followed_sellers = result.scalars().all()
         
         # Basit satıcı bilgilerini döndür
         seller_list = []
@@ -2987,7 +3813,7 @@ def get_followed_sellers(user_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Takip edilen satıcılar getirilemedi")
 
 @app.get("/sellers/{seller_id}/followers-count")
-def get_seller_followers_count(seller_id: int, db: Session = Depends(get_db)):
+def get_seller_followers_count(seller_id: int, db: Session = Depends(get_read_db)):
     """Satıcının takipçi sayısını getir"""
     try:
         # Satıcı var mı kontrol et
@@ -3008,6 +3834,14 @@ def get_seller_followers_count(seller_id: int, db: Session = Depends(get_db)):
         print(f"Error in get_seller_followers_count: {str(e)}")
         raise HTTPException(status_code=500, detail="Takipçi sayısı getirilemedi")
 
+@app.get("/sellers/{seller_id}/rating", response_model=schemas.RatingSummary)
+async def get_seller_rating(seller_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    """Satıcının puan özeti (sayaç kolonlarından, tek primary key okuması)"""
+    seller = await db.get(models.Seller, seller_id)
+    if not seller:
+        raise HTTPException(status_code=404, detail="Satıcı bulunamadı")
+    return rating_summary(seller)
+
 @app.get("/users/{user_id}/is-following/{seller_id}")
 def check_if_following(user_id: int, seller_id: int, db: Session = Depends(get_db)):
     """Kullanıcı bu satıcıyı takip ediyor mu kontrol et"""
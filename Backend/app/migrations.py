@@ -0,0 +1,176 @@
+"""
+Şema yönetimi: sürümlü migration adımları ve başlangıç sürüm kontrolü.
+Migration'lar `python -m scripts.migrate` ile açıkça çalıştırılır; uygulama
+başlarken yalnızca tek bir sorgu ile sürümü kontrol eder.
+"""
+
+import os
+from datetime import datetime
+from sqlalchemy import text, inspect
+from app.db import engine
+import app.models as models
+from app.services.product_search import product_search
+from app.services.fuzzy_search import fuzzy_search
+from app.services.ratings import rating_aggregates, RATED_TABLES, RATING_STARS, histogram_column
+from app.services.seller_stats import seller_stats_table
+
+def _create_base_schema(conn):
+    """Tüm tabloları oluştur (mevcut tablolar atlanır)"""
+    models.Base.metadata.create_all(bind=conn)
+
+# true ise PostgreSQL'de dolu tablolara index migration içinde (yazma kilidiyle) oluşturulur
+MIGRATE_ALLOW_BLOCKING_INDEXES = os.getenv("MIGRATE_ALLOW_BLOCKING_INDEXES", "false").lower() == "true"
+
+def _create_model_indexes(conn):
+    """Modellerde tanımlı eksik index'leri oluştur (mevcut olanlar atlanır)"""
+    if conn.dialect.name == "postgresql" and not MIGRATE_ALLOW_BLOCKING_INDEXES:
+        # Transaction içindeki CREATE INDEX tabloyu yazmaya kilitler; dolu tablolarda önce CONCURRENTLY script'i
+        inspector = inspect(conn)
+        missing = []
+        for table in models.Base.metadata.sorted_tables:
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            pending = [index.name for index in table.indexes if index.name not in existing]
+            if pending and conn.execute(text(f'SELECT 1 FROM "{table.name}" LIMIT 1')).first():
+                missing.extend(pending)
+        if missing:
+            raise RuntimeError(
+                f"Dolu tablolarda eksik index'ler: {', '.join(missing)}. Önce "
+                "'psql \"$DATABASE_URL\" -f scripts/postgresql_performance_indexes.sql' çalıştırın "
+                "(veya yazma kilidini kabul ediyorsanız MIGRATE_ALLOW_BLOCKING_INDEXES=true)"
+            )
+    for table in models.Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=conn, checkfirst=True)
+
+def _delete_duplicates(conn, table_name: str, columns: str):
+    """Mükerrer kayıtları sil (ilk kayıt kalır) ve silinenleri raporla"""
+    deleted = conn.execute(text(
+        f"DELETE FROM {table_name} WHERE id NOT IN "
+        f"(SELECT MIN(id) FROM {table_name} GROUP BY {columns}) RETURNING id"
+    )).scalars().all()
+    if deleted:
+        print(f"🧹 {table_name}: {len(deleted)} mükerrer kayıt silindi (id: {sorted(deleted)[:20]}{' ...' if len(deleted) > 20 else ''})")
+
+def _create_hot_lookup_indexes(conn):
+    """Sık sorgulanan kolonlar için index paketi ve tekillik kısıtları"""
+    # Unique index'lerden önce mükerrer kayıtları temizle (ilk kayıt kalır)
+    _delete_duplicates(conn, "users_sellers", "user_id, seller_id")
+    _delete_duplicates(conn, "seller_reviews", "user_id, product_id")
+    _create_model_indexes(conn)
+
+def _add_column_if_missing(conn, table_name: str, column_name: str, definition: str):
+    """Kolon yoksa ekle (create_all ile oluşmuş yeni veritabanlarında atlanır)"""
+    existing = {column["name"] for column in inspect(conn).get_columns(table_name)}
+    if column_name not in existing:
+        conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {definition}"))
+
+def _add_seller_followers_count(conn):
+    """follow/unfollow'un güncellediği takipçi sayacını modele ekle ve yeniden hesapla"""
+    _add_column_if_missing(conn, "sellers", "followers_count", "INTEGER DEFAULT 0")
+    conn.execute(text(
+        "UPDATE sellers SET followers_count = "
+        "(SELECT COUNT(*) FROM users_sellers WHERE users_sellers.seller_id = sellers.id)"
+    ))
+
+def _create_product_listing_indexes(conn):
+    """Ürün listesi filtre + keyset sıralaması için composite index'ler"""
+    # Composite index'lerin ilk kolonu olan tek kolonluk index'ler artık gereksiz
+    conn.execute(text("DROP INDEX IF EXISTS ix_products_product_category"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_products_seller_id"))
+    _create_model_indexes(conn)
+
+def _create_product_search_index(conn):
+    """Tam metin arama: PostgreSQL'de tsvector + GIN, SQLite'ta FTS5 tablosu (mevcut ürünler indexlenir)"""
+    product_search.create_index(conn)
+
+def _create_fuzzy_search_indexes(conn):
+    """Bulanık arama: PostgreSQL'de pg_trgm + GIN (SQLite bellek içi index kullanır)"""
+    fuzzy_search.create_index(conn)
+
+def _add_rating_aggregates(conn):
+    """Ürün ve satıcı puan sayaçları (toplam, adet, yıldız histogramı) ve ilk hesaplama"""
+    columns = ["rating_sum", "rating_count"] + [histogram_column(star) for star in RATING_STARS]
+    for table in RATED_TABLES:
+        for column in columns:
+            _add_column_if_missing(conn, table, column, "INTEGER DEFAULT 0")
+    rating_aggregates.rebuild(conn)
+
+def _create_seller_order_indexes(conn):
+    """Satıcı siparişleri ve istatistikleri için users_order(product_id, order_id) index'i"""
+    conn.execute(text("DROP INDEX IF EXISTS ix_users_order_product_id"))
+    _create_model_indexes(conn)
+
+def _create_seller_stats(conn):
+    """Satıcı paneli istatistik tabloları ve ilk hesaplama"""
+    models.SellerStats.__table__.create(bind=conn, checkfirst=True)
+    models.SellerStatCount.__table__.create(bind=conn, checkfirst=True)
+    seller_stats_table.rebuild(conn)
+
+def _create_active_order_index(conn):
+    """Aktif siparişler (pending, processing, shipped) için partial index"""
+    _create_model_indexes(conn)
+
+# (sürüm, açıklama, adım) - yeni adımlar listenin sonuna eklenir
+MIGRATIONS = [
+    (1, "Temel şema", _create_base_schema),
+    (2, "Sık sorgulanan kolonlar için index paketi", _create_hot_lookup_indexes),
+    (3, "Satıcı takipçi sayacı kolonu", _add_seller_followers_count),
+    (4, "Ürün listesi için composite index'ler", _create_product_listing_indexes),
+    (5, "Ürün tam metin arama index'i", _create_product_search_index),
+    (6, "Ürün ve mağaza adı için trigram index'leri", _create_fuzzy_search_indexes),
+    (7, "Ürün ve satıcı puan sayaçları", _add_rating_aggregates),
+    (8, "Satıcı sipariş kalemleri için composite index", _create_seller_order_indexes),
+    (9, "Satıcı istatistik tablosu", _create_seller_stats),
+    (10, "Aktif siparişler için partial index", _create_active_order_index),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+# true ise sürüm uyuşmazlığında uygulama başlamaz
+SCHEMA_CHECK_STRICT = os.getenv("SCHEMA_CHECK_STRICT", "false").lower() == "true"
+
+def get_schema_version(conn):
+    """Veritabanındaki şema sürümünü döndür (tablo yoksa None)"""
+    if not engine.dialect.has_table(conn, models.SchemaVersion.__tablename__):
+        return None
+    return conn.execute(text("SELECT MAX(version) FROM schema_version")).scalar()
+
+def migrate(target: int = SCHEMA_VERSION) -> list:
+    """Bekleyen migration adımlarını sırayla uygula, uygulanan sürümleri döndür"""
+    with engine.begin() as conn:
+        models.SchemaVersion.__table__.create(bind=conn, checkfirst=True)
+        current = get_schema_version(conn) or 0
+
+    applied = []
+    for version, description, step in MIGRATIONS:
+        if version <= current or version > target:
+            continue
+        # Her adım kendi transaction'ında çalışır; hata olursa sürüm yazılmaz
+        with engine.begin() as conn:
+            step(conn)
+            conn.execute(
+                models.SchemaVersion.__table__.insert(),
+                {"version": version, "description": description, "applied_at": datetime.utcnow()}
+            )
+        applied.append(version)
+    return applied
+
+def check_schema_version() -> dict:
+    """Başlangıçta tek sorgu ile şema sürümünü kontrol et"""
+    try:
+        with engine.connect() as conn:
+            current = conn.execute(text("SELECT MAX(version) FROM schema_version")).scalar()
+    except Exception as e:
+        # Veritabanı geçici olarak erişilemez olabilir; uygulama yine de ayağa kalksın
+        print(f"⚠️ Şema sürümü okunamadı: {e}")
+        if SCHEMA_CHECK_STRICT:
+            raise
+        return {"current": None, "expected": SCHEMA_VERSION, "up_to_date": False, "error": str(e)}
+
+    up_to_date = current == SCHEMA_VERSION
+    if not up_to_date:
+        message = f"Şema sürümü {current}, beklenen {SCHEMA_VERSION}. 'python -m scripts.migrate' çalıştırın"
+        if SCHEMA_CHECK_STRICT:
+            raise RuntimeError(message)
+        print(f"⚠️ {message}")
+    return {"current": current, "expected": SCHEMA_VERSION, "up_to_date": up_to_date}
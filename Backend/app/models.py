@@ -1,8 +1,11 @@
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Boolean, Index, TIMESTAMP, text
 from app.db import Base
-from sqlalchemy.dialects.postgresql import ARRAY, TIMESTAMP
 from datetime import datetime
 
+# Satıcı panelinde "aktif" sayılan sipariş durumları (partial index koşulu)
+ACTIVE_ORDER_STATUSES = ("pending", "processing", "shipped")
+ACTIVE_ORDER_CONDITION = text("order_status IN ({})".format(", ".join(f"'{status}'" for status in ACTIVE_ORDER_STATUSES)))
+
 class Address(Base):
     __tablename__ = "address"
     id = Column(Integer, primary_key=True, index=True)
@@ -17,7 +20,7 @@ class Address(Base):
 class CreditCard(Base):
     __tablename__ = "credit_card"
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
     provider = Column(String(50))
     card_token = Column(String(255))
     card_brand = Column(String(20))
@@ -30,6 +33,13 @@ class CreditCard(Base):
 
 class Order(Base):
     __tablename__ = "order"
+    # Aktif siparişler tarih sırasıyla; teslim edilmiş/iptal siparişler index'e girmez
+    __table_args__ = (
+        Index(
+            "ix_order_active_created_date_id", "order_created_date", "id",
+            postgresql_where=ACTIVE_ORDER_CONDITION, sqlite_where=ACTIVE_ORDER_CONDITION,
+        ),
+    )
     id = Column(Integer, primary_key=True, index=True)
     order_code = Column(String)
     order_created_date = Column(DateTime)
@@ -41,6 +51,14 @@ class Order(Base):
 
 class Product(Base):
     __tablename__ = "products"
+    # Keyset sayfalama: filtre kolonu + sıralama kolonu + id (tek kolonluk category/seller index'lerinin yerine)
+    __table_args__ = (
+        Index("ix_products_category_id", "product_category", "id"),
+        Index("ix_products_seller_id_id", "seller_id", "id"),
+        Index("ix_products_price_id", "product_price", "id"),
+        Index("ix_products_category_price_id", "product_category", "product_price", "id"),
+        Index("ix_products_seller_id_price_id", "seller_id", "product_price", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     product_name = Column(String)
     product_price = Column(Float)
@@ -48,14 +66,22 @@ class Product(Base):
     product_category = Column(String)
     product_image_url = Column(String)  # Tek fotoğraf için String
     seller_id = Column(Integer, ForeignKey("sellers.id", ondelete="CASCADE"), nullable=True)
+    # Değerlendirme sayaçları (app/services/ratings.py tarafından güncellenir)
+    rating_sum = Column(Integer, default=0)
+    rating_count = Column(Integer, default=0)
+    rating_1 = Column(Integer, default=0)
+    rating_2 = Column(Integer, default=0)
+    rating_3 = Column(Integer, default=0)
+    rating_4 = Column(Integer, default=0)
+    rating_5 = Column(Integer, default=0)
 
 class User(Base):
     __tablename__ = "users"
     id = Column(Integer, primary_key=True, index=True)
     name_surname = Column(String)
     password = Column(String)
-    email = Column(String)
-    phone_number = Column(String)
+    email = Column(String, index=True)
+    phone_number = Column(String, index=True)
     phone_verified = Column(String, default="pending")  # pending, verified
     email_verified = Column(String, default="pending")  # pending, verified
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
@@ -64,7 +90,7 @@ class User(Base):
 class UsersAddress(Base):
     __tablename__ = "users_address"
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
     address_id = Column(Integer, ForeignKey("address.id", ondelete="CASCADE"))
 
 class UsersCreditCard(Base):
@@ -75,10 +101,14 @@ class UsersCreditCard(Base):
 
 class UsersOrder(Base):
     __tablename__ = "users_order"
+    # Satıcı siparişleri/istatistikleri: ürün -> sipariş eşlemesi index'ten okunur (tek kolonluk product_id index'inin yerine)
+    __table_args__ = (
+        Index("ix_users_order_product_id_order_id", "product_id", "order_id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
     product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"))
-    order_id = Column(Integer, ForeignKey("order.id", ondelete="CASCADE"))
+    order_id = Column(Integer, ForeignKey("order.id", ondelete="CASCADE"), index=True)
 
 class Seller(Base):
     __tablename__ = "sellers"
@@ -94,6 +124,15 @@ class Seller(Base):
     store_logo_url = Column(String, nullable=True)
     cargo_company = Column(String, default="Araskargo")
     is_verified = Column(String, default="pending")
+    followers_count = Column(Integer, default=0)
+    # Değerlendirme sayaçları (app/services/ratings.py tarafından güncellenir)
+    rating_sum = Column(Integer, default=0)
+    rating_count = Column(Integer, default=0)
+    rating_1 = Column(Integer, default=0)
+    rating_2 = Column(Integer, default=0)
+    rating_3 = Column(Integer, default=0)
+    rating_4 = Column(Integer, default=0)
+    rating_5 = Column(Integer, default=0)
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
     updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -107,9 +146,13 @@ class SellerProduct(Base):
 
 class SellerReview(Base):
     __tablename__ = "seller_reviews"
+    # Kullanıcı başına ürün için tek değerlendirme (user_id sorgularını da karşılar)
+    __table_args__ = (
+        Index("uq_seller_reviews_user_id_product_id", "user_id", "product_id", unique=True),
+    )
     id = Column(Integer, primary_key=True, index=True)
-    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"))
-    seller_id = Column(Integer, ForeignKey("sellers.id", ondelete="CASCADE"))
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), index=True)
+    seller_id = Column(Integer, ForeignKey("sellers.id", ondelete="CASCADE"), index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     rating = Column(Integer)  # 1-5 arası
     comment = Column(String, nullable=True)
@@ -157,7 +200,45 @@ class EmailVerificationSeller(Base):
 
 class UsersSellers(Base):
     __tablename__ = "users_sellers"
+    # Aynı satıcı iki kez takip edilemez (user_id sorgularını da karşılar)
+    __table_args__ = (
+        Index("uq_users_sellers_user_id_seller_id", "user_id", "seller_id", unique=True),
+    )
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
-    seller_id = Column(Integer, ForeignKey("sellers.id", ondelete="CASCADE"))
+    seller_id = Column(Integer, ForeignKey("sellers.id", ondelete="CASCADE"), index=True)
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
+
+# Satıcı paneli istatistikleri: yazımlarla aynı transaction'da artımlı güncellenir, gece yeniden hesaplanır
+class SellerStats(Base):
+    __tablename__ = "seller_stats"
+    seller_id = Column(Integer, ForeignKey("sellers.id", ondelete="CASCADE"), primary_key=True)
+    total_products = Column(Integer, default=0, server_default="0")
+    total_orders = Column(Integer, default=0, server_default="0")
+    pending_orders = Column(Integer, default=0, server_default="0")
+    processing_orders = Column(Integer, default=0, server_default="0")
+    shipped_orders = Column(Integer, default=0, server_default="0")
+    delivered_orders = Column(Integer, default=0, server_default="0")
+    revenue = Column(Float, default=0, server_default="0")
+    top_customer_name = Column(String)
+    top_customer_count = Column(Integer, default=0, server_default="0")
+    top_customer_first_item = Column(Integer)
+    top_product_name = Column(String)
+    top_product_count = Column(Integer, default=0, server_default="0")
+    top_product_first_item = Column(Integer)
+    updated_at = Column(TIMESTAMP, default=datetime.utcnow)
+
+# En çok satın alan müşteri / en çok satılan ürün için ad bazında kalem sayıları
+class SellerStatCount(Base):
+    __tablename__ = "seller_stat_counts"
+    seller_id = Column(Integer, ForeignKey("sellers.id", ondelete="CASCADE"), primary_key=True)
+    kind = Column(String, primary_key=True)  # customer, product
+    name = Column(String, primary_key=True)
+    count = Column(Integer, default=0, server_default="0")
+    first_item = Column(Integer)
+
+class SchemaVersion(Base):
+    __tablename__ = "schema_version"
+    version = Column(Integer, primary_key=True)
+    description = Column(String)
+    applied_at = Column(TIMESTAMP, default=datetime.utcnow)
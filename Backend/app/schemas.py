@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List
 
 # Product
 class ProductBase(BaseModel):
@@ -10,6 +10,29 @@ class ProductBase(BaseModel):
     product_category: str
     product_image_url: str
     seller_id: Optional[int] = None
+    # Değerlendirme sayaçlarından (ek sorgu gerektirmez)
+    rating_average: Optional[float] = None
+    rating_count: int = 0
+
+class RatingSummary(BaseModel):
+    average: Optional[float] = None
+    count: int = 0
+    # "1".."5" -> o puanı veren değerlendirme sayısı
+    histogram: dict
+
+class ProductDetail(ProductBase):
+    store_name: Optional[str] = None
+    store_logo_url: Optional[str] = None
+    cargo_company: Optional[str] = None
+    rating: RatingSummary
+
+class ProductBatchRequest(BaseModel):
+    ids: List[int]
+
+class ProductBatchResult(BaseModel):
+    # İstekteki sırayla (tekrarlar tek sefer)
+    products: List[ProductBase]
+    missing_ids: List[int]
 
 class ProductCreate(BaseModel):
     product_name: str
@@ -27,6 +50,23 @@ class ProductUpdate(BaseModel):
     product_image_url: str
     seller_id: Optional[int] = None
 
+class ProductBulkUpdate(BaseModel):
+    seller_id: int
+    product_ids: List[int]
+    # Sadece gönderilen alanlar güncellenir
+    product_price: Optional[float] = None
+    product_category: Optional[str] = None
+    product_description: Optional[str] = None
+
+class ProductBulkDelete(BaseModel):
+    seller_id: int
+    product_ids: List[int]
+
+class ProductBulkResult(BaseModel):
+    affected_ids: List[int]
+    # Bulunamayan veya satıcıya ait olmayan ürünler
+    missing_ids: List[int]
+
 # User
 class UserBase(BaseModel):
     id: int
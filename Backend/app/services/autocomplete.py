@@ -0,0 +1,205 @@
+import os
+import heapq
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from sqlalchemy import text
+from dotenv import load_dotenv
+from app.services.product_search import fold_turkish, TOKEN_PATTERN
+
+# Environment variables'ları yükle
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+load_dotenv(os.path.join(BASE_DIR, "config.env"))
+
+# Bir istekte döndürülebilecek en fazla öneri
+AUTOCOMPLETE_MAX_LIMIT = int(os.getenv("AUTOCOMPLETE_MAX_LIMIT", "20"))
+# Önek başına en popüler AUTOCOMPLETE_MAX_LIMIT öneri tutulur; en az kullanılan önekler önbellekten düşer
+AUTOCOMPLETE_CACHE_SIZE = int(os.getenv("AUTOCOMPLETE_CACHE_SIZE", "50000"))
+
+def normalize(value: str) -> str:
+    return " ".join(TOKEN_PATTERN.findall(fold_turkish(value)))
+
+def suffix_keys(value: str) -> list:
+    """Her kelime başından itibaren anahtar: "akilli telefon" -> ["akilli telefon", "telefon"]"""
+    words = normalize(value).split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+class Suggestion:
+    __slots__ = ("kind", "text", "keys", "score", "product_ids")
+
+    def __init__(self, kind: str, text: str):
+        self.kind = kind
+        self.text = text
+        self.keys = suffix_keys(text)
+        self.score = 0
+        self.product_ids = set()
+
+    @property
+    def sort_key(self):
+        return (-self.score, self.text)
+
+class AutocompleteIndex:
+    """
+    Ürün adı ve kategori önerileri için bellek içi sıralı dizi.
+    Önek aralığı bisect ile bulunur, sonuçlar popülerliğe (sipariş sayısı) göre sıralanır;
+    her önekin ilk AUTOCOMPLETE_MAX_LIMIT önerisi önbellekte tutulur ve bump/upsert ile güncellenir.
+    Başlangıçta veritabanından yüklenir, ürün yazımlarında artımlı güncellenir
+    (her worker'ın kendi kopyası vardır).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._suggestions = {}
+        # (anahtar, öneri kimliği) çiftleri, anahtara göre sıralı
+        self._entries = []
+        # ürün id -> (ad, kategori, popülerlik)
+        self._products = {}
+        # önek -> en popüler öneriler (LRU sırasında)
+        self._top_cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._suggestions)
+
+    def build(self, engine) -> int:
+        """Ürünleri ve sipariş sayılarını tek sorguda yükle"""
+        with engine.connect() as conn:
+            rows = conn.execute(text(
+                "SELECT p.id, p.product_name, p.product_category, COUNT(uo.id) "
+                "FROM products p LEFT JOIN users_order uo ON uo.product_id = p.id "
+                "GROUP BY p.id, p.product_name, p.product_category"
+            )).all()
+        with self._lock:
+            self._reset()
+            for product_id, name, category, popularity in rows:
+                self._products[product_id] = (name, category, popularity)
+                for sid in self._contribute(product_id, name, category, popularity):
+                    suggestion = self._suggestions[sid]
+                    if len(suggestion.product_ids) == 1:
+                        self._entries.extend((key, sid) for key in suggestion.keys)
+            self._entries.sort()
+        return len(self._suggestions)
+
+    def _contribute(self, product_id: int, name: str, category: str, popularity: int) -> list:
+        """Ürünün ad ve kategori önerilerine katkısını ekle, etkilenen öneri kimliklerini döndür"""
+        touched = []
+        # Kategori puanı: ürün sayısı + ürünlerin sipariş sayıları
+        for kind, value, score in (("product", name, popularity), ("category", category, popularity + 1)):
+            if not value or not normalize(value):
+                continue
+            sid = (kind, normalize(value))
+            suggestion = self._suggestions.get(sid)
+            if suggestion is None:
+                suggestion = self._suggestions[sid] = Suggestion(kind, value)
+            suggestion.product_ids.add(product_id)
+            suggestion.score += score
+            touched.append(sid)
+        return touched
+
+    def _withdraw(self, product_id: int):
+        """Ürünün katkısını geri al; boşalan öneriler silinir, etkilenen önbellekler temizlenir"""
+        name, category, popularity = self._products.pop(product_id)
+        for kind, value, score in (("product", name, popularity), ("category", category, popularity + 1)):
+            if not value or not normalize(value):
+                continue
+            sid = (kind, normalize(value))
+            suggestion = self._suggestions.get(sid)
+            if suggestion is None:
+                continue
+            suggestion.product_ids.discard(product_id)
+            suggestion.score -= score
+            self._invalidate(suggestion)
+            if not suggestion.product_ids:
+                del self._suggestions[sid]
+                for key in suggestion.keys:
+                    index = bisect_left(self._entries, (key, sid))
+                    if index < len(self._entries) and self._entries[index] == (key, sid):
+                        del self._entries[index]
+
+    def _invalidate(self, suggestion: Suggestion):
+        # Puan düştüğünde önbellekteki sıralama geçersiz olur
+        for key in suggestion.keys:
+            for length in range(1, len(key) + 1):
+                self._top_cache.pop(key[:length], None)
+
+    def _promote(self, sid):
+        """Puanı artan öneriyi önbellekteki listelere yerleştir (tam tarama gerektirmez)"""
+        suggestion = self._suggestions[sid]
+        for key in suggestion.keys:
+            for length in range(1, len(key) + 1):
+                cached = self._top_cache.get(key[:length])
+                if cached is None:
+                    continue
+                if sid not in cached:
+                    # Liste doluysa ve öneri sonuncudan geride kalıyorsa sıralama değişmez
+                    if len(cached) >= AUTOCOMPLETE_MAX_LIMIT and suggestion.sort_key >= self._suggestions[cached[-1]].sort_key:
+                        continue
+                    cached.append(sid)
+                cached.sort(key=lambda item: self._suggestions[item].sort_key)
+                del cached[AUTOCOMPLETE_MAX_LIMIT:]
+
+    def upsert_product(self, product_id: int, name: str, category: str):
+        with self._lock:
+            popularity = 0
+            if product_id in self._products:
+                popularity = self._products[product_id][2]
+                self._withdraw(product_id)
+            self._products[product_id] = (name, category, popularity)
+            for sid in self._contribute(product_id, name, category, popularity):
+                suggestion = self._suggestions[sid]
+                if len(suggestion.product_ids) == 1:
+                    for key in suggestion.keys:
+                        insort(self._entries, (key, sid))
+                self._promote(sid)
+
+    def remove_product(self, product_id: int):
+        with self._lock:
+            if product_id in self._products:
+                self._withdraw(product_id)
+
+    def bump(self, product_id: int, amount: int = 1):
+        """Sipariş verildiğinde ürünün ve kategorisinin popülerliğini artır"""
+        with self._lock:
+            if product_id not in self._products:
+                return
+            name, category, popularity = self._products[product_id]
+            self._products[product_id] = (name, category, popularity + amount)
+            for kind, value in (("product", name), ("category", category)):
+                sid = (kind, normalize(value or ""))
+                if sid in self._suggestions:
+                    self._suggestions[sid].score += amount
+                    self._promote(sid)
+
+    def _scan(self, prefix: str, limit: int) -> list:
+        index = bisect_left(self._entries, (prefix,))
+        seen = set()
+        while index < len(self._entries) and self._entries[index][0].startswith(prefix):
+            seen.add(self._entries[index][1])
+            index += 1
+        return heapq.nsmallest(limit, seen, key=lambda sid: self._suggestions[sid].sort_key)
+
+    def _top(self, prefix: str) -> list:
+        """Önekin en popüler önerileri; aralık sadece önbellekte yoksa taranır"""
+        top = self._top_cache.get(prefix)
+        if top is None:
+            top = self._top_cache[prefix] = self._scan(prefix, AUTOCOMPLETE_MAX_LIMIT)
+            if len(self._top_cache) > AUTOCOMPLETE_CACHE_SIZE:
+                self._top_cache.popitem(last=False)
+        else:
+            self._top_cache.move_to_end(prefix)
+        return top
+
+    def suggest(self, prefix: str, limit: int = 10) -> list:
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        with self._lock:
+            top = self._top(prefix)
+            return [
+                {"text": suggestion.text, "type": suggestion.kind, "score": suggestion.score}
+                for suggestion in (self._suggestions[sid] for sid in top[:limit])
+            ]
+
+autocomplete = AutocompleteIndex()
@@ -3,6 +3,7 @@ import os
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
+from app.services.metrics import metrics
 
 # Environment variables'ları yükle
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -129,13 +130,13 @@ class EmailService:
             msg.attach(MIMEText(html_content, 'html'))
             
             # Email gönder
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.sender_email, self.sender_password)
-            
             text = msg.as_string()
-            server.sendmail(self.sender_email, email, text)
-            server.quit()
+            with metrics.time_outbound("smtp", "sendmail"):
+                server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+                server.starttls()
+                server.login(self.sender_email, self.sender_password)
+                server.sendmail(self.sender_email, email, text)
+                server.quit()
             
             print(f"✅ Email başarıyla gönderildi: {email}")
             
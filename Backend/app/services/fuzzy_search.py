@@ -0,0 +1,166 @@
+import os
+import threading
+from collections import defaultdict
+from sqlalchemy import text
+from dotenv import load_dotenv
+from app.services.product_search import fold_turkish, TOKEN_PATTERN
+
+# Environment variables'ları yükle
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+load_dotenv(os.path.join(BASE_DIR, "config.env"))
+
+# Benzerlik eşiği (0-1, pg_trgm varsayılanı 0.3) ve sıralanacak en fazla aday sayısı
+FUZZY_THRESHOLD = float(os.getenv("FUZZY_THRESHOLD", "0.3"))
+FUZZY_MAX_CANDIDATES = int(os.getenv("FUZZY_MAX_CANDIDATES", "500"))
+
+# PostgreSQL'de aksan katlama: translate ve lower IMMUTABLE olduğundan expression index'te kullanılabilir
+_FOLD_FROM = "ÇĞİIÖŞÜÂÎÛçğıöşüâîû"
+_FOLD_TO = "cgiiosuaiucgiosuaiu"
+
+def folded_sql(column: str) -> str:
+    return f"lower(translate({column}, '{_FOLD_FROM}', '{_FOLD_TO}'))"
+
+# (tablo, id kolonu, metin kolonu, index adı)
+FUZZY_TARGETS = {
+    "products": ("products", "id", "product_name", "ix_products_product_name_trgm"),
+    "sellers": ("sellers", "id", "store_name", "ix_sellers_store_name_trgm"),
+}
+
+def trigrams(value: str) -> set:
+    """pg_trgm ile aynı kural: her kelime "  kelime " olarak doldurulup 3'lü parçalara bölünür"""
+    result = set()
+    for word in TOKEN_PATTERN.findall(fold_turkish(value)):
+        padded = f"  {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+class TrigramIndex:
+    """Bellek içi trigram index'i (trigram -> id kümesi)"""
+
+    def __init__(self):
+        self._postings = defaultdict(set)
+        self._grams = {}
+        self._texts = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._texts)
+
+    def upsert(self, item_id: int, value: str):
+        grams = trigrams(value)
+        with self._lock:
+            self._remove_locked(item_id)
+            self._grams[item_id] = grams
+            self._texts[item_id] = value
+            for gram in grams:
+                self._postings[gram].add(item_id)
+
+    def remove(self, item_id: int):
+        with self._lock:
+            self._remove_locked(item_id)
+
+    def _remove_locked(self, item_id: int):
+        for gram in self._grams.pop(item_id, ()):
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del self._postings[gram]
+        self._texts.pop(item_id, None)
+
+    def search(self, query: str, threshold: float, limit: int, max_candidates: int) -> list:
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+        with self._lock:
+            # Ortak trigram sayısı; sadece en çok ortak parçası olan adaylar sıralanır
+            shared = defaultdict(int)
+            for gram in query_grams:
+                for item_id in self._postings.get(gram, ()):
+                    shared[item_id] += 1
+            candidates = sorted(shared.items(), key=lambda item: (-item[1], item[0]))[:max_candidates]
+            results = []
+            for item_id, common in candidates:
+                # pg_trgm similarity: ortak / (a + b - ortak)
+                similarity = common / (len(query_grams) + len(self._grams[item_id]) - common)
+                if similarity >= threshold:
+                    results.append((item_id, self._texts[item_id], round(similarity, 4)))
+        results.sort(key=lambda item: (-item[2], item[0]))
+        return results[:limit]
+
+class FuzzySearch:
+    """
+    Ürün adı ve mağaza adında yazım hatasına toleranslı arama.
+    PostgreSQL: pg_trgm + GIN expression index.
+    SQLite: başlangıçta yüklenen bellek içi trigram index'i (her worker'ın kendi kopyası vardır).
+    """
+
+    def __init__(self):
+        self.indexes = {name: TrigramIndex() for name in FUZZY_TARGETS}
+        self.in_memory = False
+
+    def create_index(self, conn):
+        """pg_trgm eklentisi ve GIN index'leri (migration adımı, sadece PostgreSQL)"""
+        if conn.dialect.name != "postgresql":
+            return
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for table, _, column, index_name in FUZZY_TARGETS.values():
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} "
+                f"USING GIN (({folded_sql(column)}) gin_trgm_ops)"
+            ))
+
+    def build(self, engine) -> dict:
+        """SQLite'ta bellek içi index'i veritabanından doldur"""
+        if engine.dialect.name == "postgresql":
+            return None
+        # Yükleme hata verirse boş index ile çalışılır (veritabanındaki pg_trgm sorgusu SQLite'ta yok)
+        self.in_memory = True
+        counts = {}
+        with engine.connect() as conn:
+            for name, (table, id_column, column, _) in FUZZY_TARGETS.items():
+                index = TrigramIndex()
+                for item_id, value in conn.execute(text(f"SELECT {id_column}, {column} FROM {table}")):
+                    if value:
+                        index.upsert(item_id, value)
+                self.indexes[name] = index
+                counts[name] = len(index)
+        return counts
+
+    def upsert(self, name: str, item_id: int, value: str):
+        """Commit sonrası bellek içi index'i güncelle (PostgreSQL'de index veritabanındadır)"""
+        if self.in_memory:
+            if value:
+                self.indexes[name].upsert(item_id, value)
+            else:
+                self.indexes[name].remove(item_id)
+
+    def remove(self, name: str, item_id: int):
+        if self.in_memory:
+            self.indexes[name].remove(item_id)
+
+    def search_memory(self, name: str, query: str, threshold: float, limit: int) -> list:
+        return self.indexes[name].search(query, threshold, limit, FUZZY_MAX_CANDIDATES)
+
+    def search_statement(self, name: str, query: str, threshold: float, limit: int):
+        """
+        PostgreSQL sorgusu: GIN index'ten eşleşen adaylar benzerliğe göre sıralanıp sınırlanır
+        (sırasız LIMIT en iyi eşleşmeleri keyfi olarak dışarıda bırakabilir), sonra eşik uygulanır
+        """
+        table, id_column, column, _ = FUZZY_TARGETS[name]
+        expression = folded_sql(column)
+        return text(
+            f"SELECT id, name, similarity FROM ("
+            f"SELECT {id_column} AS id, {column} AS name, similarity({expression}, :query) AS similarity "
+            f"FROM {table} WHERE {expression} % :query "
+            f"ORDER BY similarity DESC, id LIMIT :max_candidates"
+            f") AS candidates WHERE similarity >= :threshold "
+            f"ORDER BY similarity DESC, id LIMIT :limit"
+        ).bindparams(
+            query=fold_turkish(query),
+            threshold=threshold,
+            limit=limit,
+            max_candidates=FUZZY_MAX_CANDIDATES,
+        )
+
+fuzzy_search = FuzzySearch()
@@ -0,0 +1,138 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# Prometheus'un varsayılan gecikme sınırları (saniye)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: tuple, values: tuple, extra: dict = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs += [f'{name}="{_escape(value)}"' for name, value in extra.items()]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    """Etiketli metrik tabanı (etiket değerleri -> değer)"""
+
+    type_name = None
+
+    def __init__(self, name: str, documentation: str, labels: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def expose(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines += self._expose_sample(key, value)
+        return lines
+
+    def _expose_sample(self, key: tuple, value) -> list:
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"]
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [kova sayaçları..., +Inf sayacı, toplam]
+                state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[len(self.buckets)] += 1
+            state[-1] += value
+
+    def _expose_sample(self, key: tuple, state) -> list:
+        lines = []
+        for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+            labels = _format_labels(self.label_names, key, {"le": _format_value(bound)})
+            lines.append(f"{self.name}_bucket{labels} {count}")
+        labels = _format_labels(self.label_names, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(state[-1])}")
+        lines.append(f"{self.name}_count{labels} {state[len(self.buckets)]}")
+        return lines
+
+class MetricsRegistry:
+    """Prometheus metin formatında (text exposition 0.0.4) yayınlanan uygulama metrikleri"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self.http_requests = Counter(
+            "http_requests_total", "HTTP istek sayısı", ("method", "route", "status"))
+        self.http_in_progress = Gauge(
+            "http_requests_in_progress", "İşlenmekte olan HTTP istekleri", ("method",))
+        self.http_duration = Histogram(
+            "http_request_duration_seconds", "HTTP istek süresi (route şablonu bazında)", ("method", "route"))
+        self.outbound_requests = Counter(
+            "outbound_requests_total", "Harici servis çağrıları (Twilio, SMTP, iyzipay)", ("service", "operation", "outcome"))
+        self.outbound_duration = Histogram(
+            "outbound_request_duration_seconds", "Harici servis çağrı süresi", ("service", "operation"))
+        self.metrics = [
+            self.http_requests, self.http_in_progress, self.http_duration,
+            self.outbound_requests, self.outbound_duration,
+        ]
+
+    @contextmanager
+    def time_outbound(self, service: str, operation: str):
+        """Harici servis çağrısının süresini ve sonucunu ölç"""
+        started = time.perf_counter()
+        outcome = "success"
+        try:
+            yield
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            self.outbound_duration.observe(time.perf_counter() - started, service=service, operation=operation)
+            self.outbound_requests.inc(service=service, operation=operation, outcome=outcome)
+
+    def expose(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines += metric.expose()
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
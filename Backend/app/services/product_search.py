@@ -0,0 +1,160 @@
+import re
+from sqlalchemy import text
+
+# Türkçe büyük/küçük harf dönüşümü (Python'un lower() fonksiyonu İ/I için yanlış sonuç verir)
+TURKISH_LOWER = str.maketrans({"İ": "i", "I": "ı"})
+# Aksan katlama: "gömlek", "gomlek" ve "GÖMLEK" aynı terime düşer
+DIACRITIC_FOLD = str.maketrans({
+    "ç": "c", "ğ": "g", "ı": "i", "ö": "o", "ş": "s", "ü": "u",
+    "â": "a", "î": "i", "û": "u",
+})
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Özel isimlere kesme işaretiyle eklenen ekler atılır: "Samsung'un" -> "samsung"
+APOSTROPHE_SUFFIX = re.compile(r"['’][^\s]*")
+
+# Sık kullanılan çoğul ve hal ekleri (katlanmış haliyle, uzundan kısaya)
+TURKISH_SUFFIXES = sorted([
+    "lerinden", "larindan", "lerinde", "larinda", "lerini", "larini", "lerin", "larin",
+    "leri", "lari", "ler", "lar", "nden", "ndan", "inde", "inda", "nin", "nun",
+    "den", "dan", "ten", "tan", "de", "da", "te", "ta", "in", "un", "yi", "yu",
+    "si", "su", "i", "u", "e", "a",
+], key=len, reverse=True)
+MIN_STEM_LENGTH = 3
+
+# Ağırlıklar: ürün adı > kategori > açıklama
+FTS_WEIGHTS = (10.0, 5.0, 1.0)
+
+def fold_turkish(value: str) -> str:
+    """Türkçe kurallarıyla küçült ve aksanları katla"""
+    return (value or "").translate(TURKISH_LOWER).lower().translate(DIACRITIC_FOLD)
+
+def stem(token: str) -> str:
+    """Hafif Türkçe kök bulma: ekler tek tek, kök en az 3 harf kalacak şekilde atılır"""
+    changed = True
+    while changed:
+        changed = False
+        for suffix in TURKISH_SUFFIXES:
+            if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM_LENGTH:
+                token = token[:-len(suffix)]
+                changed = True
+                break
+    return token
+
+def search_terms(value: str) -> list:
+    """Metni arama terimlerine (katlanmış kökler) ayır"""
+    folded = APOSTROPHE_SUFFIX.sub("", fold_turkish(value))
+    return [stem(token) for token in TOKEN_PATTERN.findall(folded)]
+
+def normalize_document(value: str) -> str:
+    return " ".join(search_terms(value))
+
+class ProductSearch:
+    """
+    Ürün tam metin araması.
+    PostgreSQL: products.search_vector (tsvector) + GIN index.
+    SQLite: products_fts (FTS5) sanal tablosu.
+    Normalizasyon (Türkçe küçültme, aksan katlama, kök bulma) her iki veritabanında
+    da Python'da yapılır; böylece unaccent/turkish sözlüğü gerektirmez ve sonuçlar tutarlıdır.
+    """
+
+    REBUILD_BATCH_SIZE = 5000
+
+    def create_index(self, conn):
+        """Arama kolonunu/tablosunu ve index'ini oluştur (migration adımı)"""
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("ALTER TABLE products ADD COLUMN IF NOT EXISTS search_vector tsvector"))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_products_search_vector ON products USING GIN (search_vector)"
+            ))
+        elif conn.dialect.name == "sqlite":
+            conn.execute(text(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS products_fts "
+                "USING fts5(product_name, product_category, product_description)"
+            ))
+        else:
+            return
+        self.rebuild_index(conn)
+
+    def _document(self, product_id, name, category, description) -> dict:
+        return {
+            "id": product_id,
+            "name": normalize_document(name),
+            "category": normalize_document(category),
+            "description": normalize_document(description),
+        }
+
+    def _write(self, conn, documents: list):
+        if not documents:
+            return
+        if conn.dialect.name == "postgresql":
+            conn.execute(text(
+                "UPDATE products SET search_vector = "
+                "setweight(to_tsvector('simple', :name), 'A') || "
+                "setweight(to_tsvector('simple', :category), 'B') || "
+                "setweight(to_tsvector('simple', :description), 'C') "
+                "WHERE id = :id"
+            ), documents)
+        elif conn.dialect.name == "sqlite":
+            conn.execute(text("DELETE FROM products_fts WHERE rowid = :id"), [{"id": d["id"]} for d in documents])
+            conn.execute(text(
+                "INSERT INTO products_fts (rowid, product_name, product_category, product_description) "
+                "VALUES (:id, :name, :category, :description)"
+            ), documents)
+
+    def rebuild_index(self, conn):
+        """Tüm ürünlerin arama dokümanlarını yeniden yaz (parça parça)"""
+        if conn.dialect.name == "sqlite":
+            conn.execute(text("DELETE FROM products_fts"))
+        last_id = 0
+        total = 0
+        while True:
+            rows = conn.execute(text(
+                "SELECT id, product_name, product_category, product_description FROM products "
+                "WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ), {"last_id": last_id, "limit": self.REBUILD_BATCH_SIZE}).all()
+            if not rows:
+                break
+            self._write(conn, [self._document(*row) for row in rows])
+            last_id = rows[-1][0]
+            total += len(rows)
+        return total
+
+    def index_products(self, db, products: list):
+        """Oluşturulan/güncellenen ürünleri aynı transaction içinde indexle"""
+        self._write(db.connection(), [
+            self._document(p.id, p.product_name, p.product_category, p.product_description)
+            for p in products
+        ])
+
+    def remove_products(self, db, product_ids: list):
+        """Silinen ürünleri arama index'inden çıkar (PostgreSQL'de satırla birlikte silinir)"""
+        conn = db.connection()
+        if conn.dialect.name == "sqlite" and product_ids:
+            conn.execute(text("DELETE FROM products_fts WHERE rowid = :id"), [{"id": i} for i in product_ids])
+
+    def search_statement(self, dialect_name: str, query: str, limit: int, offset: int):
+        """Sıralı (rank, id) ürün id'lerini döndüren sorgu; arama terimi yoksa None"""
+        terms = search_terms(query)
+        if not terms:
+            return None
+        params = {"limit": limit, "offset": offset}
+        if dialect_name == "postgresql":
+            # Her terim önek olarak eşleşir: "telefo" -> "telefon"
+            params["query"] = " & ".join(f"{term}:*" for term in terms)
+            return text(
+                "SELECT id FROM products, to_tsquery('simple', :query) AS q "
+                "WHERE search_vector @@ q "
+                "ORDER BY ts_rank_cd(search_vector, q) DESC, id "
+                "LIMIT :limit OFFSET :offset"
+            ).bindparams(**params)
+        if dialect_name == "sqlite":
+            params["query"] = " ".join(f'"{term}"*' for term in terms)
+            # bm25 küçük değer daha alakalıdır
+            return text(
+                "SELECT rowid AS id FROM products_fts WHERE products_fts MATCH :query "
+                f"ORDER BY bm25(products_fts, {', '.join(str(w) for w in FTS_WEIGHTS)}), rowid "
+                "LIMIT :limit OFFSET :offset"
+            ).bindparams(**params)
+        raise ValueError(f"Tam metin arama desteklenmiyor: {dialect_name}")
+
+product_search = ProductSearch()
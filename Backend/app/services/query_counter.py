@@ -0,0 +1,129 @@
+import os
+import time
+from contextvars import ContextVar
+from sqlalchemy import event
+from dotenv import load_dotenv
+
+# Environment variables'ları yükle
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+load_dotenv(os.path.join(BASE_DIR, "config.env"))
+
+class QueryBudgetExceeded(RuntimeError):
+    """Bir istek izin verilen SQL sorgu sayısını aştığında (raise modunda) fırlatılır"""
+
+class RequestQueryStats:
+    """Tek bir isteğin SQL sayacı"""
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.count = 0
+        self.db_time = 0.0
+        self.budget_reported = False
+
+    @property
+    def route_key(self) -> str:
+        # Route eşleşmesi endpoint çalışmadan önce yapıldığı için sorgu anında şablon bellidir
+        route = self.scope.get("route")
+        path = route.path if route is not None else self.scope.get("path", "")
+        return f"{self.scope.get('method', '')} {path}"
+
+_current_stats: ContextVar = ContextVar("request_query_stats", default=None)
+
+class QueryCounter:
+    """İstek başına SQL sorgu sayısı ve veritabanı süresi (N+1 tespiti için)"""
+
+    def __init__(self):
+        # 0 = bütçe kontrolü kapalı
+        self.default_budget = int(os.getenv("DB_QUERY_BUDGET", "0"))
+        # Route bazlı bütçeler: "GET /seller_orders/{seller_id}=5,GET /products=2"
+        self.route_budgets = {}
+        for item in os.getenv("DB_QUERY_BUDGETS", "").split(","):
+            if "=" in item:
+                route_key, budget = item.rsplit("=", 1)
+                self.route_budgets[route_key.strip()] = int(budget)
+        # log: aşımı logla, raise: sorguyu QueryBudgetExceeded ile durdur
+        self.mode = os.getenv("DB_QUERY_BUDGET_MODE", "log").lower()
+
+    def install(self, engines):
+        """Engine'lere sorgu dinleyicilerini ekle"""
+        for eng in engines:
+            event.listen(eng, "before_cursor_execute", self._before_execute)
+            event.listen(eng, "after_cursor_execute", self._after_execute)
+            event.listen(eng, "handle_error", self._on_error)
+
+    def start(self, scope: dict):
+        stats = RequestQueryStats(scope)
+        return stats, _current_stats.set(stats)
+
+    def stop(self, token):
+        _current_stats.reset(token)
+
+    def count_stream(self, iterator):
+        """
+        StreamingResponse gövdesindeki sorguları isteğin sayacına ekle.
+        X-DB-Queries header'ı gövdeden önce gönderildiği için bu sorguları içermez;
+        sadece bütçe kontrolü (log/raise) gövde bittiğinde yapılır.
+        """
+        stats = _current_stats.get()
+        if stats is None:
+            return iterator
+
+        def counted():
+            # Gövde her parçada farklı bir thread/context'te ilerleyebilir; sayaç her adımda bağlanır
+            try:
+                while True:
+                    token = _current_stats.set(stats)
+                    try:
+                        chunk = next(iterator)
+                    except StopIteration:
+                        return
+                    finally:
+                        _current_stats.reset(token)
+                    yield chunk
+            finally:
+                self.check_budget(stats)
+        return counted()
+
+    def current_route_key(self):
+        """Şu an işlenen isteğin route şablonu (istek dışında None)"""
+        stats = _current_stats.get()
+        return stats.route_key if stats is not None else None
+
+    def budget_for(self, route_key: str) -> int:
+        return self.route_budgets.get(route_key, self.default_budget)
+
+    def check_budget(self, stats: RequestQueryStats):
+        """İstek sonunda bütçe aşımını logla"""
+        budget = self.budget_for(stats.route_key)
+        if budget and stats.count > budget and not stats.budget_reported:
+            stats.budget_reported = True
+            print(f"⚠️ Sorgu bütçesi aşıldı: {stats.route_key} -> {stats.count} sorgu (bütçe {budget})")
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        if stats is None:
+            return
+        stats.count += 1
+        if self.mode == "raise":
+            budget = self.budget_for(stats.route_key)
+            if budget and stats.count > budget:
+                stats.budget_reported = True
+                raise QueryBudgetExceeded(
+                    f"{stats.route_key} sorgu bütçesini aştı ({stats.count} > {budget}): {statement[:200]}"
+                )
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        started = conn.info.get("query_started_at")
+        if stats is None or not started:
+            return
+        stats.db_time += time.perf_counter() - started.pop()
+
+    def _on_error(self, context):
+        # Hata veren sorgu after_cursor_execute'a ulaşmaz; başlangıç zamanını yine de düşür
+        conn = context.connection
+        if _current_stats.get() is not None and conn is not None and conn.info.get("query_started_at"):
+            conn.info["query_started_at"].pop()
+
+query_counter = QueryCounter()
@@ -0,0 +1,131 @@
+from sqlalchemy import text, bindparam
+
+RATING_STARS = (1, 2, 3, 4, 5)
+
+# Sayaç tutulan tablo -> seller_reviews'taki anahtar kolonu
+RATED_TABLES = {
+    "products": "product_id",
+    "sellers": "seller_id",
+}
+
+def histogram_column(star: int) -> str:
+    return f"rating_{star}"
+
+def rating_average(rating_sum, rating_count):
+    if not rating_count:
+        return None
+    return round(rating_sum / rating_count, 2)
+
+def rating_summary(obj) -> dict:
+    """Ürün veya satıcı satırındaki sayaçlardan puan özeti (ek sorgu gerektirmez)"""
+    rating_sum = obj.rating_sum or 0
+    rating_count = obj.rating_count or 0
+    return {
+        "average": rating_average(rating_sum, rating_count),
+        "count": rating_count,
+        "histogram": {str(star): getattr(obj, histogram_column(star)) or 0 for star in RATING_STARS},
+    }
+
+class RatingAggregates:
+    """
+    products ve sellers üzerindeki rating_sum, rating_count ve yıldız histogramı (rating_1..rating_5).
+    Değerlendirme yazımlarıyla aynı transaction'da artımlı güncellenir (UPDATE x = x + :delta);
+    rebuild() tüm sayaçları seller_reviews'tan yeniden hesaplar.
+    """
+
+    def _apply(self, db, table: str, row_id: int, deltas: dict):
+        """Tek satırın sayaçlarına delta ekle ({"rating_sum": 4, "rating_count": 1, "rating_4": 1})"""
+        deltas = {column: delta for column, delta in deltas.items() if delta}
+        if row_id is None or not deltas:
+            return
+        assignments = ", ".join(
+            f"{column} = COALESCE({column}, 0) + :{column}" for column in deltas
+        )
+        db.execute(text(f"UPDATE {table} SET {assignments} WHERE id = :id"), {**deltas, "id": row_id})
+
+    def record_change(self, db, product_id: int, seller_id: int, old_rating: int = None, new_rating: int = None):
+        """Değerlendirme eklendi (old=None), güncellendi veya silindi (new=None)"""
+        if old_rating == new_rating:
+            return
+        deltas = {
+            "rating_sum": (new_rating or 0) - (old_rating or 0),
+            "rating_count": (new_rating is not None) - (old_rating is not None),
+        }
+        if old_rating is not None:
+            deltas[histogram_column(old_rating)] = -1
+        if new_rating is not None:
+            deltas[histogram_column(new_rating)] = 1
+        self._apply(db, "products", product_id, deltas)
+        self._apply(db, "sellers", seller_id, deltas)
+
+    def withdraw_products(self, db, product_ids: list, owner_id: int = None):
+        """Silinecek ürünlerin değerlendirmelerini (CASCADE ile silinir) satıcı sayaçlarından düş"""
+        if not product_ids:
+            return
+        # owner_id verilirse sadece o satıcıya ait ürünler (toplu silmeyle aynı koşul)
+        owner_filter = " AND p.seller_id = :owner_id" if owner_id is not None else ""
+        rows = db.execute(
+            text(
+                "SELECT r.seller_id, r.rating, COUNT(*) FROM seller_reviews r "
+                "JOIN products p ON p.id = r.product_id "
+                f"WHERE p.id IN :product_ids{owner_filter} AND r.seller_id IS NOT NULL "
+                "GROUP BY r.seller_id, r.rating"
+            ).bindparams(bindparam("product_ids", expanding=True)),
+            {"product_ids": list(product_ids), "owner_id": owner_id},
+        ).all()
+        for seller_id, deltas in self._withdrawals(rows).items():
+            self._apply(db, "sellers", seller_id, deltas)
+
+    def withdraw_reviewer(self, db, user_id: int):
+        """Silinecek kullanıcının değerlendirmelerini (CASCADE ile silinir) ürün ve satıcı sayaçlarından düş"""
+        for table, key in RATED_TABLES.items():
+            rows = db.execute(
+                text(
+                    f"SELECT {key}, rating, COUNT(*) FROM seller_reviews "
+                    f"WHERE user_id = :user_id AND {key} IS NOT NULL GROUP BY {key}, rating"
+                ),
+                {"user_id": user_id},
+            ).all()
+            for row_id, deltas in self._withdrawals(rows).items():
+                self._apply(db, table, row_id, deltas)
+
+    def _withdrawals(self, rows) -> dict:
+        """(satır id, puan, adet) gruplarından satır başına eksi deltalar"""
+        per_row = {}
+        for row_id, rating, count in rows:
+            deltas = per_row.setdefault(row_id, {"rating_sum": 0, "rating_count": 0})
+            deltas["rating_sum"] -= (rating or 0) * count
+            deltas["rating_count"] -= count
+            if rating in RATING_STARS:
+                deltas[histogram_column(rating)] = deltas.get(histogram_column(rating), 0) - count
+        return per_row
+
+    def _actual(self, table: str, key: str) -> dict:
+        """seller_reviews'tan hesaplanan gerçek değerler (ilişkili alt sorgular)"""
+        source = f"FROM seller_reviews r WHERE r.{key} = {table}.id"
+        actual = {
+            "rating_sum": f"(SELECT COALESCE(SUM(r.rating), 0) {source})",
+            "rating_count": f"(SELECT COUNT(*) {source})",
+        }
+        for star in RATING_STARS:
+            actual[histogram_column(star)] = f"(SELECT COUNT(*) {source} AND r.rating = {star})"
+        return actual
+
+    def count_drift(self, conn) -> dict:
+        """Sayaçları gerçek değerlerden farklı olan satır sayısı (tablo bazında)"""
+        drift = {}
+        for table, key in RATED_TABLES.items():
+            actual = self._actual(table, key)
+            condition = " OR ".join(f"COALESCE({column}, 0) <> {value}" for column, value in actual.items())
+            drift[table] = conn.execute(text(f"SELECT COUNT(*) FROM {table} WHERE {condition}")).scalar()
+        return drift
+
+    def rebuild(self, conn) -> dict:
+        """Tüm sayaçları sıfırdan yeniden hesapla (migration ve uzlaştırma komutu)"""
+        updated = {}
+        for table, key in RATED_TABLES.items():
+            assignments = ", ".join(f"{column} = {value}" for column, value in self._actual(table, key).items())
+            updated[table] = conn.execute(text(f"UPDATE {table} SET {assignments}")).rowcount
+        return updated
+
+rating_aggregates = RatingAggregates()
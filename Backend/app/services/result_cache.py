@@ -0,0 +1,54 @@
+import threading
+import time
+from collections import OrderedDict
+
+class ResultCache:
+    """
+    Küçük, süreli (TTL) ve boyut sınırlı sonuç önbelleği.
+    invalidate() tüm kayıtları geçersiz kılar; yazma işlemlerinden sonra çağrılır.
+    Diğer worker'lardaki yazımlar TTL dolunca görünür.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                generation, stored_at, value = entry
+                if generation == self._generation and time.monotonic() - stored_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def generation(self) -> int:
+        return self._generation
+
+    def set(self, key, value, generation: int = None):
+        """Sonucu sakla; hesaplama sırasında invalidate() olduysa (eski nesil) saklamaz"""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (self._generation, time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses, "generation": self._generation}
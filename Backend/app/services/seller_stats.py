@@ -0,0 +1,529 @@
+from contextlib import contextmanager
+from datetime import datetime
+from sqlalchemy import select, func, case, text, delete, insert, bindparam
+import app.models as models
+
+# Panelde ayrı sayılan sipariş durumları
+STAT_STATUSES = ("pending", "processing", "shipped", "delivered")
+
+# Ciroya dahil edilmeyen sipariş durumu
+CANCELLED_STATUS = "cancelled"
+
+# seller_stat_counts.kind değerleri (seller_stats.top_<kind>_* kolonlarına karşılık gelir)
+STAT_COUNT_KINDS = ("customer", "product")
+
+NO_CUSTOMER = "Henüz müşteri yok"
+NO_SALES = "Henüz satış yok"
+
+# Etkilenen siparişlerin katkısı bu büyüklükte parçalarla okunur (IN listesi sınırı)
+STATS_ORDER_CHUNK = 500
+
+# seller_stats'ta sayaç olarak tutulan kolonlar (artımlı güncellenir)
+COUNTER_COLUMNS = ("total_products", "total_orders") + tuple(f"{status}_orders" for status in STAT_STATUSES) + ("revenue",)
+
+def seller_items(seller_id: int):
+    """Satıcının ürünlerine ait sipariş kalemleri (users_order satırları)"""
+    return (
+        select(models.UsersOrder.id, models.UsersOrder.order_id, models.UsersOrder.product_id)
+        .join(models.Product, models.Product.id == models.UsersOrder.product_id)
+        .where(models.Product.seller_id == seller_id)
+    )
+
+class SellerStatistics:
+    """
+    Satıcı paneli istatistikleri, satıcının sipariş hacminden bağımsız sayıda GROUP BY sorgusuyla.
+    Tanımlar önceki döngü tabanlı hesaplamayla aynıdır:
+    - sipariş sayıları: satıcının ürününü içeren tekil siparişler
+    - en çok satın alan müşteri: siparişin ilk kalemindeki kullanıcı, satıcının kalem sayısıyla
+    - en çok satılan ürün: ürün adına göre kalem sayısı
+    Eşitlikte ilk sipariş kalemi (en küçük users_order id) önce gelen kazanır.
+    """
+
+    def order_counts(self, db, seller_id: int) -> dict:
+        """Ürün ve sipariş sayıları ile ciro (iptal edilmemiş siparişlerdeki kalemlerin fiyat toplamı)"""
+        total_products = db.execute(
+            select(func.count()).select_from(models.Product).where(models.Product.seller_id == seller_id)
+        ).scalar()
+
+        items = seller_items(seller_id).subquery()
+        order_ids = select(items.c.order_id).distinct()
+        total_orders, *counts = db.execute(
+            select(
+                func.count(),
+                *[func.coalesce(func.sum(case((models.Order.order_status == status, 1), else_=0)), 0)
+                  for status in STAT_STATUSES],
+            ).where(models.Order.id.in_(order_ids))
+        ).one()
+
+        revenue = db.execute(
+            select(func.coalesce(func.sum(models.Product.product_price), 0))
+            .select_from(items)
+            .join(models.Product, models.Product.id == items.c.product_id)
+            .join(models.Order, models.Order.id == items.c.order_id)
+            .where(func.coalesce(models.Order.order_status, "") != CANCELLED_STATUS)
+        ).scalar()
+
+        counters = {"total_products": total_products, "total_orders": total_orders}
+        counters.update({f"{status}_orders": count for status, count in zip(STAT_STATUSES, counts)})
+        counters["revenue"] = round(revenue or 0, 2)
+        return counters
+
+    def customer_counts(self, db, seller_id: int, limit: int = None) -> list:
+        """Müşteri adına göre kalem sayıları: (ad, sayı, ilk kalem id), çoktan aza"""
+        items = seller_items(seller_id).subquery()
+        # Sipariş başına satıcının kalem sayısı; müşteri, siparişin (tüm satıcılar dahil) ilk kalemindeki kullanıcıdır
+        per_order = (
+            select(items.c.order_id, func.count().label("item_count"), func.min(items.c.id).label("first_seller_item"))
+            .group_by(items.c.order_id)
+            .subquery()
+        )
+        first_item = models.UsersOrder.__table__.alias("first_item")
+        first_item_id = (
+            select(func.min(models.UsersOrder.id))
+            .where(models.UsersOrder.order_id == per_order.c.order_id)
+            .scalar_subquery()
+        )
+        order_count = func.sum(per_order.c.item_count)
+        first_seller_item = func.min(per_order.c.first_seller_item)
+        return db.execute(
+            select(models.User.name_surname, order_count, first_seller_item)
+            .select_from(per_order)
+            .join(first_item, first_item.c.id == first_item_id)
+            .join(models.User, models.User.id == first_item.c.user_id)
+            .group_by(models.User.name_surname)
+            .order_by(order_count.desc(), first_seller_item)
+            .limit(limit)
+        ).all()
+
+    def product_counts(self, db, seller_id: int, limit: int = None) -> list:
+        """Ürün adına göre kalem sayıları: (ad, sayı, ilk kalem id), çoktan aza"""
+        items = seller_items(seller_id).subquery()
+        first_item = func.min(items.c.id)
+        return db.execute(
+            select(models.Product.product_name, func.count(), first_item)
+            .select_from(items)
+            .join(models.Product, models.Product.id == items.c.product_id)
+            .group_by(models.Product.product_name)
+            .order_by(func.count().desc(), first_item)
+            .limit(limit)
+        ).all()
+
+    def compute(self, db, seller_id: int) -> dict:
+        counters = self.order_counts(db, seller_id)
+        customers = self.customer_counts(db, seller_id, limit=1)
+        products = self.product_counts(db, seller_id, limit=1)
+        return format_statistics(
+            counters,
+            customers[0] if customers else None,
+            products[0] if products else None,
+        )
+
+def format_statistics(counters: dict, top_customer, top_product) -> dict:
+    """Panel yanıtı; top_* (ad, sayı) çifti veya None"""
+    statistics = {column: counters.get(column) or 0 for column in COUNTER_COLUMNS}
+    statistics["revenue"] = round(statistics["revenue"], 2)
+    statistics["favorite_customer"] = {
+        "name": top_customer[0] if top_customer else NO_CUSTOMER,
+        "order_count": top_customer[1] if top_customer else 0,
+    }
+    statistics["best_selling_product"] = {
+        "name": top_product[0] if top_product else NO_SALES,
+        "sales_count": top_product[1] if top_product else 0,
+    }
+    return statistics
+
+seller_statistics = SellerStatistics()
+
+class SellerStatsTable:
+    """
+    seller_stats tablosu: panel tek primary key okumasıyla döner.
+    - ürün ekleme ve sipariş kalemi ekleme: sayaçlar UPSERT ile artırılır (x = x + :delta)
+    - sipariş durumu değişikliği: eski/yeni durum sayaçları ve ciro kaydırılır
+    - en çok satın alan müşteri / satılan ürün: seller_stat_counts'ta ad bazında sayılır, sayı sadece
+      arttığı için yeni değer mevcut lideri geçerse lider güncellenir
+    - kalemleri değiştiren/silen diğer yazımlar (ürün güncelleme/silme, sipariş/kalem/kullanıcı silme...):
+      changing() etkilenen siparişlerin satıcı katkısını yazımdan önce ve sonra okur, farkı uygular
+    rebuild() gece çalışan uzlaştırma komutudur (artımlı güncellemelerde oluşabilecek sapmalar burada düzelir).
+    """
+
+    def _apply(self, db, seller_id: int, deltas: dict):
+        """Satıcı satırına delta ekle (satır yoksa oluşturulur)"""
+        self._apply_many(db, {seller_id: deltas})
+
+    def _apply_many(self, db, deltas_by_seller: dict):
+        """Birden fazla satıcıya tek executemany ile delta ekle"""
+        deltas_by_seller = {seller_id: deltas for seller_id, deltas in deltas_by_seller.items() if seller_id is not None}
+        if not deltas_by_seller:
+            return
+        columns = sorted({column for deltas in deltas_by_seller.values() for column in deltas}) or ["total_products"]
+        values = ", ".join(f":{column}" for column in columns)
+        assignments = ", ".join(f"{column} = COALESCE(seller_stats.{column}, 0) + excluded.{column}" for column in columns)
+        updated_at = datetime.utcnow()
+        db.execute(
+            text(
+                f"INSERT INTO seller_stats (seller_id, {', '.join(columns)}, updated_at) VALUES (:seller_id, {values}, :updated_at) "
+                f"ON CONFLICT (seller_id) DO UPDATE SET {assignments}, updated_at = excluded.updated_at"
+            ),
+            [
+                {**{column: deltas.get(column, 0) for column in columns}, "seller_id": seller_id, "updated_at": updated_at}
+                for seller_id, deltas in deltas_by_seller.items()
+            ],
+        )
+
+    def _count(self, db, seller_id: int, kind: str, name: str, item_id: int):
+        """Ad sayacını bir artır; mevcut lideri geçerse (eşitlikte ilk kalem önce) lideri güncelle"""
+        if name is None:
+            return
+        count, first_item = db.execute(
+            text(
+                "INSERT INTO seller_stat_counts (seller_id, kind, name, count, first_item) "
+                "VALUES (:seller_id, :kind, :name, 1, :item_id) "
+                "ON CONFLICT (seller_id, kind, name) DO UPDATE SET count = seller_stat_counts.count + 1 "
+                "RETURNING count, first_item"
+            ),
+            {"seller_id": seller_id, "kind": kind, "name": name, "item_id": item_id},
+        ).one()
+        db.execute(
+            text(
+                f"UPDATE seller_stats SET top_{kind}_name = :name, top_{kind}_count = :count, "
+                f"top_{kind}_first_item = :first_item WHERE seller_id = :seller_id AND ("
+                f"top_{kind}_name IS NULL OR top_{kind}_name = :name OR top_{kind}_count < :count "
+                f"OR (top_{kind}_count = :count AND top_{kind}_first_item > :first_item))"
+            ),
+            {"seller_id": seller_id, "name": name, "count": count, "first_item": first_item},
+        )
+
+    def products_added(self, db, seller_id: int, count: int = 1):
+        self._apply(db, seller_id, {"total_products": count})
+
+    def products_removed(self, db, seller_id: int, count: int = 1):
+        self._apply(db, seller_id, {"total_products": -count})
+
+    def item_added(self, db, item_id: int):
+        """Yeni sipariş kalemi (flush edilmiş users_order satırı)"""
+        row = db.execute(
+            text(
+                "SELECT p.seller_id, p.product_name, p.product_price, o.id AS order_id, o.order_status, "
+                "(SELECT COUNT(*) FROM users_order x JOIN products xp ON xp.id = x.product_id "
+                " WHERE x.order_id = uo.order_id AND xp.seller_id = p.seller_id) AS seller_items, "
+                "(SELECT u.name_surname FROM users_order f JOIN users u ON u.id = f.user_id "
+                " WHERE f.order_id = uo.order_id ORDER BY f.id LIMIT 1) AS customer "
+                'FROM users_order uo JOIN products p ON p.id = uo.product_id '
+                'LEFT JOIN "order" o ON o.id = uo.order_id WHERE uo.id = :item_id'
+            ),
+            {"item_id": item_id},
+        ).first()
+        if row is None or row.seller_id is None:
+            return
+
+        deltas = {}
+        if row.order_id is not None:
+            # Satıcının bu siparişteki ilk kalemi: sipariş sayısı ve durum sayacı artar
+            if row.seller_items == 1:
+                deltas["total_orders"] = 1
+                if row.order_status in STAT_STATUSES:
+                    deltas[f"{row.order_status}_orders"] = 1
+            if row.order_status != CANCELLED_STATUS:
+                deltas["revenue"] = row.product_price or 0
+        self._apply(db, row.seller_id, deltas)
+
+        if row.order_id is not None:
+            self._count(db, row.seller_id, "customer", row.customer, item_id)
+        self._count(db, row.seller_id, "product", row.product_name, item_id)
+
+    def status_changed(self, db, order_id: int, old_status: str, new_status: str):
+        """Sipariş durumu değişti: siparişte ürünü olan her satıcının durum sayaçları ve cirosu"""
+        if old_status == new_status:
+            return
+        rows = db.execute(
+            text(
+                "SELECT p.seller_id, SUM(p.product_price) FROM users_order uo "
+                "JOIN products p ON p.id = uo.product_id "
+                "WHERE uo.order_id = :order_id AND p.seller_id IS NOT NULL GROUP BY p.seller_id"
+            ),
+            {"order_id": order_id},
+        ).all()
+        revenue_sign = (new_status != CANCELLED_STATUS) - (old_status != CANCELLED_STATUS)
+        for seller_id, price_total in rows:
+            deltas = {"revenue": revenue_sign * (price_total or 0)}
+            if old_status in STAT_STATUSES:
+                deltas[f"{old_status}_orders"] = -1
+            if new_status in STAT_STATUSES:
+                deltas[f"{new_status}_orders"] = deltas.get(f"{new_status}_orders", 0) + 1
+            self._apply(db, seller_id, deltas)
+
+    @contextmanager
+    def changing(self, db, product_ids=(), item_ids=(), user_ids=(), order_ids=()):
+        """
+        Sipariş kalemlerini etkileyen yazım (CASCADE silmeler dahil): seçilen kalemlerin siparişlerindeki
+        satıcı katkıları yazımdan önce ve sonra okunur, fark sayaçlara ve ad sayaçlarına uygulanır.
+        Maliyet etkilenen siparişlerin kalem sayısıyla orantılıdır, satıcının tüm geçmişiyle değil.
+        """
+        selectors = [
+            (column, list(ids))
+            for column, ids in (("product_id", product_ids), ("id", item_ids), ("user_id", user_ids))
+            if ids
+        ]
+        orders = {order_id for order_id in order_ids if order_id is not None}
+        for column, ids in selectors:
+            orders.update(db.execute(
+                text(f"SELECT DISTINCT order_id FROM users_order WHERE {column} IN :ids AND order_id IS NOT NULL")
+                .bindparams(bindparam("ids", expanding=True)),
+                {"ids": ids},
+            ).scalars())
+        orders = sorted(orders)
+        before = self._contributions(db, orders, selectors)
+        yield
+        db.flush()
+        after = self._contributions(db, orders, selectors)
+        self._apply_difference(db, before, after)
+
+    def _contributions(self, db, order_ids: list, selectors: list) -> tuple:
+        """Siparişlerin (ve seçilen siparişsiz kalemlerin) satıcı başına sayaçları ve ad sayaçları"""
+        counters, names = {}, {}
+
+        def add_name(seller_id, kind, name, count, first_item):
+            if name is None:
+                return
+            current = names.get((seller_id, kind, name))
+            names[(seller_id, kind, name)] = (
+                (count, first_item) if current is None else (current[0] + count, min(current[1], first_item))
+            )
+
+        for start in range(0, len(order_ids), STATS_ORDER_CHUNK):
+            params = {"orders": order_ids[start:start + STATS_ORDER_CHUNK]}
+            # Müşteri: siparişin (tüm satıcılar dahil) ilk kalemindeki kullanıcı
+            rows = db.execute(
+                text(
+                    "SELECT p.seller_id, o.order_status, COUNT(*) AS items, SUM(p.product_price) AS price_total, "
+                    "MIN(uo.id) AS first_item, (SELECT u.name_surname FROM users u WHERE u.id = "
+                    "(SELECT f.user_id FROM users_order f WHERE f.order_id = o.id ORDER BY f.id LIMIT 1)) AS customer "
+                    'FROM users_order uo JOIN products p ON p.id = uo.product_id JOIN "order" o ON o.id = uo.order_id '
+                    "WHERE uo.order_id IN :orders AND p.seller_id IS NOT NULL "
+                    "GROUP BY p.seller_id, o.id, o.order_status"
+                ).bindparams(bindparam("orders", expanding=True)),
+                params,
+            ).all()
+            for row in rows:
+                seller = counters.setdefault(row.seller_id, {})
+                seller["total_orders"] = seller.get("total_orders", 0) + 1
+                if row.order_status in STAT_STATUSES:
+                    column = f"{row.order_status}_orders"
+                    seller[column] = seller.get(column, 0) + 1
+                if row.order_status != CANCELLED_STATUS:
+                    seller["revenue"] = seller.get("revenue", 0) + (row.price_total or 0)
+                add_name(row.seller_id, "customer", row.customer, row.items, row.first_item)
+
+            for seller_id, name, count, first_item in db.execute(
+                text(
+                    "SELECT p.seller_id, p.product_name, COUNT(*), MIN(uo.id) FROM users_order uo "
+                    "JOIN products p ON p.id = uo.product_id "
+                    "WHERE uo.order_id IN :orders AND p.seller_id IS NOT NULL GROUP BY p.seller_id, p.product_name"
+                ).bindparams(bindparam("orders", expanding=True)),
+                params,
+            ):
+                add_name(seller_id, "product", name, count, first_item)
+
+        # Siparişsiz kalemler sadece ürün sayacına girer
+        for column, ids in selectors:
+            for seller_id, name, count, first_item in db.execute(
+                text(
+                    "SELECT p.seller_id, p.product_name, COUNT(*), MIN(uo.id) FROM users_order uo "
+                    "JOIN products p ON p.id = uo.product_id "
+                    f"WHERE uo.order_id IS NULL AND uo.{column} IN :ids AND p.seller_id IS NOT NULL "
+                    "GROUP BY p.seller_id, p.product_name"
+                ).bindparams(bindparam("ids", expanding=True)),
+                {"ids": ids},
+            ):
+                add_name(seller_id, "product", name, count, first_item)
+        return counters, names
+
+    def _apply_difference(self, db, before: tuple, after: tuple):
+        """Önceki/sonraki katkı farkını uygula; satıcı sayısından bağımsız sayıda sorguyla"""
+        (counters_before, names_before), (counters_after, names_after) = before, after
+        deltas_by_seller = {}
+        for seller_id in set(counters_before) | set(counters_after):
+            old, new = counters_before.get(seller_id, {}), counters_after.get(seller_id, {})
+            deltas = {column: new.get(column, 0) - old.get(column, 0) for column in set(old) | set(new)}
+            deltas = {column: delta for column, delta in deltas.items() if delta}
+            if deltas:
+                deltas_by_seller[seller_id] = deltas
+
+        changes = {
+            key: (names_before.get(key), names_after.get(key))
+            for key in set(names_before) | set(names_after)
+            if names_before.get(key) != names_after.get(key)
+        }
+        sellers = sorted({seller_id for seller_id, _, _ in changes})
+        # Satıcı satırı yoksa önce oluşturulur (lider güncellemesi satırı bulabilsin)
+        for seller_id in sellers:
+            deltas_by_seller.setdefault(seller_id, {})
+        self._apply_many(db, deltas_by_seller)
+        if changes:
+            self._shift_names(db, sellers, changes)
+
+    def _shift_names(self, db, sellers: list, changes: dict):
+        """Ad sayaçlarına (önceki, sonraki) katkı farkını uygula, liderleri koru"""
+        names = sorted({name for _, _, name in changes})
+        stored = {
+            (seller_id, kind, name): (count, first_item)
+            for seller_id, kind, name, count, first_item in db.execute(
+                text(
+                    "SELECT seller_id, kind, name, count, first_item FROM seller_stat_counts "
+                    "WHERE seller_id IN :sellers AND name IN :names"
+                ).bindparams(bindparam("sellers", expanding=True), bindparam("names", expanding=True)),
+                {"sellers": sellers, "names": names},
+            )
+        }
+        results, removed, upserts = {}, [], []
+        for key, (old, new) in changes.items():
+            seller_id, kind, name = key
+            count, first_item = stored.get(key, (0, None))
+            count += (new[0] if new else 0) - (old[0] if old else 0)
+            if count <= 0:
+                results[key] = None
+                removed.append({"seller_id": seller_id, "kind": kind, "name": name})
+                continue
+            if old and first_item == old[1] and not (new and new[1] <= old[1]):
+                # Adın ilk kalemi etkilenen siparişlerden gitti; kalanların en küçüğü bilinmiyor
+                first_item = self._first_item(db, seller_id, kind, name)
+            else:
+                first_item = min((item for item in (first_item, new[1] if new else None) if item is not None), default=None)
+            results[key] = (count, first_item)
+            upserts.append({"seller_id": seller_id, "kind": kind, "name": name, "count": count, "first_item": first_item})
+        if removed:
+            db.execute(
+                text("DELETE FROM seller_stat_counts WHERE seller_id = :seller_id AND kind = :kind AND name = :name"),
+                removed,
+            )
+        if upserts:
+            db.execute(
+                text(
+                    "INSERT INTO seller_stat_counts (seller_id, kind, name, count, first_item) "
+                    "VALUES (:seller_id, :kind, :name, :count, :first_item) "
+                    "ON CONFLICT (seller_id, kind, name) DO UPDATE SET count = excluded.count, first_item = excluded.first_item"
+                ),
+                upserts,
+            )
+
+        def rank(count, first_item):
+            return (-(count or 0), first_item if first_item is not None else float("inf"))
+
+        leaders = {}
+        columns = ", ".join(f"top_{kind}_name, top_{kind}_count, top_{kind}_first_item" for kind in STAT_COUNT_KINDS)
+        for seller_id, *values in db.execute(
+            text(f"SELECT seller_id, {columns} FROM seller_stats WHERE seller_id IN :sellers")
+            .bindparams(bindparam("sellers", expanding=True)),
+            {"sellers": sellers},
+        ):
+            for i, kind in enumerate(STAT_COUNT_KINDS):
+                if values[3 * i] is not None:
+                    leaders[(seller_id, kind)] = tuple(values[3 * i:3 * i + 3])
+
+        updates = {kind: [] for kind in STAT_COUNT_KINDS}
+        for seller_id, kind in sorted({(seller_id, kind) for seller_id, kind, _ in changes}):
+            stored_leader = leader = leaders.get((seller_id, kind))
+            if leader is not None and (seller_id, kind, leader[0]) in results:
+                current = results[(seller_id, kind, leader[0])]
+                if current is None or rank(*current) > rank(*leader[1:]):
+                    # Lider geriledi; dokunulmayan adlardan biri önüne geçmiş olabilir
+                    leader = db.execute(
+                        text(
+                            "SELECT name, count, first_item FROM seller_stat_counts WHERE seller_id = :seller_id "
+                            "AND kind = :kind ORDER BY count DESC, first_item LIMIT 1"
+                        ),
+                        {"seller_id": seller_id, "kind": kind},
+                    ).first()
+                    leader = tuple(leader) if leader is not None else None
+                else:
+                    leader = (leader[0], *current)
+            for (key_seller, key_kind, name), value in results.items():
+                if key_seller == seller_id and key_kind == kind and value is not None:
+                    if leader is None or rank(*value) < rank(*leader[1:]):
+                        leader = (name, *value)
+            leader = leader or (None, 0, None)
+            if leader != (stored_leader or (None, 0, None)):
+                updates[kind].append({"seller_id": seller_id, "name": leader[0], "count": leader[1], "first_item": leader[2]})
+        for kind, rows in updates.items():
+            if rows:
+                db.execute(
+                    text(
+                        f"UPDATE seller_stats SET top_{kind}_name = :name, top_{kind}_count = :count, "
+                        f"top_{kind}_first_item = :first_item WHERE seller_id = :seller_id"
+                    ),
+                    rows,
+                )
+
+    def _first_item(self, db, seller_id: int, kind: str, name: str):
+        """Adın satıcıdaki ilk kalemi (nadir yol: ilk kalem silindiğinde)"""
+        if kind == "product":
+            condition = "p.product_name = :name"
+        else:
+            condition = (
+                "(SELECT u.name_surname FROM users u WHERE u.id = "
+                "(SELECT f.user_id FROM users_order f WHERE f.order_id = uo.order_id ORDER BY f.id LIMIT 1)) = :name"
+            )
+        return db.execute(
+            text(
+                "SELECT MIN(uo.id) FROM users_order uo JOIN products p ON p.id = uo.product_id "
+                f"WHERE p.seller_id = :seller_id AND {condition}"
+            ),
+            {"seller_id": seller_id, "name": name},
+        ).scalar()
+
+    def refresh(self, db, seller_id: int, write: bool = True) -> bool:
+        """Satıcının satırını ve ad sayaçlarını sıfırdan hesapla; kayıtlı değerden farklıysa True"""
+        counters = seller_statistics.order_counts(db, seller_id)
+        names = {
+            "customer": seller_statistics.customer_counts(db, seller_id),
+            "product": seller_statistics.product_counts(db, seller_id),
+        }
+        values = dict(counters)
+        for kind in STAT_COUNT_KINDS:
+            top = names[kind][0] if names[kind] else (None, 0, None)
+            values.update({f"top_{kind}_name": top[0], f"top_{kind}_count": top[1], f"top_{kind}_first_item": top[2]})
+
+        stored = db.execute(
+            select(*[getattr(models.SellerStats, column) for column in values])
+            .where(models.SellerStats.seller_id == seller_id)
+        ).first()
+        drifted = stored is None or any(
+            (round(current or 0, 2) if column == "revenue" else current) != values[column]
+            for column, current in zip(values, stored)
+        )
+        if not write:
+            return drifted
+
+        db.execute(delete(models.SellerStatCount).where(models.SellerStatCount.seller_id == seller_id))
+        count_rows = [
+            {"seller_id": seller_id, "kind": kind, "name": name, "count": count, "first_item": first_item}
+            for kind in STAT_COUNT_KINDS
+            for name, count, first_item in names[kind]
+            if name is not None
+        ]
+        if count_rows:
+            db.execute(insert(models.SellerStatCount), count_rows)
+        db.execute(delete(models.SellerStats).where(models.SellerStats.seller_id == seller_id))
+        db.execute(insert(models.SellerStats), {**values, "seller_id": seller_id, "updated_at": datetime.utcnow()})
+        return drifted
+
+    def rebuild(self, conn, write: bool = True) -> dict:
+        """Tüm satıcıları yeniden hesapla (migration ve gece uzlaştırma komutu)"""
+        seller_ids = conn.execute(select(models.Seller.id).order_by(models.Seller.id)).scalars().all()
+        drifted = sum(self.refresh(conn, seller_id, write=write) for seller_id in seller_ids)
+        return {"sellers": len(seller_ids), "drifted": drifted}
+
+    def read(self, db, seller_id: int) -> dict:
+        """Panel yanıtı tek primary key okumasıyla"""
+        stats = db.get(models.SellerStats, seller_id)
+        if stats is None:
+            # Henüz ürünü veya siparişi olmayan satıcı
+            return format_statistics({}, None, None)
+        counters = {column: getattr(stats, column) for column in COUNTER_COLUMNS}
+        return format_statistics(
+            counters,
+            (stats.top_customer_name, stats.top_customer_count) if stats.top_customer_name is not None else None,
+            (stats.top_product_name, stats.top_product_count) if stats.top_product_name is not None else None,
+        )
+
+seller_stats_table = SellerStatsTable()
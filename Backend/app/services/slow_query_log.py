@@ -0,0 +1,129 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, date
+from sqlalchemy import event
+from dotenv import load_dotenv
+from app.services.query_counter import query_counter
+
+# Environment variables'ları yükle
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+load_dotenv(os.path.join(BASE_DIR, "config.env"))
+
+logger = logging.getLogger(__name__)
+
+# Parametrelerde olduğu gibi gösterilebilecek tipler (string'ler e-posta, şifre, telefon içerebilir)
+SAFE_PARAM_TYPES = (int, float, bool, datetime, date)
+
+def redact_params(parameters):
+    """Sorgu parametrelerindeki metinleri maskele, sayı/tarih değerlerini koru"""
+    def redact(value):
+        if value is None or isinstance(value, SAFE_PARAM_TYPES):
+            return value if not isinstance(value, (datetime, date)) else value.isoformat()
+        return f"<{type(value).__name__}>"
+
+    if isinstance(parameters, dict):
+        return {key: redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact(value) for value in parameters]
+    return redact(parameters)
+
+class SlowQueryLog:
+    """Eşik süresini aşan SQL sorgularını sınırlı bir halka tamponda tutar"""
+
+    def __init__(self):
+        self.threshold_ms = float(os.getenv("SLOW_QUERY_MS", "200"))
+        self.max_entries = int(os.getenv("SLOW_QUERY_LOG_SIZE", "100"))
+        # PostgreSQL'de yavaş sorgunun planı EXPLAIN (ANALYZE off) ile alınır (sorgu tekrar çalıştırılmaz)
+        self.explain = os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() == "true"
+        self.entries = deque(maxlen=self.max_entries)
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def install(self, engines):
+        """Engine'lere zamanlama dinleyicilerini ekle"""
+        for eng in engines:
+            event.listen(eng, "before_cursor_execute", self._before_execute)
+            event.listen(eng, "after_cursor_execute", self._after_execute)
+            event.listen(eng, "handle_error", self._on_error)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_started_at", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("slow_query_started_at")
+        if not started:
+            return
+        duration_ms = (time.perf_counter() - started.pop()) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        plan = None
+        # executemany'de parametre listesi tek sorguya bağlanamaz, plan alınmaz
+        if self.explain and not executemany and not context.executemany and conn.dialect.name == "postgresql":
+            plan = self._explain(cursor, statement, parameters)
+
+        entry = {
+            "at": datetime.utcnow().isoformat(),
+            "route": query_counter.current_route_key(),
+            "duration_ms": round(duration_ms, 2),
+            "sql": statement,
+            "params": redact_params(parameters) if not executemany else f"<executemany: {len(parameters)} satır>",
+            "plan": plan,
+        }
+        with self._lock:
+            self.entries.append(entry)
+            self.total += 1
+        logger.warning("🐢 Yavaş sorgu (%s ms) %s: %s", entry["duration_ms"], entry["route"] or "-", statement[:200])
+
+    def _on_error(self, context):
+        conn = context.connection
+        if conn is not None and conn.info.get("slow_query_started_at"):
+            conn.info["slow_query_started_at"].pop()
+
+    def _explain(self, cursor, statement, parameters):
+        """
+        Aynı DBAPI bağlantısında sorgu planını al. EXPLAIN bir SAVEPOINT içinde çalışır;
+        hata verirse SAVEPOINT'e dönülür ve isteğin transaction'ı bozulmaz.
+        """
+        if not statement.lstrip().upper().startswith(("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")):
+            return None
+        explain_cursor = cursor.connection.cursor()
+        try:
+            explain_cursor.execute("SAVEPOINT slow_query_explain")
+        except Exception as e:
+            # Transaction dışında (autocommit) SAVEPOINT açılamaz; plan alınmaz
+            explain_cursor.close()
+            return f"EXPLAIN alınamadı: {e}"
+        try:
+            explain_cursor.execute(f"EXPLAIN (ANALYZE off) {statement}", parameters)
+            plan = "\n".join(row[0] for row in explain_cursor.fetchall())
+            explain_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        except Exception as e:
+            explain_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            explain_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return f"EXPLAIN alınamadı: {e}"
+        finally:
+            explain_cursor.close()
+
+    def snapshot(self, limit: int = None) -> dict:
+        """Kayıtları en yeniden eskiye döndür"""
+        with self._lock:
+            entries = list(reversed(self.entries))
+            total = self.total
+        return {
+            "threshold_ms": self.threshold_ms,
+            "capacity": self.max_entries,
+            "total_slow_queries": total,
+            "entries": entries[:limit] if limit else entries,
+        }
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.total = 0
+
+slow_query_log = SlowQueryLog()
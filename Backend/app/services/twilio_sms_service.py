@@ -3,6 +3,7 @@ from twilio.rest import Client
 from typing import Optional
 from dotenv import load_dotenv
 from app.services.sms_language_manager import sms_language_manager
+from app.services.metrics import metrics
 
 # Environment variables'ları yükle
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -45,11 +46,12 @@ class TwilioSMS:
             print(f"   🌍 Language: {language}")
             
             # Telefon numarası ile SMS gönder
-            message_obj = self.client.messages.create(
-                body=message,
-                from_=self.from_number,  # Telefon numarası kullan
-                to=phone_number
-            )
+            with metrics.time_outbound("twilio", "messages.create"):
+                message_obj = self.client.messages.create(
+                    body=message,
+                    from_=self.from_number,  # Telefon numarası kullan
+                    to=phone_number
+                )
             
             print(f"✅ SMS gönderildi:")
             print(f"   🆔 Message ID: {message_obj.sid}")
@@ -221,7 +223,8 @@ class TwilioSMS:
         """
         try:
             # Hesap bilgilerini al
-            account = self.client.api.accounts(self.account_sid).fetch()
+            with metrics.time_outbound("twilio", "accounts.fetch"):
+                account = self.client.api.accounts(self.account_sid).fetch()
             
             return {
                 'success': True,
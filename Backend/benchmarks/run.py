@@ -0,0 +1,432 @@
+"""
+Endpoint bazlı benchmark.
+Uygulamayı süreç içinde (ASGI test client) çalıştırır ve her route için
+p50/p95/p99 gecikme, throughput ve istek başına SQL sorgu sayısını (X-DB-Queries) ölçer.
+
+Kullanım (Backend klasöründen):
+    python -m benchmarks.run --database-url sqlite:///bench_10k.db --scale 10k --seed --output before.json
+    python -m benchmarks.run --compare before.json after.json
+    python -m benchmarks.run --database-url sqlite:///bench_10k.db --max-queries  # N+1 regresyon kontrolü
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+# Harici servislere (SMS, e-posta, ödeme) istek atan veya dosya yükleyen endpoint'ler ölçülmez
+SKIPPED = {
+    ("POST", "/charge"): "Ödeme sağlayıcısına istek atar",
+    ("POST", "/send-verification-code"): "SMS gönderir",
+    ("POST", "/users/{user_id}/send-phone-verification"): "SMS gönderir",
+    ("POST", "/sms/welcome"): "SMS gönderir",
+    ("POST", "/sms/order-status"): "SMS gönderir",
+    ("POST", "/sms/promotional"): "SMS gönderir",
+    ("GET", "/sms/balance"): "Twilio API'sine istek atar",
+    ("GET", "/sms/check-sender-id"): "Twilio API'sine istek atar",
+    ("POST", "/users"): "Hoş geldin SMS'i gönderir",
+    ("POST", "/send-seller-verification-code"): "SMS gönderir",
+    ("POST", "/send-email-verification-code"): "E-posta gönderir",
+    ("POST", "/send-seller-email-verification-code"): "E-posta gönderir",
+    ("POST", "/verify-phone"): "Gönderilmiş doğrulama kodu gerektirir",
+    ("POST", "/verify-seller-phone"): "Gönderilmiş doğrulama kodu gerektirir",
+    ("POST", "/verify-email"): "Gönderilmiş doğrulama kodu gerektirir",
+    ("POST", "/verify-seller-email"): "Gönderilmiş doğrulama kodu gerektirir",
+    ("POST", "/upload-image"): "Diske dosya yazar",
+}
+
+# FastAPI'nin kendi dokümantasyon route'ları
+IGNORED_PATHS = {"/openapi.json", "/docs", "/docs/oauth2-redirect", "/redoc"}
+
+class Fixture:
+    """Seed edilmiş veritabanından örnek id'ler"""
+
+    def __init__(self, engine):
+        from sqlalchemy import text
+
+        with engine.connect() as conn:
+            def scalar(sql):
+                return conn.execute(text(sql)).scalar() or 0
+
+            self.max_ids = {
+                table: scalar(f'SELECT MAX(id) FROM "{table}"')
+                for table in (
+                    "sellers", "users", "products", "address", "credit_card", "order",
+                    "users_order", "users_address", "users_credit_card", "seller_reviews",
+                )
+            }
+            # En çok ürünü ve siparişi olan satıcı/kullanıcı (en ağır senaryo)
+            self.seller_id = scalar(
+                "SELECT seller_id FROM products GROUP BY seller_id ORDER BY COUNT(*) DESC LIMIT 1"
+            ) or 1
+            self.user_id = scalar(
+                "SELECT user_id FROM users_order GROUP BY user_id ORDER BY COUNT(*) DESC LIMIT 1"
+            ) or 1
+            self.seller_order_id = scalar(
+                "SELECT uo.order_id FROM users_order uo JOIN products p ON p.id = uo.product_id "
+                f"WHERE p.seller_id = {self.seller_id} LIMIT 1"
+            ) or 1
+            # Toplu güncelleme/silme ölçümleri için satıcının ürünleri (en yeniden eskiye)
+            self.seller_product_ids = conn.execute(text(
+                f"SELECT id FROM products WHERE seller_id = {self.seller_id} ORDER BY id DESC"
+            )).scalars().all()
+        self.run_id = int(time.time())
+
+    def pick(self, table: str, i: int) -> int:
+        """Tabloya yayılmış (önbelleğe sürekli aynı satırı vurmayan) bir id"""
+        return (i * 7919) % self.max_ids[table] + 1
+
+    def tail(self, table: str, i: int) -> int:
+        """Silme testleri için sondan id (diğer ölçümlerde kullanılan satırlara dokunmaz)"""
+        return self.max_ids[table] - i
+
+def product_payload(f: Fixture, i: int) -> dict:
+    return {
+        "product_name": f"Benchmark Ürün {f.run_id}-{i}",
+        "product_price": 99.9 + i,
+        "product_description": "Benchmark ile oluşturuldu",
+        "product_category": "Elektronik",
+        "product_image_url": "/uploads/Product_Image/bench.jpg",
+        "seller_id": f.seller_id,
+    }
+
+# Toplu içe aktarma ölçümünde her istekte gönderilen satır sayısı
+IMPORT_ROWS = 100
+
+def import_payload(f: Fixture, i: int) -> dict:
+    lines = [json.dumps(product_payload(f, i * IMPORT_ROWS + row), ensure_ascii=False) for row in range(IMPORT_ROWS)]
+    return {"url": "/products/import", "files": {"file": ("products.ndjson", "\n".join(lines), "application/x-ndjson")}}
+
+def seller_products(f: Fixture, i: int, count: int = 10) -> dict:
+    """Satıcının en yeni ürünlerinden ardışık dilimler (silme ölçümünde her istek farklı ürünleri siler)"""
+    ids = f.seller_product_ids
+    start = (i * count) % max(len(ids), 1)
+    return {"seller_id": f.seller_id, "product_ids": ids[start:start + count]}
+
+def address_payload(i: int) -> dict:
+    return {
+        "city": "İstanbul",
+        "district": "Kadıköy",
+        "neighbourhood": "Moda",
+        "street_name": f"{i}. Sokak",
+        "building_number": "1",
+        "apartment_number": "2",
+        "address_name": "Benchmark",
+    }
+
+def card_payload(f: Fixture, i: int) -> dict:
+    return {
+        "user_id": f.pick("users", i),
+        "provider": "mock",
+        "card_token": f"mock_bench_{i}",
+        "card_brand": "visa",
+        "last4": "4242",
+        "expiry_month": 12,
+        "expiry_year": 2030,
+    }
+
+def order_payload(f: Fixture, i: int) -> dict:
+    return {
+        "order_code": f"BENCH-{f.run_id}-{i}",
+        "order_created_date": "2025-01-01",
+        "order_estimated_delivery": "2025-01-04",
+        "order_cargo_company": "Araskargo",
+        "order_address": f.pick("address", i),
+        "order_status": "pending",
+    }
+
+# (method, path şablonu, istek üretici, kabul edilen durum kodları)
+# Sıra önemlidir: önce okumalar, sonra yazmalar, en son silmeler çalışır.
+ROUTES = [
+    ("GET", "/", lambda f, i: {"url": "/"}, {200}),
+    ("GET", "/check-db", lambda f, i: {"url": "/check-db"}, {200}),
+    ("GET", "/debug/endpoints", lambda f, i: {"url": "/debug/endpoints"}, {200}),
+    ("GET", "/debug/startup", lambda f, i: {"url": "/debug/startup"}, {200}),
+    ("GET", "/debug/pool", lambda f, i: {"url": "/debug/pool"}, {200}),
+    ("GET", "/debug/slow-queries", lambda f, i: {"url": "/debug/slow-queries"}, {200}),
+    ("GET", "/metrics", lambda f, i: {"url": "/metrics"}, {200}),
+    ("GET", "/sms/languages", lambda f, i: {"url": "/sms/languages"}, {200}),
+    ("GET", "/products", lambda f, i: {"url": "/products"}, {200}),
+    ("GET", "/products/facets", lambda f, i: {"url": "/products/facets", "params": [{}, {"product_category": "Giyim"}, {"seller_id": f.seller_id}][i % 3]}, {200}),
+    ("GET", "/products/autocomplete", lambda f, i: {"url": "/products/autocomplete", "params": {"prefix": ["t", "te", "tel", "akıllı t", "gö"][i % 5]}}, {200}),
+    ("GET", "/search/fuzzy", lambda f, i: {"url": "/search/fuzzy", "params": {"q": ["telfon", "gomlk", "magaza 12", "ayakabı"][i % 4]}}, {200}),
+    ("GET", "/products/search", lambda f, i: {"url": "/products/search", "params": {"q": ["akıllı telefon", "gomlek", "KAZAKLAR", "ayakkabı çanta"][i % 4]}}, {200}),
+    ("GET", "/products/export", lambda f, i: {"url": "/products/export", "params": {"format": ["ndjson", "csv"][i % 2], "seller_id": f.seller_id}}, {200}),
+    ("GET", "/products/batch", lambda f, i: {"url": "/products/batch", "params": {"ids": ",".join(str(f.pick("products", i * 20 + k)) for k in range(20))}}, {200}),
+    ("POST", "/products/batch", lambda f, i: {"url": "/products/batch", "json": {"ids": [f.pick("products", i * 200 + k) for k in range(200)]}}, {200}),
+    ("GET", "/products/{product_id}", lambda f, i: {"url": f"/products/{f.pick('products', i)}"}, {200}),
+    ("GET", "/users", lambda f, i: {"url": "/users"}, {200}),
+    ("GET", "/address", lambda f, i: {"url": "/address"}, {200}),
+    ("GET", "/credit_card", lambda f, i: {"url": "/credit_card"}, {200}),
+    ("GET", "/order", lambda f, i: {"url": "/order"}, {200}),
+    ("GET", "/users_address", lambda f, i: {"url": "/users_address"}, {200}),
+    ("GET", "/users_credit_card", lambda f, i: {"url": "/users_credit_card"}, {200}),
+    ("GET", "/users_order", lambda f, i: {"url": "/users_order"}, {200}),
+    ("GET", "/sellers/profile", lambda f, i: {"url": "/sellers/profile", "params": {"seller_id": f.seller_id}}, {200}),
+    ("GET", "/sellers/{seller_id}", lambda f, i: {"url": f"/sellers/{f.pick('sellers', i)}"}, {200}),
+    ("GET", "/sellers/{seller_id}/products", lambda f, i: {"url": f"/sellers/{f.seller_id}/products"}, {200}),
+    ("GET", "/sellers/{seller_id}/followers-count", lambda f, i: {"url": f"/sellers/{f.pick('sellers', i)}/followers-count"}, {200}),
+    ("GET", "/sellers/{seller_id}/rating", lambda f, i: {"url": f"/sellers/{f.pick('sellers', i)}/rating"}, {200}),
+    ("GET", "/seller_orders/{seller_id}", lambda f, i: {"url": f"/seller_orders/{f.seller_id}", "params": [{}, {"status": "delivered"}, {"exclude_status": ["delivered", "cancelled"]}, {"limit": 200}][i % 4]}, {200}),
+    ("GET", "/seller_statistics/{seller_id}", lambda f, i: {"url": f"/seller_statistics/{f.seller_id}"}, {200}),
+    ("GET", "/seller_active_orders/{seller_id}", lambda f, i: {"url": f"/seller_active_orders/{f.seller_id}", "params": [{}, {"limit": 200}][i % 2]}, {200}),
+    ("GET", "/seller_reviews", lambda f, i: {"url": "/seller_reviews", "params": {"seller_id": f.seller_id}}, {200}),
+    ("GET", "/users/{user_id}/followed-sellers", lambda f, i: {"url": f"/users/{f.pick('users', i)}/followed-sellers"}, {200}),
+    ("GET", "/users/{user_id}/is-following/{seller_id}", lambda f, i: {"url": f"/users/{f.pick('users', i)}/is-following/{f.pick('sellers', i)}"}, {200}),
+    ("POST", "/users/login", lambda f, i: {"url": "/users/login", "data": {"email": f"user{f.pick('users', i)}@bench.local", "password": "benchmark123"}}, {200}),
+    ("POST", "/sellers/login", lambda f, i: {"url": "/sellers/login", "data": {"email": f"seller{f.pick('sellers', i)}@bench.local", "password": "benchmark123"}}, {200}),
+    ("POST", "/tokenize", lambda f, i: {"url": "/tokenize", "json": {"user_id": f.user_id, "card_holder_name": "Bench Mark", "card_number": "4242424242424242", "expire_month": 12, "expire_year": 2030, "cvc": "123"}}, {200}),
+    ("POST", "/sellers/signup", lambda f, i: {"url": "/sellers/signup", "data": {"name": "Bench", "email": f"signup{f.run_id}-{i}@bench.local", "password": "benchmark123", "phone": f"+90599{f.run_id % 10000:04d}{i:03d}", "store_name": "Bench Store"}}, {200, 400}),
+    ("POST", "/products", lambda f, i: {"url": "/products", "json": product_payload(f, i)}, {200}),
+    ("POST", "/products/import", import_payload, {200}),
+    ("POST", "/products/bulk-update", lambda f, i: {"url": "/products/bulk-update", "json": {**seller_products(f, i), "product_price": 49.9, "product_category": "Benchmark"}}, {200}),
+    ("POST", "/address", lambda f, i: {"url": "/address", "json": address_payload(i)}, {200}),
+    ("POST", "/credit_card", lambda f, i: {"url": "/credit_card", "json": card_payload(f, i)}, {200}),
+    ("POST", "/order", lambda f, i: {"url": "/order", "json": order_payload(f, i)}, {200}),
+    ("POST", "/users_address", lambda f, i: {"url": "/users_address", "json": {"user_id": f.pick("users", i), "address_id": f.pick("address", i)}}, {200}),
+    ("POST", "/users_credit_card", lambda f, i: {"url": "/users_credit_card", "json": {"user_id": f.pick("users", i), "credit_card_id": f.pick("credit_card", i)}}, {200}),
+    ("POST", "/users_order", lambda f, i: {"url": "/users_order", "json": {"user_id": f.user_id, "product_id": f.pick("products", i), "order_id": f.seller_order_id}}, {200}),
+    ("POST", "/seller_reviews", lambda f, i: {"url": "/seller_reviews", "json": {"product_id": f.pick("products", i), "seller_id": f.seller_id, "user_id": f.tail("users", i), "rating": 4, "comment": "Benchmark"}}, {200, 400}),
+    ("POST", "/users/{user_id}/follow-seller/{seller_id}", lambda f, i: {"url": f"/users/{f.tail('users', i)}/follow-seller/{f.seller_id}"}, {200, 400}),
+    ("PUT", "/products/{product_id}", lambda f, i: {"url": f"/products/{f.pick('products', i)}", "json": {**product_payload(f, i), "product_image_url": "/uploads/Product_Image/bench.jpg"}}, {200}),
+    ("PUT", "/users/{user_id}", lambda f, i: {"url": f"/users/{f.pick('users', i)}", "json": {"name_surname": f"Kullanıcı {i}", "password": "benchmark123", "email": f"user{f.pick('users', i)}@bench.local", "phone_number": f"+90 532 {f.pick('users', i):07d}"}}, {200, 400}),
+    ("PUT", "/address/{address_id}", lambda f, i: {"url": f"/address/{f.pick('address', i)}", "json": address_payload(i)}, {200}),
+    ("PUT", "/credit_card/{card_id}", lambda f, i: {"url": f"/credit_card/{f.pick('credit_card', i)}", "json": {k: v for k, v in card_payload(f, i).items() if k != "user_id"}}, {200}),
+    ("PUT", "/order/{order_id}", lambda f, i: {"url": f"/order/{f.pick('order', i)}", "json": order_payload(f, i)}, {200}),
+    ("PUT", "/users_address/{ua_id}", lambda f, i: {"url": f"/users_address/{f.pick('users_address', i)}", "json": {"user_id": f.pick("users", i), "address_id": f.pick("address", i)}}, {200}),
+    ("PUT", "/users_credit_card/{ucc_id}", lambda f, i: {"url": f"/users_credit_card/{f.pick('users_credit_card', i)}", "json": {"user_id": f.pick("users", i), "credit_card_id": f.pick("credit_card", i)}}, {200}),
+    ("PUT", "/users_order/{uo_id}", lambda f, i: {"url": f"/users_order/{f.pick('users_order', i)}", "json": {"user_id": f.user_id, "product_id": f.pick("products", i), "order_id": f.seller_order_id}}, {200}),
+    ("PUT", "/sellers/profile", lambda f, i: {"url": "/sellers/profile", "params": {"seller_id": f.seller_id}, "data": {"store_description": f"Benchmark açıklaması {i}"}}, {200}),
+    ("PUT", "/seller_orders/{order_id}/status", lambda f, i: {"url": f"/seller_orders/{f.pick('order', i)}/status", "params": {"status": "processing"}}, {200}),
+    ("PUT", "/seller_reviews/{review_id}", lambda f, i: {"url": f"/seller_reviews/{f.pick('seller_reviews', i)}", "json": {"rating": 5, "comment": "Güncellendi"}}, {200}),
+    ("DELETE", "/debug/slow-queries", lambda f, i: {"url": "/debug/slow-queries"}, {200}),
+    ("DELETE", "/users/{user_id}/unfollow-seller/{seller_id}", lambda f, i: {"url": f"/users/{f.tail('users', i)}/unfollow-seller/{f.seller_id}"}, {200, 404}),
+    ("DELETE", "/seller_reviews/{review_id}", lambda f, i: {"url": f"/seller_reviews/{f.tail('seller_reviews', i)}"}, {200}),
+    ("DELETE", "/users_order/{uo_id}", lambda f, i: {"url": f"/users_order/{f.tail('users_order', i)}"}, {200}),
+    ("DELETE", "/users_credit_card/{ucc_id}", lambda f, i: {"url": f"/users_credit_card/{f.tail('users_credit_card', i)}"}, {200}),
+    ("DELETE", "/users_address/{ua_id}", lambda f, i: {"url": f"/users_address/{f.tail('users_address', i)}"}, {200}),
+    ("DELETE", "/credit_card/{card_id}", lambda f, i: {"url": f"/credit_card/{f.tail('credit_card', i)}"}, {200}),
+    ("DELETE", "/order/{order_id}", lambda f, i: {"url": f"/order/{f.tail('order', i)}"}, {200}),
+    ("DELETE", "/address/{address_id}", lambda f, i: {"url": f"/address/{f.tail('address', i)}"}, {200}),
+    ("DELETE", "/products/{product_id}", lambda f, i: {"url": f"/products/{f.tail('products', i)}"}, {200}),
+    ("POST", "/products/bulk-delete", lambda f, i: {"url": "/products/bulk-delete", "json": seller_products(f, i)}, {200}),
+    ("DELETE", "/users/{user_id}", lambda f, i: {"url": f"/users/{f.tail('users', i)}"}, {200}),
+]
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank yüzdelik"""
+    if not sorted_values:
+        return 0.0
+    index = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+# Sık kullanılan route'lar için istek başına en fazla SQL sayısı (--max-queries ile denetlenir).
+# N+1'e dönen bir değişiklik bu sınırları aşar. StreamingResponse gövdesindeki sorgular
+# X-DB-Queries header'ına girmediği için /products/export burada yer almaz.
+QUERY_BUDGETS = {
+    "GET /products": 1,
+    "GET /products/search": 2,
+    "GET /products/facets": 2,
+    "GET /products/batch": 1,
+    "POST /products/batch": 1,
+    "GET /products/{product_id}": 1,
+    "GET /sellers/{seller_id}/products": 2,
+    "GET /sellers/{seller_id}/rating": 1,
+    "GET /seller_reviews": 1,
+    "GET /seller_orders/{seller_id}": 2,
+    "GET /seller_statistics/{seller_id}": 1,
+    "GET /seller_active_orders/{seller_id}": 3,
+    "GET /users/{user_id}/followed-sellers": 2,
+    "POST /products": 5,
+    "POST /products/import": 4,
+    "POST /products/bulk-update": 6,  # fiyat değişince seller_stats önce/sonra katkısı okunur
+    "POST /users_order": 8,
+    "PUT /seller_orders/{order_id}/status": 6,
+}
+
+def check_query_budgets(results: dict) -> list:
+    """Bütçesini aşan route'lar: (route, en fazla sorgu, bütçe)"""
+    return [
+        (key, results[key]["sql_max"], budget)
+        for key, budget in QUERY_BUDGETS.items()
+        if key in results and results[key]["sql_max"] > budget
+    ]
+
+def measure_route(client, fixture, method, builder, ok_statuses, iterations, warmup, max_seconds):
+    """Tek bir route'u ölç"""
+    # Isınma turları ölçüme katılmaz (ilk bağlantı, import ve plan önbelleği)
+    for i in range(warmup):
+        request = builder(fixture, iterations + i)
+        client.request(method, **request)
+
+    latencies = []
+    queries = []
+    db_times = []
+    errors = {}
+    started = time.perf_counter()
+    for i in range(iterations):
+        request = builder(fixture, i)
+        t0 = time.perf_counter()
+        response = client.request(method, **request)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        # Sorgu sayısı ve DB süresi uygulamanın kendi middleware'inden okunur
+        queries.append(int(response.headers.get("X-DB-Queries", 0)))
+        db_times.append(float(response.headers.get("X-DB-Time", "0ms").rstrip("ms")))
+        if response.status_code not in ok_statuses:
+            errors[response.status_code] = errors.get(response.status_code, 0) + 1
+        if time.perf_counter() - started > max_seconds:
+            break
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "iterations": len(latencies),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "max_ms": round(latencies[-1], 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "sql_per_request": round(sum(queries) / len(queries), 2),
+        "sql_max": max(queries),
+        "db_time_ms": round(sum(db_times) / len(db_times), 3),
+        "errors": errors,
+    }
+
+def run(args) -> dict:
+    """Benchmark'ı çalıştır ve sonuç sözlüğünü döndür"""
+    # app.db DATABASE_URL'i import anında okur
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    # /debug/pool, /debug/slow-queries ve /metrics admin token ister
+    os.environ.setdefault("ADMIN_TOKEN", "benchmark")
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(backend_dir)
+    for folder in ("uploads/Product_Image", "uploads/Stores_Logo"):
+        os.makedirs(folder, exist_ok=True)
+
+    from fastapi.testclient import TestClient
+    from app.db import engine
+    from app.migrations import migrate
+    from benchmarks.seed import seed
+
+    migrate()
+    if args.seed:
+        seed(engine, args.scale)
+
+    from app.main import app
+
+    fixture = Fixture(engine)
+    only = set(args.only or [])
+
+    results = {}
+    covered = set(SKIPPED)
+    # Sunucu hataları benchmark'ı durdurmaz, 500 olarak sayılır
+    with TestClient(app, raise_server_exceptions=False, headers={"X-Admin-Token": os.environ["ADMIN_TOKEN"]}) as client:
+        for method, path, builder, ok_statuses in ROUTES:
+            covered.add((method, path))
+            key = f"{method} {path}"
+            if only and key not in only and path not in only:
+                continue
+            # Endpoint'lerin debug print'leri ölçümü ve çıktıyı kirletmesin
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[key] = measure_route(
+                    client, fixture, method, builder, ok_statuses,
+                    args.iterations, args.warmup, args.max_seconds,
+                )
+            stats = results[key]
+            flag = "⚠️" if stats["errors"] else "✅"
+            print(
+                f"{flag} {key:55} p50={stats['p50_ms']:>9.2f}ms p95={stats['p95_ms']:>9.2f}ms "
+                f"p99={stats['p99_ms']:>9.2f}ms sql={stats['sql_per_request']:>6} rps={stats['throughput_rps']}"
+            )
+
+    # Listede olmayan yeni route'ları raporla (benchmark güncel kalsın)
+    uncovered = sorted(
+        f"{method} {route.path}"
+        for route in app.routes
+        if hasattr(route, "methods") and route.path not in IGNORED_PATHS
+        for method in route.methods - {"HEAD"}
+        if (method, route.path) not in covered
+    )
+    for key in uncovered:
+        print(f"❓ Benchmark'ta tanımlı değil: {key}")
+
+    return {
+        "meta": {
+            "scale": args.scale,
+            "dialect": engine.dialect.name,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "table_sizes": fixture.max_ids,
+            "seller_id": fixture.seller_id,
+            "user_id": fixture.user_id,
+            "python": platform.python_version(),
+            "created_at": datetime.utcnow().isoformat(),
+        },
+        "routes": results,
+        "skipped": {f"{method} {path}": reason for (method, path), reason in SKIPPED.items()},
+        "uncovered": uncovered,
+    }
+
+def compare(before_path: str, after_path: str):
+    """İki benchmark sonucunu karşılaştır"""
+    with open(before_path) as f:
+        before = json.load(f)["routes"]
+    with open(after_path) as f:
+        after = json.load(f)["routes"]
+
+    print(f"{'Endpoint':55} {'p95 önce':>10} {'p95 sonra':>10} {'hızlanma':>9} {'sql önce':>9} {'sql sonra':>9}")
+    for key in sorted(set(before) | set(after)):
+        old, new = before.get(key), after.get(key)
+        if not old or not new:
+            print(f"{key:55} {'-' if not old else old['p95_ms']:>10} {'-' if not new else new['p95_ms']:>10}")
+            continue
+        speedup = old["p95_ms"] / new["p95_ms"] if new["p95_ms"] else 0
+        print(
+            f"{key:55} {old['p95_ms']:>10.2f} {new['p95_ms']:>10.2f} {speedup:>8.1f}x "
+            f"{old['sql_per_request']:>9} {new['sql_per_request']:>9}"
+        )
+
+def main():
+    """Ana benchmark fonksiyonu"""
+    from benchmarks.seed import SCALES
+
+    parser = argparse.ArgumentParser(description="Endpoint bazlı benchmark")
+    parser.add_argument("--database-url", help="Benchmark veritabanı (varsayılan: config.env DATABASE_URL)")
+    parser.add_argument("--scale", choices=SCALES.keys(), default="10k")
+    parser.add_argument("--seed", action="store_true", help="Ölçümden önce sentetik veri üret (boş veritabanı bekler)")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--max-seconds", type=float, default=30.0, help="Route başına en fazla ölçüm süresi")
+    parser.add_argument("--only", nargs="*", help="Sadece bu route'ları ölç (örn. 'GET /products')")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    parser.add_argument("--max-queries", action="store_true", help="QUERY_BUDGETS aşılırsa hata koduyla çık (CI için)")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = run(args)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"💾 Sonuçlar kaydedildi: {args.output}")
+
+    if args.max_queries:
+        violations = check_query_budgets(results["routes"])
+        for key, count, budget in violations:
+            print(f"❌ Sorgu bütçesi aşıldı: {key} -> {count} sorgu (bütçe {budget})")
+        if violations:
+            sys.exit(1)
+        print(f"✅ Sorgu bütçeleri tamam ({len(QUERY_BUDGETS)} route)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+Benchmark'lar için sentetik veri üretici.
+Ölçek ürün sayısını belirler; diğer tablolar bu sayıya oranla üretilir.
+Kullanım (Backend klasöründen):
+    DATABASE_URL=sqlite:///bench_10k.db python -m benchmarks.seed --scale 10k
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import insert, text
+
+SCALES = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+CATEGORIES = [
+    "Elektronik", "Giyim", "Ev & Yaşam", "Spor", "Kitap",
+    "Oyuncak", "Kozmetik", "Süpermarket", "Otomotiv", "Bahçe",
+]
+ORDER_STATUSES = ["pending", "processing", "shipped", "delivered", "cancelled"]
+CARGO_COMPANIES = ["Araskargo", "Yurtiçi Kargo", "MNG Kargo", "PTT Kargo"]
+PRODUCT_WORDS = [
+    "Akıllı", "Telefon", "Gömlek", "Pantolon", "Kazak", "Koltuk", "Gardırop",
+    "Dambıl", "Bar", "Laptop", "Kulaklık", "Saat", "Ayakkabı", "Çanta", "Masa",
+]
+CITIES = ["İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", "Konya"]
+
+# Tüm sentetik kullanıcı ve satıcıların şifresi (login endpoint'lerini ölçmek için)
+BENCHMARK_PASSWORD = "benchmark123"
+
+BATCH_SIZE = 5000
+
+def table_sizes(products: int) -> dict:
+    """Ürün sayısına göre tablo boyutları"""
+    users = max(products // 10, 10)
+    return {
+        "sellers": max(products // 100, 2),
+        "users": users,
+        "products": products,
+        "addresses": users,
+        "credit_cards": users,
+        "orders": max(products // 2, 10),
+        "reviews": max(products // 5, 10),
+        "follows": min(max(products // 5, 10), users * 2),
+    }
+
+def _insert_batches(conn, table, rows):
+    """Satırları executemany ile parça parça ekle"""
+    batch = []
+    count = 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            conn.execute(insert(table), batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        conn.execute(insert(table), batch)
+        count += len(batch)
+    return count
+
+def seed(engine, scale: str = "10k", random_seed: int = 42) -> dict:
+    """Veritabanını sentetik verilerle doldur, tablo boyutlarını döndür"""
+    import app.models as models
+    from app.main import hash_password
+    from app.services.product_search import product_search
+    from app.services.ratings import rating_aggregates
+    from app.services.seller_stats import seller_stats_table
+
+    rng = random.Random(random_seed)
+    sizes = table_sizes(SCALES[scale])
+    password = hash_password(BENCHMARK_PASSWORD)
+    now = datetime.utcnow()
+
+    def product_rows():
+        for i in range(sizes["products"]):
+            yield {
+                "id": i + 1,
+                "product_name": f"{rng.choice(PRODUCT_WORDS)} {rng.choice(PRODUCT_WORDS)} {i + 1}",
+                "product_price": round(rng.uniform(10, 5000), 2),
+                "product_description": f"{rng.choice(PRODUCT_WORDS)} açıklaması, ürün {i + 1}",
+                "product_category": rng.choice(CATEGORIES),
+                "product_image_url": f"/uploads/Product_Image/bench_{i + 1}.jpg",
+                "seller_id": rng.randrange(sizes["sellers"]) + 1,
+            }
+
+    def order_rows():
+        for i in range(sizes["orders"]):
+            created = now - timedelta(days=rng.randrange(365), minutes=rng.randrange(1440))
+            status = rng.choice(ORDER_STATUSES)
+            yield {
+                "id": i + 1,
+                "order_code": f"BENCH{i + 1:08d}",
+                "order_created_date": created,
+                "order_estimated_delivery": created + timedelta(days=3),
+                "order_delivered_date": created + timedelta(days=2) if status == "delivered" else None,
+                "order_cargo_company": rng.choice(CARGO_COMPANIES),
+                "order_address": rng.randrange(sizes["addresses"]) + 1,
+                "order_status": status,
+            }
+
+    def users_order_rows():
+        # Her siparişte 1-3 kalem, sipariş başına tek kullanıcı
+        row_id = 1
+        for order_id in range(1, sizes["orders"] + 1):
+            user_id = rng.randrange(sizes["users"]) + 1
+            for _ in range(rng.randint(1, 3)):
+                yield {
+                    "id": row_id,
+                    "user_id": user_id,
+                    "product_id": rng.randrange(sizes["products"]) + 1,
+                    "order_id": order_id,
+                }
+                row_id += 1
+
+    def review_rows():
+        # 7919 asal olduğundan (i * 7919) % ürün sayısı tekrarsız ürün üretir
+        for i in range(sizes["reviews"]):
+            product_id = (i * 7919) % sizes["products"] + 1
+            yield {
+                "id": i + 1,
+                "product_id": product_id,
+                "seller_id": (product_id % sizes["sellers"]) + 1,
+                "user_id": i % sizes["users"] + 1,
+                "rating": rng.randint(1, 5),
+                "comment": rng.choice(["Harika", "İyi", "Fena değil", "Beğenmedim", None]),
+                "created_at": now - timedelta(days=rng.randrange(365)),
+            }
+
+    def follow_rows():
+        for i in range(sizes["follows"]):
+            user_index = i % sizes["users"]
+            round_index = i // sizes["users"]
+            yield {
+                "id": i + 1,
+                "user_id": user_index + 1,
+                "seller_id": (user_index * 13 + round_index) % sizes["sellers"] + 1,
+                "created_at": now,
+            }
+
+    tables = [
+        (models.Seller, ({
+            "id": i + 1,
+            "name": f"Satıcı {i + 1}",
+            "email": f"seller{i + 1}@bench.local",
+            "password": password,
+            "phone": f"+90555{i + 1:07d}",
+            "phone_verified": "verified",
+            "email_verified": "verified",
+            "store_name": f"Mağaza {i + 1}",
+            "store_description": "Benchmark mağazası",
+            "cargo_company": rng.choice(CARGO_COMPANIES),
+            "is_verified": "verified",
+            "followers_count": 0,
+            "created_at": now,
+            "updated_at": now,
+        } for i in range(sizes["sellers"]))),
+        (models.User, ({
+            "id": i + 1,
+            "name_surname": f"Kullanıcı {i + 1}",
+            "password": password,
+            "email": f"user{i + 1}@bench.local",
+            "phone_number": f"+90 532 {i + 1:07d}",
+            "phone_verified": "verified",
+            "email_verified": "verified",
+            "created_at": now,
+            "updated_at": now,
+        } for i in range(sizes["users"]))),
+        (models.Address, ({
+            "id": i + 1,
+            "city": rng.choice(CITIES),
+            "district": "Merkez",
+            "neighbourhood": "Cumhuriyet",
+            "street_name": f"{i + 1}. Sokak",
+            "building_number": str(rng.randint(1, 99)),
+            "apartment_number": str(rng.randint(1, 30)),
+            "address_name": "Ev",
+        } for i in range(sizes["addresses"]))),
+        (models.UsersAddress, ({
+            "id": i + 1, "user_id": i + 1, "address_id": i + 1,
+        } for i in range(sizes["users"]))),
+        (models.CreditCard, ({
+            "id": i + 1,
+            "user_id": i + 1,
+            "provider": "mock",
+            "card_token": f"mock_{i + 1}",
+            "card_brand": "visa",
+            "last4": f"{i % 10000:04d}",
+            "expiry_month": rng.randint(1, 12),
+            "expiry_year": 2030,
+            "is_default": True,
+            "created_at": now,
+            "updated_at": now,
+        } for i in range(sizes["credit_cards"]))),
+        (models.UsersCreditCard, ({
+            "id": i + 1, "user_id": i + 1, "credit_card_id": i + 1,
+        } for i in range(sizes["users"]))),
+        (models.Product, product_rows()),
+        (models.Order, order_rows()),
+        (models.UsersOrder, users_order_rows()),
+        (models.SellerReview, review_rows()),
+        (models.UsersSellers, follow_rows()),
+    ]
+
+    counts = {}
+    with engine.begin() as conn:
+        for model, rows in tables:
+            started = time.perf_counter()
+            counts[model.__tablename__] = _insert_batches(conn, model.__table__, rows)
+            print(f"🌱 {model.__tablename__}: {counts[model.__tablename__]} satır ({time.perf_counter() - started:.1f} sn)")
+        # Takipçi sayacını gerçek takip kayıtlarıyla eşitle
+        conn.execute(text(
+            "UPDATE sellers SET followers_count = "
+            "(SELECT COUNT(*) FROM users_sellers WHERE users_sellers.seller_id = sellers.id)"
+        ))
+        # Değerlendirmeler doğrudan eklendiği için puan sayaçlarını hesapla
+        rating_aggregates.rebuild(conn)
+        # Siparişler doğrudan eklendiği için satıcı istatistiklerini hesapla
+        seller_stats_table.rebuild(conn)
+        # Ürünler doğrudan eklendiği için arama index'ini yeniden oluştur
+        product_search.rebuild_index(conn)
+        # id'ler elle verildiği için PostgreSQL sequence'larını ileri al
+        if conn.dialect.name == "postgresql":
+            for model, _ in tables:
+                conn.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('\"{model.__tablename__}\"', 'id'), "
+                    f"(SELECT MAX(id) FROM \"{model.__tablename__}\"))"
+                ))
+    return counts
+
+def main():
+    """Ana seed fonksiyonu"""
+    parser = argparse.ArgumentParser(description="Sentetik benchmark verisi üret")
+    parser.add_argument("--scale", choices=SCALES.keys(), default="10k")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    from app.db import engine
+    from app.migrations import migrate
+
+    migrate()
+    seed(engine, args.scale, args.seed)
+
+if __name__ == "__main__":
+    main()
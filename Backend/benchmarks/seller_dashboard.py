@@ -0,0 +1,167 @@
+"""
+Yoğun satıcı paneli benchmark'ı.
+Seed edilmiş veritabanına tek bir satıcı, ürünleri ve ona ait çok sayıda sipariş ekler,
+ardından satıcı paneli endpoint'lerinin gecikmesini ve SQL sayısını ölçer.
+Kullanım (Backend klasöründen):
+    python -m benchmarks.seller_dashboard --database-url sqlite:///bench_dashboard.db --orders 100000
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import text
+
+from benchmarks.seed import CARGO_COMPANIES, ORDER_STATUSES, _insert_batches
+
+DASHBOARD_ROUTES = [
+    ("GET", "/seller_statistics/{seller_id}", lambda seller_id, i: {"url": f"/seller_statistics/{seller_id}"}, {200}),
+    ("GET", "/seller_orders/{seller_id}", lambda seller_id, i: {"url": f"/seller_orders/{seller_id}"}, {200}),
+    ("GET", "/seller_active_orders/{seller_id}", lambda seller_id, i: {"url": f"/seller_active_orders/{seller_id}"}, {200}),
+]
+
+def seed_busy_seller(engine, orders: int, products: int = 200, random_seed: int = 42) -> int:
+    """Mevcut kullanıcı ve adreslerle yeni bir satıcı ve siparişlerini ekle, satıcı id'sini döndür"""
+    import app.models as models
+    from app.services.seller_stats import seller_stats_table
+
+    rng = random.Random(random_seed)
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        def next_id(table):
+            return (conn.execute(text(f'SELECT MAX(id) FROM "{table}"')).scalar() or 0) + 1
+
+        # Önceki benchmark koşuları satır silmiş olabilir; mevcut id'lerden seçilir
+        users = conn.execute(text("SELECT id FROM users")).scalars().all()
+        addresses = conn.execute(text("SELECT id FROM address")).scalars().all()
+        if not users or not addresses:
+            raise RuntimeError("Önce benchmarks.seed ile veritabanını doldurun")
+
+        seller_id = next_id("sellers")
+        first_product = next_id("products")
+        first_order = next_id("order")
+        first_item = next_id("users_order")
+
+        conn.execute(models.Seller.__table__.insert(), {
+            "id": seller_id,
+            "name": "Yoğun Satıcı",
+            "email": f"busy{seller_id}@bench.local",
+            "phone": f"+90556{seller_id:07d}",
+            "store_name": f"Yoğun Mağaza {seller_id}",
+            "is_verified": "verified",
+            "followers_count": 0,
+            "created_at": now,
+            "updated_at": now,
+        })
+        _insert_batches(conn, models.Product.__table__, ({
+            "id": first_product + i,
+            "product_name": f"Yoğun Ürün {i + 1}",
+            "product_price": round(rng.uniform(10, 5000), 2),
+            "product_description": "Panel benchmark ürünü",
+            "product_category": "Elektronik",
+            "product_image_url": "/uploads/Product_Image/bench.jpg",
+            "seller_id": seller_id,
+        } for i in range(products)))
+
+        def order_rows():
+            for i in range(orders):
+                created = now - timedelta(days=rng.randrange(365), minutes=rng.randrange(1440))
+                yield {
+                    "id": first_order + i,
+                    "order_code": f"BUSY{first_order + i:09d}",
+                    "order_created_date": created,
+                    "order_estimated_delivery": created + timedelta(days=3),
+                    "order_cargo_company": rng.choice(CARGO_COMPANIES),
+                    "order_address": rng.choice(addresses),
+                    "order_status": rng.choice(ORDER_STATUSES),
+                }
+
+        def item_rows():
+            item_id = first_item
+            for i in range(orders):
+                user_id = rng.choice(users)
+                for _ in range(rng.randint(1, 3)):
+                    yield {
+                        "id": item_id,
+                        "user_id": user_id,
+                        "product_id": first_product + rng.randrange(products),
+                        "order_id": first_order + i,
+                    }
+                    item_id += 1
+
+        started = time.perf_counter()
+        _insert_batches(conn, models.Order.__table__, order_rows())
+        items = _insert_batches(conn, models.UsersOrder.__table__, item_rows())
+        # Satırlar doğrudan eklendiği için satıcı istatistiklerini hesapla
+        seller_stats_table.refresh(conn, seller_id)
+        print(f"🌱 Satıcı {seller_id}: {products} ürün, {orders} sipariş, {items} kalem ({time.perf_counter() - started:.1f} sn)")
+
+        if conn.dialect.name == "postgresql":
+            for table in ("sellers", "products", "order", "users_order"):
+                conn.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), (SELECT MAX(id) FROM \"{table}\"))"
+                ))
+    return seller_id
+
+def main():
+    """Ana benchmark fonksiyonu"""
+    parser = argparse.ArgumentParser(description="Yoğun satıcı paneli benchmark'ı")
+    parser.add_argument("--database-url", help="Benchmark veritabanı (varsayılan: config.env DATABASE_URL)")
+    parser.add_argument("--orders", type=int, default=100_000, help="Satıcıya eklenecek sipariş sayısı")
+    parser.add_argument("--seller-id", type=int, help="Yeni satıcı eklemek yerine mevcut satıcıyı ölç")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--max-seconds", type=float, default=120.0)
+    parser.add_argument("--only", nargs="*", help="Sadece bu route'ları ölç (örn. '/seller_statistics/{seller_id}')")
+    parser.add_argument("--output", help="Sonuçları JSON olarak kaydet")
+    args = parser.parse_args()
+
+    # app.db DATABASE_URL'i import anında okur
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    for folder in ("uploads/Product_Image", "uploads/Stores_Logo"):
+        os.makedirs(folder, exist_ok=True)
+
+    from fastapi.testclient import TestClient
+    from app.db import engine
+    from app.migrations import migrate
+    from benchmarks.run import measure_route
+
+    migrate()
+    seller_id = args.seller_id or seed_busy_seller(engine, args.orders)
+
+    from app.main import app
+
+    results = {}
+    with TestClient(app, raise_server_exceptions=False) as client:
+        for method, path, builder, ok_statuses in DASHBOARD_ROUTES:
+            key = f"{method} {path}"
+            if args.only and key not in args.only and path not in args.only:
+                continue
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[key] = measure_route(
+                    client, seller_id, method, builder, ok_statuses,
+                    args.iterations, args.warmup, args.max_seconds,
+                )
+            stats = results[key]
+            flag = "⚠️" if stats["errors"] else "✅"
+            print(
+                f"{flag} {key:40} p50={stats['p50_ms']:>9.2f}ms p95={stats['p95_ms']:>9.2f}ms "
+                f"sql={stats['sql_per_request']:>6} rps={stats['throughput_rps']}"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "meta": {"dialect": engine.dialect.name, "seller_id": seller_id, "orders": args.orders},
+                "routes": results,
+            }, f, indent=2, ensure_ascii=False)
+        print(f"💾 Sonuçlar kaydedildi: {args.output}")
+
+if __name__ == "__main__":
+    main()
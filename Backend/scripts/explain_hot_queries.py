@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Sık kullanılan sorguların planını ve süresini ölç (index migration'ı önce/sonra karşılaştırması)
+Kullanım (Backend klasöründen):
+    python -m scripts.explain_hot_queries --output before.json
+    psql "$DATABASE_URL" -f scripts/postgresql_performance_indexes.sql
+    python -m scripts.explain_hot_queries --output after.json
+    python -m scripts.explain_hot_queries --compare before.json after.json
+"""
+
+import json
+import statistics
+import sys
+import time
+from sqlalchemy import text
+from app.db import engine
+
+# (isim, sorgu, örnek parametreyi veren sorgu)
+HOT_QUERIES = [
+    ("users_by_email",
+     "SELECT * FROM users WHERE email = :value",
+     "SELECT email FROM users ORDER BY id DESC LIMIT 1"),
+    ("users_by_phone_number",
+     "SELECT * FROM users WHERE phone_number = :value",
+     "SELECT phone_number FROM users ORDER BY id DESC LIMIT 1"),
+    ("products_by_seller",
+     "SELECT * FROM products WHERE seller_id = :value",
+     "SELECT seller_id FROM products ORDER BY id DESC LIMIT 1"),
+    ("products_by_category",
+     "SELECT * FROM products WHERE product_category = :value",
+     "SELECT product_category FROM products ORDER BY id DESC LIMIT 1"),
+    ("users_order_by_order",
+     "SELECT * FROM users_order WHERE order_id = :value",
+     "SELECT order_id FROM users_order ORDER BY id DESC LIMIT 1"),
+    ("users_order_by_product",
+     "SELECT * FROM users_order WHERE product_id = :value",
+     "SELECT product_id FROM users_order ORDER BY id DESC LIMIT 1"),
+    ("users_order_by_user",
+     "SELECT * FROM users_order WHERE user_id = :value",
+     "SELECT user_id FROM users_order ORDER BY id DESC LIMIT 1"),
+    ("reviews_by_seller",
+     "SELECT * FROM seller_reviews WHERE seller_id = :value",
+     "SELECT seller_id FROM seller_reviews ORDER BY id DESC LIMIT 1"),
+    ("reviews_by_product",
+     "SELECT * FROM seller_reviews WHERE product_id = :value",
+     "SELECT product_id FROM seller_reviews ORDER BY id DESC LIMIT 1"),
+    ("reviews_by_user",
+     "SELECT * FROM seller_reviews WHERE user_id = :value",
+     "SELECT user_id FROM seller_reviews ORDER BY id DESC LIMIT 1"),
+    ("follows_by_user",
+     "SELECT * FROM users_sellers WHERE user_id = :value",
+     "SELECT user_id FROM users_sellers ORDER BY id DESC LIMIT 1"),
+    ("followers_count",
+     "SELECT COUNT(*) FROM users_sellers WHERE seller_id = :value",
+     "SELECT seller_id FROM users_sellers ORDER BY id DESC LIMIT 1"),
+    ("credit_cards_by_user",
+     "SELECT * FROM credit_card WHERE user_id = :value",
+     "SELECT user_id FROM credit_card ORDER BY id DESC LIMIT 1"),
+    ("addresses_by_user",
+     "SELECT * FROM users_address WHERE user_id = :value",
+     "SELECT user_id FROM users_address ORDER BY id DESC LIMIT 1"),
+]
+
+RUNS = 20
+
+def explain_prefix() -> str:
+    if engine.dialect.name == "postgresql":
+        return "EXPLAIN (ANALYZE, BUFFERS) "
+    return "EXPLAIN QUERY PLAN "
+
+def measure():
+    """Her sorgu için planı ve medyan süreyi topla"""
+    results = {}
+    with engine.connect() as conn:
+        for name, sql, sample_sql in HOT_QUERIES:
+            value = conn.execute(text(sample_sql)).scalar()
+            if value is None:
+                print(f"⚠️ {name}: örnek veri yok, atlandı")
+                continue
+            params = {"value": value}
+            plan = [" ".join(str(col) for col in row) for row in conn.execute(text(explain_prefix() + sql), params)]
+            timings = []
+            for _ in range(RUNS):
+                start = time.perf_counter()
+                conn.execute(text(sql), params).fetchall()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = {
+                "median_ms": round(statistics.median(timings), 3),
+                "plan": plan,
+            }
+            print(f"📊 {name}: {results[name]['median_ms']} ms")
+            for line in plan:
+                print(f"    {line}")
+    return results
+
+def compare(before_path: str, after_path: str):
+    """İki ölçüm dosyasını karşılaştır"""
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+    print(f"{'sorgu':<26}{'önce (ms)':>12}{'sonra (ms)':>12}{'hızlanma':>10}")
+    for name in before:
+        if name not in after:
+            continue
+        b, a = before[name]["median_ms"], after[name]["median_ms"]
+        speedup = f"{b / a:.1f}x" if a else "-"
+        print(f"{name:<26}{b:>12}{a:>12}{speedup:>10}")
+
+def main():
+    """Ana fonksiyon"""
+    if "--compare" in sys.argv:
+        i = sys.argv.index("--compare")
+        compare(sys.argv[i + 1], sys.argv[i + 2])
+        return
+
+    print(f"🔍 Sorgu planları ölçülüyor ({engine.dialect.name})...")
+    results = measure()
+    if "--output" in sys.argv:
+        path = sys.argv[sys.argv.index("--output") + 1]
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"💾 Sonuçlar kaydedildi: {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Sürümlü şema migration script'i
+Kullanım (Backend klasöründen):
+    python -m scripts.migrate           # bekleyen adımları uygula
+    python -m scripts.migrate --status  # sadece mevcut sürümü göster
+"""
+
+import sys
+from app.db import engine
+from app.migrations import MIGRATIONS, SCHEMA_VERSION, get_schema_version, migrate
+
+def show_status():
+    """Mevcut ve beklenen şema sürümünü yazdır"""
+    with engine.connect() as conn:
+        current = get_schema_version(conn)
+    print(f"📊 Veritabanı şema sürümü: {current if current is not None else 'yok'}")
+    print(f"📦 Uygulamanın beklediği sürüm: {SCHEMA_VERSION}")
+    for version, description, _ in MIGRATIONS:
+        state = "✅" if current is not None and version <= current else "⏳"
+        print(f"  {state} {version}: {description}")
+
+def main():
+    """Ana migration fonksiyonu"""
+    if "--status" in sys.argv:
+        show_status()
+        return
+
+    print("🚀 Şema migration başlatılıyor...")
+    applied = migrate()
+    if applied:
+        print(f"✅ Uygulanan sürümler: {', '.join(str(v) for v in applied)}")
+    else:
+        print("ℹ️ Şema zaten güncel")
+    show_status()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+-- ⚡ Sık Sorgulanan Kolonlar İçin Index Paketi (PostgreSQL Migration)
+-- Bu dosyayı canlı veritabanında psql ile çalıştırın:
+--     psql "$DATABASE_URL" -f scripts/postgresql_performance_indexes.sql
+-- CREATE INDEX CONCURRENTLY tabloları yazmaya kilitlemez ama transaction içinde çalışamaz;
+-- dosyayı BEGIN/COMMIT ile sarmayın. Yarıda kalan CONCURRENTLY işlemi INVALID index bırakır,
+-- bu durumda index'i DROP INDEX CONCURRENTLY ile silip tekrar çalıştırın.
+-- Sonrasında `python -m scripts.migrate` ile şema sürümünü güncelleyin (mevcut index'ler atlanır).
+-- PostgreSQL'de migrate, dolu tablolarda eksik index bulursa bu dosyayı önce çalıştırmanızı ister
+-- (migration içindeki CREATE INDEX tabloyu index oluşana kadar yazmaya kilitler).
+-- Önce/sonra sorgu planı karşılaştırması: scripts/explain_hot_queries.py
+
+-- 1️⃣ Kullanıcı girişi ve telefon kontrolleri
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email ON users(email);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_phone_number ON users(phone_number);
+
+-- 2️⃣ Ürün kataloğu (satıcı ürünleri, kategori/fiyat filtreleri ve keyset sayfalama)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_seller_id_id ON products(seller_id, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_category_id ON products(product_category, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_price_id ON products(product_price, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_category_price_id ON products(product_category, product_price, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_seller_id_price_id ON products(seller_id, product_price, id);
+-- Composite index'ler bu tek kolonluk index'lerin yerini alır
+DROP INDEX CONCURRENTLY IF EXISTS ix_products_seller_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_products_product_category;
+
+-- 3️⃣ Sipariş kalemleri (satıcı siparişleri ve istatistikleri)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_order_order_id ON users_order(order_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_order_product_id_order_id ON users_order(product_id, order_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_order_user_id ON users_order(user_id);
+-- (product_id, order_id) index'i tek kolonluk product_id index'inin yerini alır
+DROP INDEX CONCURRENTLY IF EXISTS ix_users_order_product_id;
+-- Aktif siparişler (satıcı paneli): teslim edilmiş/iptal siparişler index'e girmez
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_order_active_created_date_id ON "order"(order_created_date, id)
+    WHERE order_status IN ('pending', 'processing', 'shipped');
+
+-- 4️⃣ Değerlendirmeler (kullanıcı başına ürün için tek değerlendirme)
+DELETE FROM seller_reviews WHERE id NOT IN (
+    SELECT MIN(id) FROM seller_reviews GROUP BY user_id, product_id
+);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_seller_reviews_seller_id ON seller_reviews(seller_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_seller_reviews_product_id ON seller_reviews(product_id);
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_seller_reviews_user_id_product_id ON seller_reviews(user_id, product_id);
+
+-- 5️⃣ Satıcı takip sistemi (aynı satıcı iki kez takip edilemez)
+DELETE FROM users_sellers WHERE id NOT IN (
+    SELECT MIN(id) FROM users_sellers GROUP BY user_id, seller_id
+);
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_users_sellers_user_id_seller_id ON users_sellers(user_id, seller_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_sellers_seller_id ON users_sellers(seller_id);
+
+-- 6️⃣ Kayıtlı kartlar ve adresler
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_credit_card_user_id ON credit_card(user_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_address_user_id ON users_address(user_id);
+
+-- 7️⃣ Planlayıcı istatistiklerini güncelle
+ANALYZE users;
+ANALYZE products;
+ANALYZE users_order;
+ANALYZE "order";
+ANALYZE seller_reviews;
+ANALYZE users_sellers;
+ANALYZE credit_card;
+ANALYZE users_address;
+
+-- 8️⃣ Index'leri kontrol et (INVALID olan varsa yeniden oluşturun)
+\di+ ix_*
+\di+ uq_*
+
+-- ✅ Migration tamamlandı!
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Ürün ve satıcı puan sayaçlarını seller_reviews tablosundan yeniden hesaplar
+(artımlı güncellemelerde oluşabilecek sapmaları düzeltir).
+Kullanım (Backend klasöründen):
+    python -m scripts.rebuild_ratings          # sapmaları raporla ve yeniden hesapla
+    python -m scripts.rebuild_ratings --check  # sadece sapmaları raporla
+"""
+
+import sys
+import time
+from app.db import engine
+from app.services.ratings import rating_aggregates
+
+def main():
+    """Ana uzlaştırma fonksiyonu"""
+    with engine.begin() as conn:
+        drift = rating_aggregates.count_drift(conn)
+        for table, count in drift.items():
+            state = "✅" if count == 0 else "⚠️"
+            print(f"{state} {table}: {count} satırda sapma")
+
+        if "--check" in sys.argv:
+            return
+
+        print("🔄 Puan sayaçları yeniden hesaplanıyor...")
+        started = time.perf_counter()
+        updated = rating_aggregates.rebuild(conn)
+        for table, count in updated.items():
+            print(f"✅ {table}: {count} satır güncellendi")
+        print(f"⏱️ Süre: {time.perf_counter() - started:.1f} sn")
+
+if __name__ == "__main__":
+    main()
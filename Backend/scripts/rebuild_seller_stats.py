@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Satıcı paneli istatistiklerini (seller_stats) sipariş ve ürün tablolarından yeniden hesaplar
+(artımlı güncellemelerde oluşan sapmaları düzeltir; gece cron ile çalıştırılması önerilir).
+Kullanım (Backend klasöründen):
+    python -m scripts.rebuild_seller_stats          # sapmaları raporla ve yeniden hesapla
+    python -m scripts.rebuild_seller_stats --check  # sadece sapmaları raporla
+"""
+
+import sys
+import time
+from sqlalchemy import select
+from app.db import engine
+import app.models as models
+from app.services.seller_stats import seller_stats_table
+
+def main():
+    """Ana uzlaştırma fonksiyonu"""
+    write = "--check" not in sys.argv
+    with engine.connect() as conn:
+        seller_ids = conn.execute(select(models.Seller.id).order_by(models.Seller.id)).scalars().all()
+
+    print(f"🔄 {len(seller_ids)} satıcının istatistikleri {'yeniden hesaplanıyor' if write else 'kontrol ediliyor'}...")
+    started = time.perf_counter()
+    drifted = []
+    for seller_id in seller_ids:
+        # Satıcı başına kısa transaction: artımlı güncellemeler uzun süre beklemez
+        with engine.begin() as conn:
+            if seller_stats_table.refresh(conn, seller_id, write=write):
+                drifted.append(seller_id)
+
+    state = "✅" if not drifted else "⚠️"
+    print(f"{state} {len(drifted)} satıcıda sapma" + (f" (ilk id'ler: {drifted[:10]})" if drifted else ""))
+    print(f"⏱️ Süre: {time.perf_counter() - started:.1f} sn")
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,9 @@ class _SellerDashboardPageState extends State<SellerDashboardPage> with WidgetsB
   bool _isLoadingStatistics = true;
   List<dynamic> _activeOrders = [];
   bool _isLoadingActiveOrders = true;
+  // Aktif siparişler sayfa sayfa gösterilir; sonraki sayfa "Daha fazla" ile yüklenir
+  String? _activeOrdersCursor;
+  bool _isLoadingMoreActiveOrders = false;
   // Güncel seller bilgilerini tutmak için
   late Seller _currentSeller;
   // Timer ve interval kaldırıldı
@@ -108,10 +111,12 @@ class _SellerDashboardPageState extends State<SellerDashboardPage> with WidgetsB
         _isLoadingActiveOrders = true;
       });
 
-      final orders = await ApiService.fetchSellerActiveOrders(_currentSeller.id);
+      final page = await ApiService.fetchSellerActiveOrders(_currentSeller.id);
+      if (!mounted) return;
       
       setState(() {
-        _activeOrders = orders;
+        _activeOrders = page.items;
+        _activeOrdersCursor = page.nextCursor;
         _isLoadingActiveOrders = false;
       });
     } catch (e) {
@@ -130,6 +135,30 @@ class _SellerDashboardPageState extends State<SellerDashboardPage> with WidgetsB
     }
   }
 
+  Future<void> _loadMoreActiveOrders() async {
+    final cursor = _activeOrdersCursor;
+    if (_isLoadingMoreActiveOrders || cursor == null) return;
+    setState(() {
+      _isLoadingMoreActiveOrders = true;
+    });
+    try {
+      final page = await ApiService.fetchSellerActiveOrders(_currentSeller.id, cursor: cursor);
+      if (!mounted || _activeOrdersCursor != cursor) return;
+      setState(() {
+        _activeOrders.addAll(page.items);
+        _activeOrdersCursor = page.nextCursor;
+      });
+    } catch (e) {
+      print('Error loading more active orders: $e');
+    } finally {
+      if (mounted) {
+        setState(() {
+          _isLoadingMoreActiveOrders = false;
+        });
+      }
+    }
+  }
+
   String _getAppBarTitle() {
     switch (_selectedIndex) {
       case 0:
@@ -509,6 +538,40 @@ class _SellerDashboardPageState extends State<SellerDashboardPage> with WidgetsB
                 ),
               ],
             ),
+
+            const SizedBox(height: 16),
+
+            // Aktif siparişler (ilk sayfa, istenirse devamı)
+            Text(
+              LanguageManager.translate('Aktif Siparişler'),
+              style: const TextStyle(
+                fontSize: 16,
+                fontWeight: FontWeight.bold,
+              ),
+            ),
+            const SizedBox(height: 12),
+            if (_isLoadingActiveOrders)
+              const Center(child: CircularProgressIndicator())
+            else if (_activeOrders.isEmpty)
+              Text(LanguageManager.translate('Henüz aktif sipariş yok.'))
+            else
+              ..._activeOrders.map((order) => Card(
+                child: ListTile(
+                  leading: const Icon(Icons.local_shipping, color: Colors.blue),
+                  title: Text('${LanguageManager.translate('Sipariş')} ${order['order_code'] ?? ''}'),
+                  subtitle: Text(order['user']?['name_surname'] ?? ''),
+                  trailing: Text(order['order_created_date'] ?? ''),
+                ),
+              )),
+            if (_activeOrdersCursor != null)
+              Center(
+                child: TextButton(
+                  onPressed: _isLoadingMoreActiveOrders ? null : _loadMoreActiveOrders,
+                  child: _isLoadingMoreActiveOrders
+                      ? const SizedBox(width: 20, height: 20, child: CircularProgressIndicator(strokeWidth: 2))
+                      : Text(LanguageManager.translate('Daha fazla göster')),
+                ),
+              ),
           ],
         ),
       ),
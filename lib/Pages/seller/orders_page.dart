@@ -14,33 +14,60 @@ class SellerOrdersPage extends StatefulWidget {
 }
 
 class _SellerOrdersPageState extends State<SellerOrdersPage> with SingleTickerProviderStateMixin {
-  List<dynamic> _orders = [];
+  // Sekme başına durum filtresi; her sekme kendi sayfalarını sunucudan yükler.
+  // Aktif sekme hariç tutmayla tanımlanır: teslim edilmemiş ve iptal edilmemiş her sipariş görünür
+  static const List<List<String>?> _tabStatuses = [
+    null,
+    ['delivered'],
+    ['cancelled'],
+  ];
+  static const List<List<String>?> _tabExcludedStatuses = [
+    ['delivered', 'cancelled'],
+    null,
+    null,
+  ];
+  final List<List<dynamic>> _tabOrders = [[], [], []];
+  final List<String?> _tabCursors = [null, null, null];
+  final List<bool> _tabLoaded = [false, false, false];
   bool _isLoading = true;
+  bool _isLoadingMore = false;
   late TabController _tabController;
 
   @override
   void initState() {
     super.initState();
     _tabController = TabController(length: 3, vsync: this);
+    _tabController.addListener(_onTabChanged);
     _loadOrders();
   }
 
+  void _onTabChanged() {
+    if (!_tabController.indexIsChanging && !_tabLoaded[_tabController.index]) {
+      _loadOrders();
+    }
+  }
+
   @override
   void dispose() {
     _tabController.dispose();
     super.dispose();
   }
 
+  // Seçili sekmenin ilk sayfasını yükle
   Future<void> _loadOrders() async {
+    final tab = _tabController.index;
     try {
       setState(() {
         _isLoading = true;
       });
 
-      final orders = await ApiService.fetchSellerOrders(widget.seller.id);
+      final page = await ApiService.fetchSellerOrders(widget.seller.id, statuses: _tabStatuses[tab], excludedStatuses: _tabExcludedStatuses[tab]);
+      if (!mounted) return;
       
       setState(() {
-        _orders = orders;
+        _tabOrders[tab] = page.items;
+        _tabCursors[tab] = page.nextCursor;
+        _tabLoaded[tab] = true;
         _isLoading = false;
       });
     } catch (e) {
@@ -59,11 +86,33 @@ class _SellerOrdersPageState extends State<SellerOrdersPage> with SingleTickerPr
     }
   }
 
+  // Liste sonuna yaklaşınca sekmenin sonraki sayfasını yükle
+  Future<void> _loadMoreOrders(int tab) async {
+    final cursor = _tabCursors[tab];
+    if (_isLoadingMore || cursor == null) return;
+    _isLoadingMore = true;
+    try {
+      final page = await ApiService.fetchSellerOrders(widget.seller.id, cursor: cursor, statuses: _tabStatuses[tab], excludedStatuses: _tabExcludedStatuses[tab]);
+      if (!mounted || _tabCursors[tab] != cursor) return;
+      setState(() {
+        _tabOrders[tab].addAll(page.items);
+        _tabCursors[tab] = page.nextCursor;
+      });
+    } catch (e) {
+      print('Error loading more seller orders: $e');
+    } finally {
+      _isLoadingMore = false;
+    }
+  }
+
   Future<void> _updateOrderStatus(int orderId, String newStatus) async {
     try {
       await ApiService.updateSellerOrderStatus(orderId, newStatus);
       
-      // Siparişleri yeniden yükle
+      // Sipariş sekme değiştirebilir; diğer sekmeler açıldığında yeniden yüklenir
+      for (var i = 0; i < _tabLoaded.length; i++) {
+        _tabLoaded[i] = false;
+      }
       await _loadOrders();
       
       if (mounted) {
@@ -86,27 +135,6 @@ class _SellerOrdersPageState extends State<SellerOrdersPage> with SingleTickerPr
     }
   }
 
-  // Aktif siparişleri getir (teslim edilmemiş ve iptal edilmemiş)
-  List<dynamic> get _activeOrders {
-    final active = _orders.where((order) => order['status'] != 'delivered' && order['status'] != 'cancelled').toList();
-    active.sort((a, b) => (b['id'] ?? 0).compareTo(a['id'] ?? 0));
-    return active;
-  }
-
-  // Teslim edilen siparişleri getir
-  List<dynamic> get _deliveredOrders {
-    final delivered = _orders.where((order) => order['status'] == 'delivered').toList();
-    delivered.sort((a, b) => (b['id'] ?? 0).compareTo(a['id'] ?? 0));
-    return delivered;
-  }
-
-  // İptal edilen siparişler
-  List<dynamic> get _cancelledOrders {
-    final cancelled = _orders.where((order) => order['status'] == 'cancelled').toList();
-    cancelled.sort((a, b) => (b['id'] ?? 0).compareTo(a['id'] ?? 0));
-    return cancelled;
-  }
-
   String _getStatusText(String status) {
     switch (status.toLowerCase()) {
       case 'pending':
@@ -193,9 +221,9 @@ class _SellerOrdersPageState extends State<SellerOrdersPage> with SingleTickerPr
               : TabBarView(
                   controller: _tabController,
                   children: [
-                    _buildOrdersList(_activeOrders, LanguageManager.translate('Henüz aktif sipariş yok.')),
-                    _buildOrdersList(_deliveredOrders, LanguageManager.translate('Henüz teslim edilen sipariş yok.')),
-                    _buildOrdersList(_cancelledOrders, LanguageManager.translate('Henüz iptal edilen sipariş yok.')),
+                    _buildOrdersList(0, LanguageManager.translate('Henüz aktif sipariş yok.')),
+                    _buildOrdersList(1, LanguageManager.translate('Henüz teslim edilen sipariş yok.')),
+                    _buildOrdersList(2, LanguageManager.translate('Henüz iptal edilen sipariş yok.')),
                   ],
                 ),
         ),
@@ -203,15 +231,16 @@ class _SellerOrdersPageState extends State<SellerOrdersPage> with SingleTickerPr
     );
   }
 
-  Widget _buildOrdersList(List<dynamic> orders, String emptyMessage) {
+  Widget _buildOrdersList(int tab, String emptyMessage) {
+    final orders = _tabOrders[tab];
     if (orders.isEmpty) {
       return Center(
         child: Column(
           mainAxisAlignment: MainAxisAlignment.center,
           children: [
             Icon(
-              orders == _activeOrders ? Icons.shopping_bag_outlined :
-              orders == _deliveredOrders ? Icons.done_all :
+              tab == 0 ? Icons.shopping_bag_outlined :
+              tab == 1 ? Icons.done_all :
               Icons.remove_shopping_cart,
               size: 80,
               color: Colors.grey.shade400,
@@ -230,338 +259,347 @@ class _SellerOrdersPageState extends State<SellerOrdersPage> with SingleTickerPr
       );
     }
 
-    return RefreshIndicator(
-      onRefresh: _loadOrders,
-      child: ListView.builder(
-        padding: const EdgeInsets.all(16),
-        itemCount: orders.length,
-        itemBuilder: (context, index) {
-          final order = orders[index];
-          return Card(
-            margin: const EdgeInsets.only(bottom: 16),
-            elevation: 1,
-            shadowColor: Colors.black.withOpacity(0.08),
-            shape: RoundedRectangleBorder(
-              borderRadius: BorderRadius.circular(14),
-            ),
-            child: Padding(
-              padding: const EdgeInsets.all(16),
-              child: Column(
-                crossAxisAlignment: CrossAxisAlignment.start,
-                children: [
-                  // Sipariş başlığı
-                  Row(
-                    mainAxisAlignment: MainAxisAlignment.spaceBetween,
-                    children: [
-                      Expanded(
-                        child: Text(
-                          '${LanguageManager.translate('Sipariş')} ${order['order_code']}',
-                          style: const TextStyle(
-                            fontSize: 18,
-                            fontWeight: FontWeight.bold,
+    // Liste sonuna yaklaşınca sonraki sayfa yüklenir
+    return NotificationListener<ScrollNotification>(
+      onNotification: (notification) {
+        if (notification.metrics.extentAfter < 300) {
+          _loadMoreOrders(tab);
+        }
+        return false;
+      },
+      child: RefreshIndicator(
+        onRefresh: _loadOrders,
+        child: ListView.builder(
+          padding: const EdgeInsets.all(16),
+          itemCount: orders.length,
+          itemBuilder: (context, index) {
+            final order = orders[index];
+            return Card(
+              margin: const EdgeInsets.only(bottom: 16),
+              elevation: 1,
+              shadowColor: Colors.black.withOpacity(0.08),
+              shape: RoundedRectangleBorder(
+                borderRadius: BorderRadius.circular(14),
+              ),
+              child: Padding(
+                padding: const EdgeInsets.all(16),
+                child: Column(
+                  crossAxisAlignment: CrossAxisAlignment.start,
+                  children: [
+                    // Sipariş başlığı
+                    Row(
+                      mainAxisAlignment: MainAxisAlignment.spaceBetween,
+                      children: [
+                        Expanded(
+                          child: Text(
+                            '${LanguageManager.translate('Sipariş')} ${order['order_code']}',
+                            style: const TextStyle(
+                              fontSize: 18,
+                              fontWeight: FontWeight.bold,
+                            ),
                           ),
                         ),
-                      ),
-                      Container(
-                        padding: const EdgeInsets.symmetric(
-                          horizontal: 8,
-                          vertical: 4,
+                        Container(
+                          padding: const EdgeInsets.symmetric(
+                            horizontal: 8,
+                            vertical: 4,
+                          ),
+                          decoration: BoxDecoration(
+                            color: _getStatusColor(order['status']).withOpacity(0.15),
+                            borderRadius: BorderRadius.circular(12),
+                          ),
+                          child: Text(
+                            _getStatusText(order['status']),
+                            style: const TextStyle(
+                              color: Colors.black87,
+                              fontSize: 12,
+                              fontWeight: FontWeight.bold,
+                            ),
+                          ),
                         ),
-                        decoration: BoxDecoration(
-                          color: _getStatusColor(order['status']).withOpacity(0.15),
-                          borderRadius: BorderRadius.circular(12),
+                      ],
+                    ),
+                    const SizedBox(height: 12),
+                    
+                    // Kullanıcı bilgileri
+                    if (order['user'] != null) ...[
+                      Text(
+                        LanguageManager.translate('Müşteri Bilgileri'),
+                        style: const TextStyle(
+                          fontSize: 16,
+                          fontWeight: FontWeight.bold,
                         ),
-                        child: Text(
-                          _getStatusText(order['status']),
-                          style: const TextStyle(
-                            color: Colors.black87,
-                            fontSize: 12,
-                            fontWeight: FontWeight.bold,
-                          ),
+                      ),
+                      const SizedBox(height: 8),
+                      Text(
+                        order['user']['name_surname'],
+                        style: const TextStyle(fontSize: 14),
+                      ),
+                      Text(
+                        order['user']['email'],
+                        style: const TextStyle(
+                          fontSize: 14,
+                          color: Colors.grey,
+                        ),
+                      ),
+                      Text(
+                        order['user']['phone_number'] ?? LanguageManager.translate('Telefon bilgisi yok'),
+                        style: const TextStyle(
+                          fontSize: 14,
+                          color: Colors.grey,
                         ),
                       ),
+                      const SizedBox(height: 12),
                     ],
-                  ),
-                  const SizedBox(height: 12),
-                  
-                  // Kullanıcı bilgileri
-                  if (order['user'] != null) ...[
-                    Text(
-                      LanguageManager.translate('Müşteri Bilgileri'),
-                      style: const TextStyle(
-                        fontSize: 16,
-                        fontWeight: FontWeight.bold,
+                    
+                    // Adres bilgileri
+                    if (order['address'] != null) ...[
+                      Text(
+                        LanguageManager.translate('Teslimat Adresi'),
+                        style: const TextStyle(
+                          fontSize: 16,
+                          fontWeight: FontWeight.bold,
+                        ),
                       ),
-                    ),
-                    const SizedBox(height: 8),
-                    Text(
-                      order['user']['name_surname'],
-                      style: const TextStyle(fontSize: 14),
-                    ),
-                    Text(
-                      order['user']['email'],
-                      style: const TextStyle(
-                        fontSize: 14,
-                        color: Colors.grey,
+                      const SizedBox(height: 8),
+                      Text(
+                        '${order['address']['city']}, ${order['address']['district']}',
+                        style: const TextStyle(fontSize: 14),
                       ),
-                    ),
-                    Text(
-                      order['user']['phone_number'] ?? LanguageManager.translate('Telefon bilgisi yok'),
-                      style: const TextStyle(
-                        fontSize: 14,
-                        color: Colors.grey,
+                      Text(
+                        '${order['address']['neighbourhood']}, ${order['address']['street_name']}',
+                        style: const TextStyle(fontSize: 14),
                       ),
-                    ),
-                    const SizedBox(height: 12),
-                  ],
-                  
-                  // Adres bilgileri
-                  if (order['address'] != null) ...[
-                    Text(
-                      LanguageManager.translate('Teslimat Adresi'),
-                      style: const TextStyle(
-                        fontSize: 16,
-                        fontWeight: FontWeight.bold,
+                      Text(
+                        '${LanguageManager.translate('Bina')}: ${order['address']['building_number']}, ${LanguageManager.translate('Daire')}: ${order['address']['apartment_number']}',
+                        style: const TextStyle(fontSize: 14),
                       ),
+                      const SizedBox(height: 12),
+                    ],
+                    
+                    // Sipariş tarihleri
+                    Row(
+                      children: [
+                        Expanded(
+                          child: Column(
+                            crossAxisAlignment: CrossAxisAlignment.start,
+                            children: [
+                              Text(
+                                LanguageManager.translate('Sipariş Tarihi'),
+                                style: const TextStyle(
+                                  fontSize: 12,
+                                  color: Colors.grey,
+                                ),
+                              ),
+                              Text(
+                                order['order_created_date'],
+                                style: const TextStyle(fontSize: 14),
+                              ),
+                            ],
+                          ),
+                        ),
+                        Expanded(
+                          child: Column(
+                            crossAxisAlignment: CrossAxisAlignment.start,
+                            children: [
+                              Text(
+                                LanguageManager.translate('Tahmini Teslimat'),
+                                style: const TextStyle(
+                                  fontSize: 12,
+                                  color: Colors.grey,
+                                ),
+                              ),
+                              Text(
+                                order['order_estimated_delivery'],
+                                style: const TextStyle(fontSize: 14),
+                              ),
+                            ],
+                          ),
+                        ),
+                      ],
                     ),
-                    const SizedBox(height: 8),
-                    Text(
-                      '${order['address']['city']}, ${order['address']['district']}',
-                      style: const TextStyle(fontSize: 14),
-                    ),
-                    Text(
-                      '${order['address']['neighbourhood']}, ${order['address']['street_name']}',
-                      style: const TextStyle(fontSize: 14),
-                    ),
-                    Text(
-                      '${LanguageManager.translate('Bina')}: ${order['address']['building_number']}, ${LanguageManager.translate('Daire')}: ${order['address']['apartment_number']}',
-                      style: const TextStyle(fontSize: 14),
-                    ),
-                    const SizedBox(height: 12),
-                  ],
-                  
-                  // Sipariş tarihleri
-                  Row(
-                    children: [
-                      Expanded(
+                    const SizedBox(height: 16),
+                    
+                    // Ürünler
+                    if (order['products'] != null && order['products'].isNotEmpty) ...[
+                      Text(
+                        LanguageManager.translate('Sipariş Edilen Ürünler'),
+                        style: const TextStyle(
+                          fontSize: 16,
+                          fontWeight: FontWeight.bold,
+                        ),
+                      ),
+                      const SizedBox(height: 8),
+                      ...order['products'].map<Widget>((product) => Container(
+                        margin: const EdgeInsets.only(bottom: 8),
+                        padding: const EdgeInsets.all(12),
+                        decoration: BoxDecoration(
+                          color: Colors.grey[100],
+                          borderRadius: BorderRadius.circular(8),
+                        ),
                         child: Column(
                           crossAxisAlignment: CrossAxisAlignment.start,
                           children: [
                             Text(
-                              LanguageManager.translate('Sipariş Tarihi'),
+                              product['product_name'],
                               style: const TextStyle(
-                                fontSize: 12,
-                                color: Colors.grey,
+                                fontSize: 14,
+                                fontWeight: FontWeight.bold,
                               ),
                             ),
+                            const SizedBox(height: 4),
                             Text(
-                              order['order_created_date'],
-                              style: const TextStyle(fontSize: 14),
+                              '${LanguageManager.translate('Adet')}: ${product['quantity']}',
+                              style: const TextStyle(fontSize: 12),
                             ),
-                          ],
-                        ),
-                      ),
-                      Expanded(
-                        child: Column(
-                          crossAxisAlignment: CrossAxisAlignment.start,
-                          children: [
                             Text(
-                              LanguageManager.translate('Tahmini Teslimat'),
+                              '${LanguageManager.translate('Fiyat')}: ${product['total_price'].toStringAsFixed(2)} TL',
                               style: const TextStyle(
                                 fontSize: 12,
-                                color: Colors.grey,
+                                fontWeight: FontWeight.bold,
+                                color: Colors.green,
                               ),
                             ),
-                            Text(
-                              order['order_estimated_delivery'],
-                              style: const TextStyle(fontSize: 14),
-                            ),
                           ],
                         ),
-                      ),
+                      )).toList(),
+                      const SizedBox(height: 16),
                     ],
-                  ),
-                  const SizedBox(height: 16),
-                  
-                  // Ürünler
-                  if (order['products'] != null && order['products'].isNotEmpty) ...[
-                    Text(
-                      LanguageManager.translate('Sipariş Edilen Ürünler'),
-                      style: const TextStyle(
-                        fontSize: 16,
-                        fontWeight: FontWeight.bold,
-                      ),
-                    ),
-                    const SizedBox(height: 8),
-                    ...order['products'].map<Widget>((product) => Container(
-                      margin: const EdgeInsets.only(bottom: 8),
-                      padding: const EdgeInsets.all(12),
-                      decoration: BoxDecoration(
-                        color: Colors.grey[100],
-                        borderRadius: BorderRadius.circular(8),
-                      ),
-                      child: Column(
-                        crossAxisAlignment: CrossAxisAlignment.start,
-                        children: [
-                          Text(
-                            product['product_name'],
-                            style: const TextStyle(
-                              fontSize: 14,
-                              fontWeight: FontWeight.bold,
-                            ),
-                          ),
-                          const SizedBox(height: 4),
-                          Text(
-                            '${LanguageManager.translate('Adet')}: ${product['quantity']}',
-                            style: const TextStyle(fontSize: 12),
-                          ),
-                          Text(
-                            '${LanguageManager.translate('Fiyat')}: ${product['total_price'].toStringAsFixed(2)} TL',
-                            style: const TextStyle(
-                              fontSize: 12,
-                              fontWeight: FontWeight.bold,
-                              color: Colors.green,
-                            ),
-                          ),
-                        ],
-                      ),
-                    )).toList(),
-                    const SizedBox(height: 16),
-                  ],
-                  
-                  // Durum güncelleme butonları (sadece aktif siparişler için)
-                  if (_tabController.index == 0) ...[
-                    if (order['status'] == 'pending') ...[
-                      Container(
-                        margin: const EdgeInsets.only(top: 16),
-                        child: Column(
-                          crossAxisAlignment: CrossAxisAlignment.start,
-                          children: [
-                            Text(
-                              LanguageManager.translate('Sipariş Durumu Güncelle'),
-                              style: const TextStyle(
-                                fontSize: 16,
-                                fontWeight: FontWeight.bold,
+                    
+                    // Durum güncelleme butonları (sadece aktif siparişler için)
+                    if (_tabController.index == 0) ...[
+                      if (order['status'] == 'pending') ...[
+                        Container(
+                          margin: const EdgeInsets.only(top: 16),
+                          child: Column(
+                            crossAxisAlignment: CrossAxisAlignment.start,
+                            children: [
+                              Text(
+                                LanguageManager.translate('Sipariş Durumu Güncelle'),
+                                style: const TextStyle(
+                                  fontSize: 16,
+                                  fontWeight: FontWeight.bold,
+                                ),
                               ),
-                            ),
-                            const SizedBox(height: 12),
-                            Row(
-                              children: [
-                                Expanded(
-                                  child: ElevatedButton.icon(
-                                    onPressed: () => _updateOrderStatus(
-                                      order['order_id'],
-                                      'processing',
-                                    ),
-                                    icon: const Icon(Icons.check_circle),
-                                    label: Text(LanguageManager.translate('Sipariş Alındı')),
-                                    style: ElevatedButton.styleFrom(
-                                      backgroundColor: Theme.of(context).colorScheme.primary,
-                                      foregroundColor: Colors.white,
-                                      padding: const EdgeInsets.symmetric(vertical: 12),
+                              const SizedBox(height: 12),
+                              Row(
+                                children: [
+                                  Expanded(
+                                    child: ElevatedButton.icon(
+                                      onPressed: () => _updateOrderStatus(
+                                        order['order_id'],
+                                        'processing',
+                                      ),
+                                      icon: const Icon(Icons.check_circle),
+                                      label: Text(LanguageManager.translate('Sipariş Alındı')),
+                                      style: ElevatedButton.styleFrom(
+                                        backgroundColor: Theme.of(context).colorScheme.primary,
+                                        foregroundColor: Colors.white,
+                                        padding: const EdgeInsets.symmetric(vertical: 12),
+                                      ),
                                     ),
                                   ),
-                                ),
-                                const SizedBox(width: 8),
-                                Expanded(
-                                  child: ElevatedButton.icon(
-                                    onPressed: () => _updateOrderStatus(
-                                      order['order_id'],
-                                      'cancelled',
-                                    ),
-                                    icon: const Icon(Icons.cancel),
-                                    label: Text(LanguageManager.translate('İptal Et')),
-                                    style: ElevatedButton.styleFrom(
-                                      backgroundColor: Theme.of(context).colorScheme.error,
-                                      foregroundColor: Colors.white,
-                                      padding: const EdgeInsets.symmetric(vertical: 12),
+                                  const SizedBox(width: 8),
+                                  Expanded(
+                                    child: ElevatedButton.icon(
+                                      onPressed: () => _updateOrderStatus(
+                                        order['order_id'],
+                                        'cancelled',
+                                      ),
+                                      icon: const Icon(Icons.cancel),
+                                      label: Text(LanguageManager.translate('İptal Et')),
+                                      style: ElevatedButton.styleFrom(
+                                        backgroundColor: Theme.of(context).colorScheme.error,
+                                        foregroundColor: Colors.white,
+                                        padding: const EdgeInsets.symmetric(vertical: 12),
+                                      ),
                                     ),
                                   ),
-                                ),
-                              ],
-                            ),
-                          ],
+                                ],
+                              ),
+                            ],
+                          ),
                         ),
-                      ),
-                    ] else if (order['status'] == 'processing') ...[
-                      Container(
-                        margin: const EdgeInsets.only(top: 16),
-                        child: Column(
-                          crossAxisAlignment: CrossAxisAlignment.start,
-                          children: [
-                            const Text(
-                              'Sipariş Durumu Güncelle',
-                              style: TextStyle(
-                                fontSize: 16,
-                                fontWeight: FontWeight.bold,
+                      ] else if (order['status'] == 'processing') ...[
+                        Container(
+                          margin: const EdgeInsets.only(top: 16),
+                          child: Column(
+                            crossAxisAlignment: CrossAxisAlignment.start,
+                            children: [
+                              const Text(
+                                'Sipariş Durumu Güncelle',
+                                style: TextStyle(
+                                  fontSize: 16,
+                                  fontWeight: FontWeight.bold,
+                                ),
                               ),
-                            ),
-                            const SizedBox(height: 12),
-                            Row(
-                              children: [
-                                Expanded(
-                                  child: ElevatedButton.icon(
-                                    onPressed: () => _updateOrderStatus(
-                                      order['order_id'],
-                                      'shipped',
-                                    ),
-                                    icon: const Icon(Icons.local_shipping),
-                                    label: Text(LanguageManager.translate('Kargoya Verildi')),
-                                    style: ElevatedButton.styleFrom(
-                                      backgroundColor: Colors.deepPurple,
-                                      foregroundColor: Colors.white,
-                                      padding: const EdgeInsets.symmetric(vertical: 12),
+                              const SizedBox(height: 12),
+                              Row(
+                                children: [
+                                  Expanded(
+                                    child: ElevatedButton.icon(
+                                      onPressed: () => _updateOrderStatus(
+                                        order['order_id'],
+                                        'shipped',
+                                      ),
+                                      icon: const Icon(Icons.local_shipping),
+                                      label: Text(LanguageManager.translate('Kargoya Verildi')),
+                                      style: ElevatedButton.styleFrom(
+                                        backgroundColor: Colors.deepPurple,
+                                        foregroundColor: Colors.white,
+                                        padding: const EdgeInsets.symmetric(vertical: 12),
+                                      ),
                                     ),
                                   ),
-                                ),
-                              ],
-                            ),
-                          ],
+                                ],
+                              ),
+                            ],
+                          ),
                         ),
-                      ),
-                    ] else if (order['status'] == 'shipped') ...[
-                      Container(
-                        margin: const EdgeInsets.only(top: 16),
-                        child: Column(
-                          crossAxisAlignment: CrossAxisAlignment.start,
-                          children: [
-                            Text(
-                              LanguageManager.translate('Sipariş Durumu Güncelle'),
-                              style: const TextStyle(
-                                fontSize: 16,
-                                fontWeight: FontWeight.bold,
+                      ] else if (order['status'] == 'shipped') ...[
+                        Container(
+                          margin: const EdgeInsets.only(top: 16),
+                          child: Column(
+                            crossAxisAlignment: CrossAxisAlignment.start,
+                            children: [
+                              Text(
+                                LanguageManager.translate('Sipariş Durumu Güncelle'),
+                                style: const TextStyle(
+                                  fontSize: 16,
+                                  fontWeight: FontWeight.bold,
+                                ),
                               ),
-                            ),
-                            const SizedBox(height: 12),
-                            Row(
-                              children: [
-                                Expanded(
-                                  child: ElevatedButton.icon(
-                                    onPressed: () => _updateOrderStatus(
-                                      order['order_id'],
-                                      'delivered',
-                                    ),
-                                    icon: const Icon(Icons.done_all),
-                                    label: Text(LanguageManager.translate('Teslim Edildi')),
-                                    style: ElevatedButton.styleFrom(
-                                      backgroundColor: Colors.green,
-                                      foregroundColor: Colors.white,
-                                      padding: const EdgeInsets.symmetric(vertical: 12),
+                              const SizedBox(height: 12),
+                              Row(
+                                children: [
+                                  Expanded(
+                                    child: ElevatedButton.icon(
+                                      onPressed: () => _updateOrderStatus(
+                                        order['order_id'],
+                                        'delivered',
+                                      ),
+                                      icon: const Icon(Icons.done_all),
+                                      label: Text(LanguageManager.translate('Teslim Edildi')),
+                                      style: ElevatedButton.styleFrom(
+                                        backgroundColor: Colors.green,
+                                        foregroundColor: Colors.white,
+                                        padding: const EdgeInsets.symmetric(vertical: 12),
+                                      ),
                                     ),
                                   ),
-                                ),
-                              ],
-                            ),
-                          ],
+                                ],
+                              ),
+                            ],
+                          ),
                         ),
-                      ),
+                      ],
                     ],
                   ],
-                ],
+                ),
               ),
-            ),
-          );
-        },
+            );
+          },
+        ),
       ),
     );
   }
@@ -40,12 +40,9 @@ class _SellerProductsPageState extends State<SellerProductsPage> {
 
   Future<void> fetchSellerProducts() async {
     try {
-      final list = await ApiService.fetchProducts();
+      final list = await ApiService.fetchSellerProducts(widget.seller.id);
       setState(() {
-        products = list
-            .map((e) => Product.fromMap(e))
-            .where((product) => product.sellerId == widget.seller.id)
-            .toList();
+        products = list.map((e) => Product.fromMap(e)).toList();
         isLoading = false;
       });
     } catch (e) {
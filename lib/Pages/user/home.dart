@@ -27,6 +27,11 @@ class _HomePageState extends State<HomePage> {
   final TextEditingController _searchController = TextEditingController();
   List<Product> _products = [];
   List<Product> _filteredProducts = [];
+  // Ürünler sayfa sayfa yüklenir; liste sonuna yaklaşınca sonraki sayfa istenir
+  final ScrollController _scrollController = ScrollController();
+  String? _nextCursor;
+  bool _isLoadingMore = false;
+  int _loadGeneration = 0;
   int _selectedIndex = 0;
   String? _selectedCategory;
 
@@ -51,6 +56,7 @@ class _HomePageState extends State<HomePage> {
   void initState() {
     super.initState();
     CartManager.loadCart();
+    _scrollController.addListener(_onScroll);
     _loadProducts();
     if (widget.selectedIndex != null) {
       _selectedIndex = widget.selectedIndex!;
@@ -90,12 +96,48 @@ class _HomePageState extends State<HomePage> {
     }
   }
 
+  // Seçili kategorinin çevrilmemiş adı (sunucu filtresi için)
+  String? get _selectedOriginalCategory {
+    if (_selectedCategory == null) return null;
+    for (final cat in ['Kıyafet', 'Elektronik', 'Kozmetik', 'Mobilya', 'Spor', 'Oyuncak']) {
+      if (LanguageManager.translate(cat) == _selectedCategory) return cat;
+    }
+    return null;
+  }
+
   Future<void> _loadProducts() async {
-    final products = await ApiService.fetchProducts();
+    // Kategori değişince baştan yüklenir; eski isteğin cevabı yok sayılır
+    final generation = ++_loadGeneration;
+    final page = await ApiService.fetchProducts(category: _selectedOriginalCategory);
+    if (!mounted || generation != _loadGeneration) return;
     setState(() {
-      _products = products.map((e) => Product.fromMap(e)).toList();
-      _filteredProducts = _products;
+      _products = page.items.map((e) => Product.fromMap(e)).toList();
+      _nextCursor = page.nextCursor;
     });
+    _filterProducts(_searchController.text);
+  }
+
+  Future<void> _loadMoreProducts() async {
+    if (_isLoadingMore || _nextCursor == null) return;
+    final generation = _loadGeneration;
+    _isLoadingMore = true;
+    try {
+      final page = await ApiService.fetchProducts(cursor: _nextCursor, category: _selectedOriginalCategory);
+      if (!mounted || generation != _loadGeneration) return;
+      setState(() {
+        _products.addAll(page.items.map((e) => Product.fromMap(e)));
+        _nextCursor = page.nextCursor;
+      });
+      _filterProducts(_searchController.text);
+    } finally {
+      _isLoadingMore = false;
+    }
+  }
+
+  void _onScroll() {
+    if (_scrollController.position.extentAfter < 500) {
+      _loadMoreProducts();
+    }
   }
 
   void _filterProducts(String query) {
@@ -148,6 +190,7 @@ class _HomePageState extends State<HomePage> {
       _selectedCategory = category;
       _filterProducts(_searchController.text);
     });
+    _loadProducts();
   }
 
   void _onItemTapped(int index) {
@@ -516,6 +559,7 @@ class _HomePageState extends State<HomePage> {
                   ),
                 )
               : GridView.builder(
+                  controller: _scrollController,
                   padding: const EdgeInsets.all(16),
                   gridDelegate: const SliverGridDelegateWithFixedCrossAxisCount(
                     crossAxisCount: 2,
@@ -540,6 +584,7 @@ class _HomePageState extends State<HomePage> {
   @override
   void dispose() {
     _searchController.dispose();
+    _scrollController.dispose();
     super.dispose();
   }
 }
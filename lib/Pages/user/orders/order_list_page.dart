@@ -34,7 +34,14 @@ class _OrderListPageState extends State<OrderListPage> {
   }
 
   Future<List<Product>> _getProducts(int orderId) async {
-    final products = await ApiService.fetchProducts();
+    // Siparişteki ürün id'leri users_order kayıtlarından alınır, ürünler id ile istenir
+    final usersOrders = await ApiService.fetchUsersOrders();
+    final productIds = usersOrders
+      .where((uo) => uo['order_id'] == orderId)
+      .map<int>((uo) => uo['product_id'] as int)
+      .toSet()
+      .toList();
+    final products = await ApiService.fetchProductsByIds(productIds);
     return products.map((e) => Product.fromMap(e)).toList();
   }
 
@@ -59,11 +59,8 @@ class _OrdersPageState extends State<OrdersPage> with SingleTickerProviderStateM
   Future<List<Product>> _getProducts(int? orderId) async {
     if (Session.currentUser == null) return [];
     final productIds = await ApiService.fetchUserOrderProductIds(orderId, Session.currentUser!.id);
-    final allProducts = await ApiService.fetchProducts();
-    return allProducts
-      .map((e) => Product.fromMap(e))
-      .where((p) => productIds.contains(int.tryParse(p.id) ?? -1))
-      .toList();
+    final products = await ApiService.fetchProductsByIds(productIds.toSet().toList());
+    return products.map((e) => Product.fromMap(e)).toList();
   }
 
   // Aktif siparişleri getir (teslim edilmemiş ve iptal edilmemiş)
@@ -49,10 +49,12 @@ class _FavoritesPageState extends State<FavoritesPage> {
   Future<void> _loadFavorites() async {
     final user = Session.currentUser;
     final favoriteIds = await FavoritesManager.getFavorites(user?.email);
-    final allProducts = await ApiService.fetchProducts();
+    // Sadece favori ürünler id ile istenir (tüm katalog indirilmez)
+    final ids = favoriteIds.map(int.tryParse).whereType<int>().toList();
+    final favoriteProducts = await ApiService.fetchProductsByIds(ids);
     await CartManager.loadCart(); // Sepet verilerini yükle
     setState(() {
-      _favoriteProducts = allProducts.map((e) => Product.fromMap(e)).where((p) => favoriteIds.contains(p.id)).toList();
+      _favoriteProducts = favoriteProducts.map((e) => Product.fromMap(e)).toList();
       _isLoading = false;
     });
   }
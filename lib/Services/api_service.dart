@@ -3,17 +3,48 @@ import 'dart:convert';
 import '../Models/session.dart';
 import '../Utils/app_config.dart';
 
+// Keyset sayfalı endpoint'lerden dönen tek sayfa (sonraki sayfa X-Next-Cursor header'ından)
+class PageResult {
+  final List<dynamic> items;
+  final String? nextCursor;
+
+  const PageResult(this.items, this.nextCursor);
+
+  bool get hasMore => nextCursor != null;
+}
+
 class ApiService {
   static String get baseUrl => AppConfig.baseUrl;
 
   // --- PRODUCT CRUD ---
-  static Future<List<dynamic>> fetchProducts() async {
-    final response = await http.get(Uri.parse('$baseUrl/products'));
-    if (response.statusCode == 200) {
-      return jsonDecode(response.body);
-    } else {
+  static Future<PageResult> fetchProducts({String? cursor, String? category, int limit = 50}) async {
+    // /products sayfalıdır; tek sayfa döner, sonraki sayfa için nextCursor kullanılır
+    final query = {
+      'limit': '$limit',
+      if (cursor != null) 'cursor': cursor,
+      if (category != null) 'product_category': category,
+    };
+    final response = await http.get(
+      Uri.parse('$baseUrl/products').replace(queryParameters: query),
+    );
+    if (response.statusCode != 200) {
       throw Exception('Ürünler alınamadı');
     }
+    return PageResult(jsonDecode(response.body), response.headers['x-next-cursor']);
+  }
+
+  static Future<List<dynamic>> fetchProductsByIds(List<int> ids) async {
+    // Sepet ve favoriler için tek istek; istek sırası korunur, silinmiş ürünler atlanır
+    if (ids.isEmpty) return [];
+    final response = await http.post(
+      Uri.parse('$baseUrl/products/batch'),
+      headers: {'Content-Type': 'application/json'},
+      body: jsonEncode({'ids': ids}),
+    );
+    if (response.statusCode != 200) {
+      throw Exception('Ürünler alınamadı');
+    }
+    return jsonDecode(response.body)['products'];
   }
 
   static Future<void> addProduct(Map<String, dynamic> data) async {
@@ -801,23 +832,30 @@ class ApiService {
   }
 
   // --- SELLER ORDERS ---
-  static Future<List<dynamic>> fetchSellerOrders(int sellerId) async {
+  static Future<PageResult> fetchSellerOrders(int sellerId, {String? cursor, List<String>? statuses, List<String>? excludedStatuses, int limit = 50}) async {
     try {
       print('=== FETCH SELLER ORDERS START ===');
       print('Fetching orders for seller ID: $sellerId');
       
-      final response = await http.get(Uri.parse('$baseUrl/seller_orders/$sellerId'));
+      // /seller_orders sayfalıdır; tek sayfa döner, sonraki sayfa için nextCursor kullanılır
+      final query = <String, dynamic>{
+        'limit': '$limit',
+        if (cursor != null) 'cursor': cursor,
+        if (statuses != null) 'status': statuses,
+        if (excludedStatuses != null) 'exclude_status': excludedStatuses,
+      };
+      final response = await http.get(
+        Uri.parse('$baseUrl/seller_orders/$sellerId').replace(queryParameters: query),
+      );
       print('Response status: ${response.statusCode}');
-      print('Response body: ${response.body}');
       
       if (response.statusCode != 200) {
         throw Exception('Satıcı siparişleri alınamadı');
       }
       
       final orders = jsonDecode(response.body) as List;
-      print('Seller orders: $orders');
       print('=== FETCH SELLER ORDERS SUCCESS ===');
-      return orders;
+      return PageResult(orders, response.headers['x-next-cursor']);
     } catch (e) {
       print('=== FETCH SELLER ORDERS ERROR ===');
       print('Error fetching seller orders: $e');
@@ -876,23 +914,25 @@ class ApiService {
   }
 
   // --- SELLER ACTIVE ORDERS ---
-  static Future<List<dynamic>> fetchSellerActiveOrders(int sellerId) async {
+  static Future<PageResult> fetchSellerActiveOrders(int sellerId, {String? cursor, int limit = 20}) async {
     try {
       print('=== FETCH SELLER ACTIVE ORDERS START ===');
       print('Fetching active orders for seller ID: $sellerId');
       
-      final response = await http.get(Uri.parse('$baseUrl/seller_active_orders/$sellerId'));
+      // /seller_active_orders sayfalıdır; tek sayfa döner, sonraki sayfa için nextCursor kullanılır
+      final query = {'limit': '$limit', if (cursor != null) 'cursor': cursor};
+      final response = await http.get(
+        Uri.parse('$baseUrl/seller_active_orders/$sellerId').replace(queryParameters: query),
+      );
       print('Response status: ${response.statusCode}');
-      print('Response body: ${response.body}');
       
       if (response.statusCode != 200) {
         throw Exception('Satıcı aktif siparişleri alınamadı');
       }
       
       final orders = jsonDecode(response.body) as List;
-      print('Seller active orders: $orders');
       print('=== FETCH SELLER ACTIVE ORDERS SUCCESS ===');
-      return orders;
+      return PageResult(orders, response.headers['x-next-cursor']);
     } catch (e) {
       print('=== FETCH SELLER ACTIVE ORDERS ERROR ===');
       print('Error fetching seller active orders: $e');
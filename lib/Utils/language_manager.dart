@@ -219,6 +219,7 @@ class LanguageManager {
       'Hızlı İstatistikler': 'Hızlı İstatistikler',
       'Sipariş Durumları': 'Sipariş Durumları',
       'Aktif Siparişler': 'Aktif Siparişler',
+      'Daha fazla göster': 'Daha fazla göster',
       'Öne Çıkanlar': 'Öne Çıkanlar',
       'Hesap Bilgilerim': 'Hesap Bilgilerim',
       'Değerlendirmeler': 'Değerlendirmeler',
@@ -666,6 +667,7 @@ class LanguageManager {
       'Hızlı İstatistikler': 'Quick Statistics',
       'Sipariş Durumları': 'Order Status',
       'Aktif Siparişler': 'Active Orders',
+      'Daha fazla göster': 'Show more',
       'Öne Çıkanlar': 'Highlights',
       'Hesap Bilgilerim': 'My Account Info',
       'Değerlendirmeler': 'Reviews',
@@ -1029,6 +1031,7 @@ class LanguageManager {
       'Hızlı İstatistikler': 'إحصائيات سريعة',
       'Sipariş Durumları': 'حالات الطلبات',
       'Aktif Siparişler': 'الطلبات النشطة',
+      'Daha fazla göster': 'عرض المزيد',
       'Öne Çıkanlar': 'المميزات',
       'Hesap Bilgilerim': 'معلومات حسابي',
       'Değerlendirmeler': 'التقييمات',